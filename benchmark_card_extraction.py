@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark homepage card extraction: per-element WebDriver calls vs. one execute_script.
+
+Loads a saved page (producthunt_page_source.html by default) from disk and times both
+extraction paths of ProductHuntScraper, counting chromedriver round trips for each.
+The saved capture contains no product cards, so --cards N injects N synthetic cards
+that use the same data-test selectors as the live homepage.
+
+Usage: python benchmark_card_extraction.py [--html FILE] [--cards N]
+"""
+
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+from selenium.webdriver.common.by import By
+from producthunt_scraper import ProductHuntScraper
+from page_scripts import EXTRACT_CARDS_JS
+
+INJECT_CARDS_JS = r"""
+const count = arguments[0];
+const container = document.createElement('div');
+for (let i = 1; i <= count; i++) {
+    const section = document.createElement('section');
+    section.setAttribute('data-test', 'post-item-' + (100000 + i));
+    section.innerHTML =
+        '<img src="https://ph-files.imgix.net/thumb-' + i + '.png">' +
+        '<a data-test="post-name-' + (100000 + i) + '" href="/posts/product-' + i + '">' + i + '. Product ' + i + '</a>' +
+        '<a href="/products/product-' + i + '">Tagline for product ' + i + '</a>' +
+        '<div data-sentry-component="TagList"><a href="/topics/ai">AI</a><a href="/topics/productivity">Productivity</a></div>' +
+        '<button data-test="vote-button"><p>' + (i * 7) + '</p></button>';
+    container.appendChild(section);
+}
+document.body.appendChild(container);
+"""
+
+
+def count_round_trips(driver):
+    """Wrap driver.execute so every chromedriver command is counted"""
+    counter = {"calls": 0}
+    original = driver.execute
+
+    def counting_execute(*args, **kwargs):
+        counter["calls"] += 1
+        return original(*args, **kwargs)
+
+    driver.execute = counting_execute
+    return counter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark product card extraction")
+    parser.add_argument("--html", default="producthunt_page_source.html", help="Saved page to load")
+    parser.add_argument("--cards", type=int, default=300, help="Synthetic cards to inject (0 to use the page as-is)")
+    args = parser.parse_args()
+
+    html_path = Path(args.html).resolve()
+    if not html_path.exists():
+        print(f"✗ {html_path} not found")
+        sys.exit(1)
+
+    scraper = ProductHuntScraper(headless=True)
+    try:
+        driver = scraper.driver
+        driver.implicitly_wait(0)  # Keep the comparison about round trips, not absent-element waits
+        driver.get(html_path.as_uri())
+        if args.cards:
+            driver.execute_script(INJECT_CARDS_JS, args.cards)
+        counter = count_round_trips(driver)
+
+        print(f"Page: {html_path.name}")
+        print("=" * 40)
+
+        counter["calls"] = 0
+        start = time.perf_counter()
+        elements = driver.find_elements(By.CSS_SELECTOR, "section[data-test^='post-item-']")
+        per_element = [scraper._extract_product_data_new(el) for el in elements]
+        per_element_time = time.perf_counter() - start
+        per_element_calls = counter["calls"]
+        print(f"Per-element: {len(per_element)} cards in {per_element_time:.2f}s, {per_element_calls} round trips")
+
+        counter["calls"] = 0
+        start = time.perf_counter()
+        cards = json.loads(driver.execute_script(EXTRACT_CARDS_JS))
+        scraped_at = datetime.now()
+        bulk = [scraper._card_to_product(card, scraped_at) for card in cards]
+        bulk_time = time.perf_counter() - start
+        bulk_calls = counter["calls"]
+        print(f"Bulk script: {len(bulk)} cards in {bulk_time:.2f}s, {bulk_calls} round trips")
+
+        mismatches = 0
+        for a, b in zip(per_element, bulk):
+            if a and any(a[k] != b[k] for k in ("name", "url", "post_id", "tagline", "image_url", "topics", "upvotes")):
+                mismatches += 1
+        print(f"Field mismatches between paths: {mismatches}")
+        if bulk_time > 0:
+            print(f"Speedup: {per_element_time / bulk_time:.1f}x")
+    finally:
+        scraper.close()
+
+
+if __name__ == "__main__":
+    main()
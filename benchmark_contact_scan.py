@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark email/social extraction: regex over the whole HTML vs. the streaming ContactScanner.
+
+Pages are local files or http(s) URLs given on the command line (fetched once up front).
+Without arguments it uses producthunt_page_source.html, plus a copy padded with a 3MB
+inline script bundle full of asset names and a Sentry DSN, a footer of social links and
+an obfuscated email, which is the shape of a heavy maker website.
+
+For each page it reports the time and characters each approach reads, the first email
+the old regex picks and what the scanner finds.
+
+Usage: python benchmark_contact_scan.py [FILE_OR_URL ...] [--repeat N]
+"""
+
+import re
+import time
+import argparse
+from pathlib import Path
+from contact_scanner import scan_html
+from http_fetcher import HttpFetcher
+
+LEGACY_EMAIL_RE = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
+
+BUNDLE_LINE = ('var icons={logo:"/static/logo@2x.png",hero:"/img/hero@3x.webp"};'
+               'Sentry.init({dsn:"https://0123456789abcdef0123456789abcdef@o123456.ingest.sentry.io/42"});\n')
+FOOTER = ('<footer><a href="https://x.com/orbitnotes">X</a><a href="https://www.linkedin.com/company/orbit-notes">LinkedIn</a>'
+          '<a href="https://www.instagram.com/orbitnotes">Instagram</a><a href="https://github.com/orbit-notes">GitHub</a>'
+          '<p>Say hi: team [at] orbitnotes [dot] io</p></footer>')
+
+
+def heavy_page(html):
+    """The given page with a multi-megabyte inline bundle in <head> and a contact footer"""
+    bundle = "<script>" + BUNDLE_LINE * (3 * 1024 * 1024 // len(BUNDLE_LINE)) + "</script>"
+    return html.replace("</head>", bundle + "</head>", 1).replace("</body>", FOOTER + "</body>", 1)
+
+
+def load_pages(sources):
+    """(name, html) for each file or URL"""
+    pages = []
+    fetcher = HttpFetcher(max_bytes=8 * 1024 * 1024)
+    for source in sources:
+        if source.startswith(("http://", "https://")):
+            page = fetcher.fetch(source)
+            if page and page["html"]:
+                pages.append((source, page["html"]))
+            else:
+                print(f"✗ Could not fetch {source}")
+        else:
+            pages.append((Path(source).name, Path(source).read_text(encoding="utf-8", errors="replace")))
+    fetcher.close()
+    return pages
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark contact extraction on large pages")
+    parser.add_argument("sources", nargs="*", help="HTML files or URLs")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per page, averaged")
+    args = parser.parse_args()
+
+    if args.sources:
+        pages = load_pages(args.sources)
+    else:
+        saved = Path("producthunt_page_source.html").read_text(encoding="utf-8")
+        pages = [("producthunt_page_source.html", saved), ("heavy maker page (synthetic)", heavy_page(saved))]
+
+    for name, html in pages:
+        print(f"{name}: {len(html) / 1e6:.2f}M chars")
+        match, legacy_time = timed(lambda: LEGACY_EMAIL_RE.search(html), args.repeat)
+        print(f"  Regex over full HTML: {legacy_time * 1000:.1f}ms, email {match.group(0) if match else '-'!r}")
+        scanner, scan_time = timed(lambda: scan_html(html), args.repeat)
+        print(f"  Streaming scan: {scan_time * 1000:.1f}ms over {scanner.chars_fed / 1e6:.2f}M chars, "
+              f"email {scanner.links.get('email', '-')!r}, {len(scanner.links)} fields")
+        scanner, email_time = timed(lambda: scan_html(html, fields=["email"]), args.repeat)
+        print(f"  Streaming scan, email only: {email_time * 1000:.1f}ms over {scanner.chars_fed / 1e6:.2f}M chars")
+
+
+if __name__ == "__main__":
+    main()
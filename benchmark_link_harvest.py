@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark link harvesting: per-anchor WebDriver calls plus page_source vs. one execute_script.
+
+Loads a saved page (producthunt_page_source.html by default) from disk, injects --links N
+synthetic anchors (social profiles, mailto links and plain links, like a maker website
+footer) and times both ways of collecting hrefs and the text searched for emails,
+counting chromedriver round trips for each.
+
+Usage: python benchmark_link_harvest.py [--html FILE] [--links N]
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from selenium.webdriver.common.by import By
+from producthunt_scraper import ProductHuntScraper
+from page_scripts import HARVEST_LINKS_JS, HARVEST_TEXT_LIMIT
+from benchmark_card_extraction import count_round_trips
+
+INJECT_LINKS_JS = r"""
+const count = arguments[0];
+const footer = document.createElement('footer');
+const targets = ['https://x.com/maker', 'https://www.linkedin.com/company/maker', 'https://www.instagram.com/maker',
+                 'mailto:hello@maker.example', 'https://maker.example/pricing'];
+for (let i = 0; i < count; i++) {
+    const a = document.createElement('a');
+    a.href = targets[i % targets.length] + (i >= targets.length ? '?n=' + i : '');
+    a.textContent = 'Link ' + i;
+    footer.appendChild(a);
+}
+document.body.appendChild(footer);
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark anchor harvesting round trips")
+    parser.add_argument("--html", default="producthunt_page_source.html", help="Saved page to load")
+    parser.add_argument("--links", type=int, default=200, help="Synthetic anchors to inject (0 to use the page as-is)")
+    args = parser.parse_args()
+
+    html_path = Path(args.html).resolve()
+    if not html_path.exists():
+        print(f"✗ {html_path} not found")
+        sys.exit(1)
+
+    scraper = ProductHuntScraper(headless=True)
+    try:
+        driver = scraper.driver
+        driver.get(html_path.as_uri())
+        if args.links:
+            driver.execute_script(INJECT_LINKS_JS, args.links)
+        counter = count_round_trips(driver)
+
+        print(f"Page: {html_path.name}")
+        print("=" * 40)
+
+        counter["calls"] = 0
+        start = time.perf_counter()
+        hrefs = [a.get_attribute("href") for a in driver.find_elements(By.CSS_SELECTOR, "a[href]")]
+        page_text = driver.page_source
+        per_anchor_time = time.perf_counter() - start
+        per_anchor_calls = counter["calls"]
+        print(f"Per-anchor: {len(hrefs)} hrefs, {len(page_text)} chars in {per_anchor_time:.2f}s, {per_anchor_calls} round trips")
+
+        counter["calls"] = 0
+        start = time.perf_counter()
+        links = json.loads(driver.execute_script(HARVEST_LINKS_JS, HARVEST_TEXT_LIMIT))
+        harvest_time = time.perf_counter() - start
+        harvest_calls = counter["calls"]
+        print(f"Harvest script: {len(links['hrefs'])} unique hrefs, "
+              f"{len(links['text'])} chars in {harvest_time:.2f}s, {harvest_calls} round trips")
+
+        missing = set(h for h in hrefs if h) - set(links["hrefs"])
+        print(f"Hrefs missed by the harvest script: {len(missing)}")
+        if harvest_time > 0:
+            print(f"Speedup: {per_anchor_time / harvest_time:.1f}x")
+    finally:
+        scraper.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark Chrome profile reuse: first-page latency and challenge rate of freshly launched drivers.
+
+Launches --launches drivers one after another on temporary profiles, then the same number
+on a persistent profile (the first launch warms it), loading --url as each driver's first
+page. Challenges are detected from the page title, as in the scraper.
+
+Usage: python benchmark_profile_reuse.py [--url URL] [--launches N] [--profile-dir DIR]
+"""
+
+import time
+import shutil
+import tempfile
+import argparse
+import undetected_chromedriver as uc
+from browser_pool import build_chrome_options
+from concurrency import block_signal
+from profile_pool import ProfilePool
+
+
+def first_page(url, profile=None):
+    """Launch a driver, load url and return (seconds, challenge reason)"""
+    driver = uc.Chrome(options=build_chrome_options(True), headless=True, user_data_dir=profile)
+    try:
+        driver.set_page_load_timeout(60)
+        start = time.perf_counter()
+        driver.get(url)
+        return time.perf_counter() - start, block_signal(title=driver.title)
+    finally:
+        driver.quit()
+
+
+def report(label, samples):
+    challenged = sum(1 for _, reason in samples if reason)
+    mean = sum(seconds for seconds, _ in samples) / len(samples)
+    print(f"{label}: {len(samples)} launches, mean first page {mean:.2f}s, challenge rate {challenged / len(samples):.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark persistent Chrome profile reuse")
+    parser.add_argument("--url", default="https://www.producthunt.com/", help="First page to load")
+    parser.add_argument("--launches", type=int, default=3, help="Driver launches per mode")
+    parser.add_argument("--profile-dir", default=None, help="Persistent profile root (default: a temp dir removed afterwards)")
+    args = parser.parse_args()
+
+    root = args.profile_dir or tempfile.mkdtemp(prefix="ph_profiles_")
+    profiles = ProfilePool(root, size=1)
+    print(f"URL: {args.url}")
+    print("=" * 40)
+    try:
+        fresh = [first_page(args.url) for _ in range(args.launches)]
+        report("Fresh profile", fresh)
+
+        reused = []
+        for _ in range(args.launches):
+            path, was_reused = profiles.acquire()
+            try:
+                reused.append((was_reused, first_page(args.url, path)))
+            finally:
+                profiles.release(path)
+        warmup = [sample for was_reused, sample in reused if not was_reused]
+        if warmup:
+            report("Persistent profile, first launch", warmup)
+        warm = [sample for was_reused, sample in reused if was_reused]
+        if warm:
+            report("Persistent profile, reused", warm)
+    finally:
+        if not args.profile_dir:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
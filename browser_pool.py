@@ -0,0 +1,258 @@
+import time
+import json
+import logging
+import threading
+from contextlib import contextmanager
+import undetected_chromedriver as uc
+from concurrency import block_signal
+from page_scripts import RESOURCE_BYTES_JS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+
+def build_chrome_options(headless=True, disk_cache_dir=None):
+    """Build the Chrome options used for product page and website visits"""
+    chrome_options = uc.ChromeOptions()
+    if headless:
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"--user-agent={DEFAULT_USER_AGENT}")
+    if disk_cache_dir:
+        # Persistent HTTP cache, so Product Hunt's JS/CSS bundles survive driver restarts
+        chrome_options.add_argument(f"--disk-cache-dir={disk_cache_dir}")
+    # CDP network events for readiness waits (WaitPolicy.wait_for_network_idle)
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return chrome_options
+
+
+class TransferStats:
+    """Bytes fetched over the network vs. served from the HTTP cache, summed over sampled pages"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.totals = {"pages": 0, "network": 0, "network_bytes": 0, "cache": 0, "cache_bytes": 0, "opaque": 0}
+
+    def sample(self, driver):
+        """Add the resources of the driver's current page"""
+        try:
+            page = json.loads(driver.execute_script(RESOURCE_BYTES_JS))
+        except Exception as e:
+            logger.debug(f"Could not read resource timing: {e}")
+            return
+        with self._lock:
+            self.totals["pages"] += 1
+            for key, value in page.items():
+                self.totals[key] += value
+
+    def log_summary(self):
+        """Log network vs. cache transfer for the run"""
+        t = self.totals
+        if not t["pages"]:
+            return
+        total = t["network_bytes"] + t["cache_bytes"]
+        logger.info(f"Browser transfer over {t['pages']} pages: {t['network_bytes'] / 1e6:.1f}MB from network ({t['network']} responses), "
+                    f"{t['cache_bytes'] / 1e6:.1f}MB from cache ({t['cache']} responses, {t['cache_bytes'] / (total or 1):.0%} of bytes), "
+                    f"{t['opaque']} cross-origin responses without timing data")
+
+
+class BrowserPool:
+    """Pool of warm undetected Chrome drivers that are leased out for page visits.
+
+    Drivers are launched lazily up to `size`, health-checked before each lease and
+    reset (extra tabs, cookies, storage) when returned. A driver is recycled after
+    `max_uses` leases so long runs do not accumulate Chrome memory. With a ProfilePool,
+    drivers launch on persistent profiles and keep their cookies across leases; with
+    cache slots (a ProfilePool of cache directories) each driver gets a persistent disk cache.
+    `driver_factory` is called like uc.Chrome to start a driver.
+    """
+
+    def __init__(self, size=1, headless=True, max_uses=50, lease_timeout=600, page_load_timeout=60,
+                 profiles=None, first_page_stats=None, cache_slots=None, transfer_stats=None, resource_policy=None,
+                 driver_factory=None):
+        self.size = max(1, int(size))
+        self.headless = headless
+        self.max_uses = max_uses
+        self.lease_timeout = lease_timeout
+        self.page_load_timeout = page_load_timeout
+        self.profiles = profiles
+        self.first_page_stats = first_page_stats
+        self.cache_slots = cache_slots
+        self.transfer_stats = transfer_stats
+        self.resource_policy = resource_policy
+        self.driver_factory = driver_factory or uc.Chrome
+        self._profile_paths = {}
+        self._cache_paths = {}
+        self._first_page_pending = {}
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._idle = []
+        self._uses = {}
+        self._closed = False
+        self.stats = {"launched": 0, "leases": 0, "recycled": 0, "health_failures": 0}
+
+    def _launch(self):
+        """Start a new Chrome driver for the pool"""
+        profile, reused = self.profiles.acquire() if self.profiles else (None, False)
+        cache_dir = self.cache_slots.acquire()[0] if self.cache_slots else None
+        try:
+            driver = self.driver_factory(options=build_chrome_options(self.headless, cache_dir), headless=self.headless, user_data_dir=profile)
+        except Exception:
+            if profile:
+                self.profiles.release(profile)
+            if cache_dir:
+                self.cache_slots.release(cache_dir)
+            raise
+        driver.set_page_load_timeout(self.page_load_timeout)
+        if self.resource_policy:
+            try:
+                self.resource_policy.apply(driver)
+            except Exception as e:
+                logger.warning(f"Could not apply resource blocking to pooled driver: {e}")
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self._profile_paths[id(driver)] = profile
+            self._cache_paths[id(driver)] = cache_dir
+            self._first_page_pending[id(driver)] = reused
+            self.stats["launched"] += 1
+            launched = self.stats["launched"]
+        logger.info(f"Browser pool launched driver ({launched} launched so far)")
+        return driver
+
+    def _quit(self, driver):
+        """Quit a driver and forget its usage counter"""
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self._first_page_pending.pop(id(driver), None)
+            profile = self._profile_paths.pop(id(driver), None)
+            cache_dir = self._cache_paths.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting pooled driver: {e}")
+        if profile:
+            self.profiles.release(profile)
+        if cache_dir:
+            self.cache_slots.release(cache_dir)
+
+    def _recycle(self, driver):
+        """Quit a driver that will not be leased again, counting it as recycled"""
+        with self._lock:
+            self.stats["recycled"] += 1
+        self._quit(driver)
+
+    def _is_healthy(self, driver):
+        """Check that the driver session and browser are still responsive"""
+        try:
+            driver.execute_script("return 1")
+            return bool(driver.window_handles)
+        except Exception:
+            return False
+
+    def _reset(self, driver):
+        """Clear tabs, cookies and storage so the next lease starts clean (cookies and storage are kept on persistent profiles)"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        if not self.profiles:
+            try:
+                driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+            except Exception:
+                pass
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception:
+                driver.delete_all_cookies()
+        driver.get("about:blank")
+        try:
+            driver.get_log("performance")  # Discard network events left over from the last lease
+        except Exception:
+            pass
+
+    def acquire(self):
+        """Lease a healthy driver, launching one if the pool is not yet full"""
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+        if not self._slots.acquire(timeout=self.lease_timeout):
+            raise TimeoutError(f"No browser available after {self.lease_timeout} seconds")
+        try:
+            while True:
+                with self._lock:
+                    driver = self._idle.pop() if self._idle else None
+                if driver is None:
+                    driver = self._launch()
+                elif not self._is_healthy(driver):
+                    with self._lock:
+                        self.stats["health_failures"] += 1
+                    logger.warning("Pooled driver failed health check, replacing it")
+                    self._quit(driver)
+                    continue
+                with self._lock:
+                    self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+                    self.stats["leases"] += 1
+                return driver
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, driver, discard=False):
+        """Return a leased driver to the pool, recycling it if needed"""
+        if self.transfer_stats is not None and not discard:
+            self.transfer_stats.sample(driver)
+        try:
+            with self._lock:
+                worn_out = self._uses.get(id(driver), 0) >= self.max_uses
+            if discard or self._closed or worn_out:
+                self._recycle(driver)
+                return
+            try:
+                self._reset(driver)
+            except Exception as e:
+                logger.warning(f"Failed to reset pooled driver, recycling it: {e}")
+                self._recycle(driver)
+                return
+            with self._lock:
+                self._idle.append(driver)
+        finally:
+            self._slots.release()
+
+    def get(self, driver, url):
+        """Load url in a leased driver, timing the first page of each launch for profile reuse stats"""
+        with self._lock:
+            reused = self._first_page_pending.pop(id(driver), None)
+        started = time.perf_counter()
+        if self.resource_policy:
+            self.resource_policy.get(driver, url)
+        else:
+            driver.get(url)
+        if reused is not None and self.first_page_stats is not None:
+            self.first_page_stats.record(reused, time.perf_counter() - started, block_signal(title=driver.title))
+
+    @contextmanager
+    def lease(self):
+        """Context manager that leases a driver and always returns it"""
+        driver = self.acquire()
+        discard = False
+        started = time.time()
+        try:
+            yield driver
+        except Exception:
+            discard = not self._is_healthy(driver)
+            raise
+        finally:
+            logger.debug(f"Driver lease held for {time.time() - started:.1f}s")
+            self.release(driver, discard=discard)
+
+    def close(self):
+        """Quit every idle driver and refuse further leases"""
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._quit(driver)
+        logger.info(f"Browser pool closed: {self.stats}")
@@ -0,0 +1,213 @@
+import time
+import logging
+import threading
+from contextlib import contextmanager
+
+try:
+    import psutil
+except ImportError:  # Memory admission is disabled without psutil
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+BLOCK_STATUS_CODES = (403, 429)
+CHALLENGE_TITLES = ("just a moment", "attention required", "access denied", "please wait")
+
+
+def block_signal(status=None, title=None):
+    """Return a reason string if a response looks like a block or challenge, else ''"""
+    if status in BLOCK_STATUS_CODES:
+        return f"HTTP {status}"
+    title_lower = (title or "").lower()
+    for marker in CHALLENGE_TITLES:
+        if marker in title_lower:
+            return f"challenge title '{title}'"
+    return ""
+
+
+class AdaptiveConcurrency:
+    """AIMD controller for enrichment concurrency and inter-request delay.
+
+    Clean page loads grow the concurrency limit additively (about +1 per `limit`
+    successes) and shrink the delay; a block, challenge or timeout halves the limit and
+    doubles the delay. Decreases within `cooldown` seconds of the previous one are
+    ignored so a single burst of failures from in-flight requests counts once.
+    """
+
+    def __init__(self, initial=1, min_limit=1, max_limit=4, min_delay=0.0, max_delay=60.0,
+                 base_delay=2.0, decrease_factor=0.5, cooldown=30.0, admission=None):
+        self.min_limit = min_limit
+        self.max_limit = max(min_limit, max_limit)
+        self.limit = float(min(max(initial, min_limit), self.max_limit))
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.base_delay = base_delay
+        self.delay = min_delay
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self.admission = admission
+        self.active = 0
+        self._active_seconds = 0.0
+        self._active_changed = time.time()
+        self.trajectory = []
+        self._last_decrease = 0.0
+        self._started = time.time()
+        self._cond = threading.Condition()
+        self.stats = {"successes": 0, "blocks": 0, "peak_active": 0}
+        self._log_change("start")
+
+    def _log_change(self, reason):
+        """Record the current limit and delay in the trajectory and the log"""
+        point = (round(time.time() - self._started, 1), int(self.limit), round(self.delay, 2), reason)
+        self.trajectory.append(point)
+        logger.info(f"Concurrency trajectory: t={point[0]}s limit={point[1]} delay={point[2]}s ({reason})")
+
+    @contextmanager
+    def slot(self):
+        """Hold one of the currently allowed concurrent slots, after the adaptive delay"""
+        with self._cond:
+            while self.active >= self._allowed():
+                # Memory frees up without notification, so re-check admission periodically
+                self._cond.wait(timeout=2 if self.admission else None)
+            self._track_active()
+            self.active += 1
+            self.stats["peak_active"] = max(self.stats["peak_active"], self.active)
+            delay = self.delay
+        if delay:
+            time.sleep(delay)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._track_active()
+                self.active -= 1
+                self._cond.notify_all()
+
+    def _allowed(self):
+        """Workers allowed right now: the AIMD limit, capped by memory admission if configured"""
+        allowed = int(self.limit)
+        if self.admission:
+            allowed = min(allowed, self.admission.allowed_workers(self.active))
+        return allowed
+
+    def _track_active(self):
+        """Accumulate worker-seconds so average parallelism can be reported"""
+        now = time.time()
+        self._active_seconds += self.active * (now - self._active_changed)
+        self._active_changed = now
+
+    def achieved_parallelism(self):
+        """Average number of concurrently active workers since the controller started"""
+        with self._cond:
+            self._track_active()
+            elapsed = time.time() - self._started
+        return self._active_seconds / elapsed if elapsed > 0 else 0.0
+
+    def record_success(self):
+        """Additive increase after a clean page load"""
+        with self._cond:
+            self.stats["successes"] += 1
+            old_limit = int(self.limit)
+            old_delay = self.delay
+            self.limit = min(self.max_limit, self.limit + 1.0 / max(1.0, self.limit))
+            self.delay = max(self.min_delay, self.delay - 0.1 * self.base_delay)
+            if int(self.limit) != old_limit or (old_delay and not self.delay):
+                self._log_change("clean loads")
+                self._cond.notify_all()
+
+    def record_block(self, reason):
+        """Multiplicative decrease after a block, challenge or timeout"""
+        with self._cond:
+            self.stats["blocks"] += 1
+            now = time.time()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+            self.delay = min(self.max_delay, max(self.base_delay, self.delay * 2))
+            self._log_change(reason)
+
+    def log_summary(self):
+        """Log how concurrency moved over the run"""
+        limits = [point[1] for point in self.trajectory]
+        logger.info(f"Concurrency summary: {self.stats['successes']} clean loads, {self.stats['blocks']} blocks, "
+                    f"limit range {min(limits)}-{max(limits)}, final {int(self.limit)}, peak active {self.stats['peak_active']}, "
+                    f"{len(self.trajectory) - 1} adjustments, average parallelism {self.achieved_parallelism():.2f}")
+        if self.admission:
+            self.admission.log_summary()
+
+
+class MemoryAdmission:
+    """Admit enrichment workers based on measured memory instead of a fixed cap.
+
+    The RSS of the Chrome process tree under this process is divided by the number of
+    running browsers to estimate the cost of one more worker. A new worker is admitted
+    only while available system memory minus `reserve_mb` covers that cost, up to
+    `max_workers`. Measurements are cached for `sample_interval` seconds.
+    """
+
+    def __init__(self, max_workers=4, reserve_mb=300, default_worker_mb=400, sample_interval=2.0):
+        self.max_workers = max_workers
+        self.reserve_mb = reserve_mb
+        self.default_worker_mb = default_worker_mb
+        self.sample_interval = sample_interval
+        self.enabled = psutil is not None
+        self.peak_chrome_mb = 0.0
+        self.min_available_mb = None
+        self._sampled_at = 0.0
+        self._sample = (0.0, 0, None)
+        self._lock = threading.Lock()
+        if not self.enabled:
+            logger.warning("psutil is not installed, memory-aware admission is disabled")
+
+    def _measure(self, fresh=False):
+        """Return (chrome tree RSS in MB, number of browser processes, available MB), cached briefly"""
+        with self._lock:
+            if not fresh and time.time() - self._sampled_at < self.sample_interval:
+                return self._sample
+            rss = 0
+            browsers = 0
+            for proc in psutil.Process().children(recursive=True):
+                try:
+                    name = proc.name().lower()
+                    if "chrome" not in name:
+                        continue
+                    rss += proc.memory_info().rss
+                    if "chromedriver" not in name and "--type=" not in " ".join(proc.cmdline()):
+                        browsers += 1  # Browser main process, not a renderer/GPU/utility child
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            available_mb = psutil.virtual_memory().available / (1024 * 1024)
+            chrome_mb = rss / (1024 * 1024)
+            self.peak_chrome_mb = max(self.peak_chrome_mb, chrome_mb)
+            if self.min_available_mb is None or available_mb < self.min_available_mb:
+                self.min_available_mb = available_mb
+            self._sample = (chrome_mb, browsers, available_mb)
+            self._sampled_at = time.time()
+            return self._sample
+
+    def allowed_workers(self, active):
+        """How many workers may run given current memory, never below one"""
+        if not self.enabled:
+            return self.max_workers
+        chrome_mb, browsers, available_mb = self._measure()
+        per_worker_mb = chrome_mb / browsers if browsers else self.default_worker_mb
+        headroom = available_mb - self.reserve_mb
+        extra = int(headroom // max(per_worker_mb, 1)) if headroom > 0 else 0
+        # Count the running workers as already paid for, and only admit what fits on top
+        return max(1, min(self.max_workers, active + extra))
+
+    def snapshot(self):
+        """Fresh (chrome tree RSS MB, available MB) measurement, or None without psutil"""
+        if not self.enabled:
+            return None
+        chrome_mb, _, available_mb = self._measure(fresh=True)
+        return chrome_mb, available_mb
+
+    def log_summary(self):
+        """Log peak Chrome memory and the lowest available memory seen"""
+        if not self.enabled:
+            return
+        self._measure()
+        logger.info(f"Memory summary: peak Chrome RSS {self.peak_chrome_mb:.0f}MB, "
+                    f"lowest available {self.min_available_mb or 0:.0f}MB, ceiling {self.max_workers} workers")
@@ -0,0 +1,135 @@
+"""
+Shallow crawl of a maker site's contact-like pages for an email address.
+
+When the landing page has no email, its same-site links to /contact, /imprint, /about,
+/team, /legal and similar pages are ranked and a few of them are fetched concurrently
+over HTTP with the streaming ContactScanner. The crawl stops as soon as any page yields
+an email and is bounded by a per-domain time budget.
+"""
+
+import re
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlsplit, urlunsplit
+from contact_scanner import ContactScanner
+
+logger = logging.getLogger(__name__)
+
+# Page kinds in the order they are most likely to list an email
+CONTACT_KEYWORDS = ["contact", "imprint", "impressum", "about", "team", "support", "legal", "company"]
+CONTACT_PATH_RE = re.compile(r"/(" + "|".join(CONTACT_KEYWORDS) + r")(?:[-_ ]?(?:us|me|our-team|notice))?(?:[/._-]|$)", re.IGNORECASE)
+
+
+def _site(netloc):
+    """Host without a leading www. and port, for same-site comparison"""
+    host = netloc.lower().rsplit("@", 1)[-1].split(":", 1)[0]
+    return host[4:] if host.startswith("www.") else host
+
+
+def contact_links(hrefs, base_url, limit=4):
+    """Same-site links that look like contact/about/team/imprint/legal pages, most promising first"""
+    site = _site(urlsplit(base_url).netloc)
+    seen = {base_url.split("#", 1)[0].rstrip("/")}
+    candidates = []
+    for href in hrefs:
+        if not href or not href.startswith(("http://", "https://")):
+            continue
+        parts = urlsplit(href)
+        if _site(parts.netloc) != site:
+            continue
+        match = CONTACT_PATH_RE.search(parts.path)
+        if not match:
+            continue
+        url = urlunsplit((parts.scheme, parts.netloc, parts.path, parts.query, ""))
+        if url.rstrip("/") in seen:
+            continue
+        seen.add(url.rstrip("/"))
+        candidates.append((CONTACT_KEYWORDS.index(match.group(1).lower()), len(candidates), url))
+    return [url for _, _, url in sorted(candidates)[:limit]]
+
+
+class _BudgetedScanner(ContactScanner):
+    """Email-only scanner that also reports done once the crawl is stopped or out of time"""
+
+    def __init__(self, url, classifier, stop, deadline):
+        super().__init__(url, classifier, fields=["email"])
+        self.stop = stop
+        self.deadline = deadline
+
+    @property
+    def done(self):
+        return "email" in self.links or self.stop.is_set() or time.monotonic() > self.deadline
+
+
+class ContactCrawler:
+    """Finds an email on up to `max_pages` contact-like pages, using `workers` threads and at most `domain_budget` seconds per site"""
+
+    def __init__(self, fetcher, rate_limiter, classifier, max_pages=4, workers=3, domain_budget=8.0):
+        self.fetcher = fetcher
+        self.rate_limiter = rate_limiter
+        self.classifier = classifier
+        self.max_pages = max_pages
+        self.workers = workers
+        self.domain_budget = domain_budget
+        self._lock = threading.Lock()
+        self.stats = {"crawls": 0, "found": 0, "pages": 0, "budget_exhausted": 0, "seconds": 0.0}
+
+    def _fetch(self, url, stop, deadline):
+        """Fetch one candidate page, returning the email it lists or ''"""
+        if stop.is_set() or time.monotonic() > deadline:
+            return ""
+        self.rate_limiter.acquire(url)
+        if stop.is_set() or time.monotonic() > deadline:
+            return ""
+        scanner = _BudgetedScanner(url, self.classifier, stop, deadline)
+        page = self.fetcher.scan(url, scanner, timeout=max(1.0, deadline - time.monotonic()))
+        with self._lock:
+            self.stats["pages"] += 1
+        if page is None or page["status"] >= 400:
+            return ""
+        return scanner.links.get("email", "")
+
+    def find_email(self, landing_url, hrefs):
+        """Return the first email found on the landing page's contact-like pages, or ''"""
+        urls = contact_links(hrefs, landing_url, self.max_pages)
+        if not urls:
+            return ""
+        started = time.monotonic()
+        deadline = started + self.domain_budget
+        stop = threading.Event()
+        email = ""
+        executor = ThreadPoolExecutor(max_workers=min(self.workers, len(urls)), thread_name_prefix="contact-crawl")
+        try:
+            pending = {executor.submit(self._fetch, url, stop, deadline) for url in urls}
+            while pending and not email:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        email = email or future.result()
+                    except Exception as e:
+                        logger.debug(f"Contact page fetch failed for {landing_url}: {e}")
+        finally:
+            stop.set()
+            # In-flight fetches notice the stop flag at their next chunk, don't wait for them
+            executor.shutdown(wait=False, cancel_futures=True)
+        elapsed = time.monotonic() - started
+        with self._lock:
+            self.stats["crawls"] += 1
+            self.stats["seconds"] += elapsed
+            self.stats["found"] += int(bool(email))
+            self.stats["budget_exhausted"] += int(not email and elapsed >= self.domain_budget)
+        if email:
+            logger.info(f"Found email for {landing_url} on a contact page in {elapsed:.1f}s")
+        return email
+
+    def log_summary(self):
+        """Log how often the crawl found an email and what it cost"""
+        s = self.stats
+        if s["crawls"]:
+            logger.info(f"Contact page crawl: email found for {s['found']}/{s['crawls']} sites, {s['pages']} pages fetched, "
+                        f"{s['budget_exhausted']} sites hit the time budget, {s['seconds']:.1f}s total")
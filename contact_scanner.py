@@ -0,0 +1,190 @@
+"""
+Incremental HTML scan for social profile links and contact emails.
+
+ContactScanner is fed a page in chunks as it downloads and can report `done` as soon as
+every target field is filled, so callers stop reading the body early. Script, style and
+template content is skipped, entities are decoded by the parser, and emails are
+recovered from common obfuscations ("name [at] domain [dot] com") and Cloudflare email
+protection. Candidates that look like assets or tokens (logo@2x.png, Sentry DSNs) are
+rejected.
+"""
+
+import re
+import logging
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from link_classifier import LinkClassifier
+
+logger = logging.getLogger(__name__)
+
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,24}")
+# "[at]", "(at)", "{at}" style obfuscations, and the same for dots
+AT_RE = re.compile(r"\s*[\[\(\{<]\s*at\s*[\]\)\}>]\s*", re.IGNORECASE)
+DOT_RE = re.compile(r"\s*[\[\(\{<]\s*dot\s*[\]\)\}>]\s*", re.IGNORECASE)
+CF_EMAIL_PATH = "/cdn-cgi/l/email-protection#"
+
+# File extensions that show a match is an asset reference (logo@2x.png), not an address
+ASSET_SUFFIXES = {"png", "jpg", "jpeg", "gif", "svg", "webp", "avif", "ico", "bmp", "tif", "tiff",
+                  "js", "mjs", "css", "map", "json", "woff", "woff2", "ttf", "otf", "eot",
+                  "mp4", "webm", "mov", "mp3", "pdf", "zip", "php", "html", "htm"}
+# Domains of placeholders and error-reporting DSNs rather than contacts
+REJECT_DOMAINS = {"example.com", "example.org", "domain.com", "yourdomain.com", "email.com", "company.com",
+                  "sentry.io", "ingest.sentry.io", "sentry-next.wixpress.com", "sentry.wixpress.com", "wixpress.com"}
+HEX_TOKEN_RE = re.compile(r"[0-9a-f]{16,}")
+
+SKIP_TAGS = ("script", "style", "noscript", "template", "svg")
+# Elements whose body HTMLParser buffers as raw text until the closing tag
+RAW_TEXT_TAGS = ("script", "style")
+
+
+def plausible_email(address):
+    """Whether a regex match looks like a real contact address"""
+    local, _, domain = address.rpartition("@")
+    domain = domain.lower().rstrip(".")
+    if not local or not domain:
+        return False
+    if domain.rsplit(".", 1)[-1] in ASSET_SUFFIXES:
+        return False
+    if domain in REJECT_DOMAINS or any(domain.endswith("." + d) for d in REJECT_DOMAINS):
+        return False
+    if HEX_TOKEN_RE.fullmatch(local.lower()):
+        return False  # DSN keys and hashes
+    return True
+
+
+def find_emails(text):
+    """Plausible email addresses in visible text, after undoing [at]/[dot] style obfuscation"""
+    if AT_RE.search(text):
+        text = DOT_RE.sub(".", AT_RE.sub("@", text))
+    elif "@" not in text:
+        return []
+    return [m.group(0) for m in EMAIL_RE.finditer(text) if plausible_email(m.group(0))]
+
+
+def decode_cfemail(encoded):
+    """Decode a Cloudflare email-protection hex string (first byte is the XOR key)"""
+    try:
+        data = bytes.fromhex(encoded)
+        key = data[0]
+        return bytes(b ^ key for b in data[1:]).decode("utf-8")
+    except (ValueError, IndexError, UnicodeDecodeError):
+        return ""
+
+
+class ContactScanner(HTMLParser):
+    """Streaming parser collecting hrefs, visible-text size, profile links and the first email.
+
+    `links` maps classifier fields (plus "email") to the first value found; `done` turns
+    true once every field in `fields` is filled.
+    """
+
+    def __init__(self, base_url="", classifier=None, fields=None):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.classifier = classifier or LinkClassifier()
+        self.fields = set(fields or self.classifier.fields)
+        self.hrefs = []
+        self.links = {}
+        self.text_length = 0
+        self.chars_fed = 0
+        self.chars_skipped = 0
+        self._skip_depth = 0
+        self._text_tail = ""
+        self._raw_text_tag = None
+        self._held = ""
+
+    @property
+    def done(self):
+        return self.fields.issubset(self.links)
+
+    def feed(self, data):
+        self.chars_fed += len(data)
+        if self._raw_text_tag:
+            # HTMLParser buffers an unterminated <script>/<style> body and searches it again
+            # on every feed, which is quadratic in bundle size. The body is skipped anyway, so
+            # hold chunks back until one contains the closing tag, keeping only enough of the
+            # held text to match a closing tag split across chunks.
+            data = self._held + data
+            if f"</{self._raw_text_tag}" not in data.lower():
+                self.chars_skipped += len(data) - min(len(data), 64)
+                self._held = data[-64:]
+                return
+            self._held = ""
+        super().feed(data)
+
+    def _add(self, field, value):
+        if value and field not in self.links:
+            self.links[field] = value
+
+    def _add_email(self, address):
+        if "email" not in self.links and address and plausible_email(address):
+            self.links["email"] = address
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+            if tag in RAW_TEXT_TAGS:
+                self._raw_text_tag = tag
+            return
+        attrs = dict(attrs)
+        if attrs.get("data-cfemail"):
+            self._add_email(decode_cfemail(attrs["data-cfemail"]))
+        if tag not in ("a", "area"):
+            return
+        href = (attrs.get("href") or "").strip()
+        if not href:
+            return
+        if CF_EMAIL_PATH in href:
+            self._add_email(decode_cfemail(href.split("#", 1)[1]))
+            return
+        if not href.lower().startswith(("mailto:", "javascript:", "#", "tel:")):
+            href = urljoin(self.base_url, href)
+        self.hrefs.append(href)
+        match = self.classifier.classify(href)
+        if match:
+            if match[0] == "email":
+                self._add_email(match[1])
+            else:
+                self._add(*match)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        if tag == self._raw_text_tag:
+            self._raw_text_tag = None
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        stripped = data.strip()
+        if not stripped:
+            return
+        self.text_length += len(stripped)
+        if "email" in self.links:
+            return
+        # Keep a little of the previous text node so "name [at]" + "domain.com" split
+        # across tags still joins up
+        text = f"{self._text_tail} {stripped}"
+        emails = find_emails(text)
+        if emails:
+            self._add_email(emails[0])
+        self._text_tail = stripped[-80:]
+
+
+def scan_html(html, base_url="", classifier=None, fields=None, max_chars=None):
+    """Scan an HTML string in chunks, stopping at max_chars or when every field is filled"""
+    scanner = ContactScanner(base_url, classifier, fields)
+    limit = len(html) if max_chars is None else min(len(html), max_chars)
+    try:
+        for start in range(0, limit, 16384):
+            scanner.feed(html[start:min(start + 16384, limit)])
+            if scanner.done:
+                break
+        scanner.close()
+    except Exception as e:
+        logger.debug(f"HTML scan error for {base_url}: {e}")
+    return scanner
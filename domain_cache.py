@@ -0,0 +1,138 @@
+"""
+Persistent cache of maker website enrichment, keyed by registrable domain.
+
+Relaunches and several products from one maker point at the same site, so the site_*
+fields found on a domain are stored in SQLite with the time and path (http/browser) of
+the fetch and reused until `ttl` expires. Dead sites are cached too, for the shorter
+`negative_ttl`, so a broken domain is not retried on every run. Domains of shared
+platforms (app stores, GitHub, Notion...) are never cached, since one entry would
+stand in for many unrelated products.
+"""
+
+import json
+import time
+import sqlite3
+import logging
+import threading
+from rate_limiter import host_key
+
+logger = logging.getLogger(__name__)
+
+# Second-level labels under which registrations sit one level deeper (example.co.uk)
+MULTI_PART_SUFFIXES = {"co", "com", "net", "org", "gov", "edu", "ac", "or", "ne", "go", "gen", "ltd", "plc"}
+
+# Hosting platforms where every subdomain is a separate site, keyed by the full host
+SITE_PER_SUBDOMAIN = {"github.io", "gitlab.io", "vercel.app", "netlify.app", "pages.dev", "workers.dev", "herokuapp.com",
+                      "web.app", "firebaseapp.com", "notion.site", "webflow.io", "framer.website", "framer.ai", "carrd.co",
+                      "bubbleapps.io", "substack.com", "wixsite.com", "squarespace.com", "super.site", "typedream.app",
+                      "glide.page", "softr.app", "replit.app", "streamlit.app", "onrender.com", "fly.dev", "railway.app"}
+
+# Platforms hosting many unrelated products under one domain; never cached
+SHARED_DOMAINS = {"producthunt.com", "apple.com", "google.com", "microsoft.com", "github.com", "gitlab.com",
+                  "chromewebstore.google.com", "mozilla.org", "notion.so", "figma.com", "gumroad.com", "medium.com",
+                  "youtube.com", "x.com", "twitter.com", "linkedin.com", "instagram.com", "facebook.com", "discord.gg",
+                  "discord.com", "tiktok.com", "reddit.com", "bit.ly", "linktr.ee", "huggingface.co", "npmjs.com",
+                  "pypi.org", "wordpress.org", "shopify.com", "slack.com", "zapier.com", "amazon.com"}
+
+DAY = 24 * 3600
+
+
+def registrable_domain(url):
+    """Domain a site was registered under (app.orbit.co.uk -> orbit.co.uk), or the full host on site-per-subdomain platforms"""
+    host = host_key(url or "")
+    if not host or "." not in host or host.replace(".", "").isdigit():
+        return host
+    labels = host.split(".")
+    for size in (3, 2):
+        if len(labels) > size and ".".join(labels[-size:]) in SITE_PER_SUBDOMAIN:
+            return ".".join(labels[-size - 1:])
+    keep = 3 if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in MULTI_PART_SUFFIXES else 2
+    return ".".join(labels[-keep:])
+
+
+def cache_key(url):
+    """Cache key for a website URL, or None for shared platforms and non-web URLs"""
+    if not url or not url.startswith(("http://", "https://")):
+        return None
+    domain = registrable_domain(url)
+    if not domain or domain in SHARED_DOMAINS or host_key(url) in SHARED_DOMAINS:
+        return None
+    return domain
+
+
+class DomainCache:
+    """SQLite-backed {domain: site_* fields} cache with TTLs, safe to share between worker threads"""
+
+    def __init__(self, path="domain_cache.sqlite3", ttl=14 * DAY, negative_ttl=2 * DAY):
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""CREATE TABLE IF NOT EXISTS domains (
+            domain TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            fields TEXT NOT NULL,
+            final_url TEXT,
+            fetch_path TEXT,
+            fetched_at REAL NOT NULL)""")
+        self._db.commit()
+        self.stats = {"hits": 0, "negative_hits": 0, "misses": 0, "expired": 0, "bypassed": 0, "stored": 0, "stored_dead": 0}
+
+    def _count(self, key):
+        self.stats[key] += 1
+
+    def get(self, url):
+        """Return (status, fields) for a fresh entry covering url ("ok" or "dead"), or None on a miss"""
+        domain = cache_key(url)
+        with self._lock:
+            if domain is None:
+                self._count("bypassed")
+                return None
+            row = self._db.execute("SELECT status, fields, fetched_at FROM domains WHERE domain = ?", (domain,)).fetchone()
+            if row is None:
+                self._count("misses")
+                return None
+            status, fields, fetched_at = row
+            if time.time() - fetched_at > (self.ttl if status == "ok" else self.negative_ttl):
+                self._count("expired")
+                return None
+            self._count("hits" if status == "ok" else "negative_hits")
+            return status, json.loads(fields)
+
+    def put(self, url, fields, fetch_path, final_url=None, dead=False):
+        """Store the site_* fields found for url's domain (and final_url's, if it redirected elsewhere)"""
+        domains = {cache_key(url), cache_key(final_url)} - {None}
+        if not domains:
+            return
+        status = "dead" if dead else "ok"
+        rows = [(domain, status, json.dumps(fields), final_url or url, fetch_path, time.time()) for domain in domains]
+        with self._lock:
+            try:
+                self._db.executemany("INSERT OR REPLACE INTO domains VALUES (?, ?, ?, ?, ?, ?)", rows)
+                self._db.commit()
+                self._count("stored_dead" if dead else "stored")
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to cache enrichment for {url}: {e}")
+
+    def prune(self):
+        """Delete entries older than both TTLs; returns the number removed"""
+        cutoff = time.time() - max(self.ttl, self.negative_ttl)
+        with self._lock:
+            removed = self._db.execute("DELETE FROM domains WHERE fetched_at < ?", (cutoff,)).rowcount
+            self._db.commit()
+        return removed
+
+    def log_summary(self):
+        """Log hit/miss counts for this run"""
+        s = self.stats
+        lookups = s["hits"] + s["negative_hits"] + s["misses"] + s["expired"]
+        if lookups:
+            logger.info(f"Domain cache: {s['hits']} hits, {s['negative_hits']} dead-site hits, {s['misses']} misses, "
+                        f"{s['expired']} expired ({(s['hits'] + s['negative_hits']) / lookups:.0%} hit rate), "
+                        f"{s['bypassed']} shared-platform URLs not cached, {s['stored']} stored, {s['stored_dead']} stored as dead")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
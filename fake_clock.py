@@ -0,0 +1,35 @@
+"""
+Fake clock for tests: replaces a module's `time` so sleeps advance the clock instead of blocking.
+"""
+
+from contextlib import contextmanager
+
+
+class FakeClock:
+    """Stands in for the time module; every clock reads `now`, and sleep() advances it"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    monotonic = time
+    perf_counter = time
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@contextmanager
+def fake_time(module, now=1000.0):
+    """Replace `module.time` with a FakeClock for the duration of the block"""
+    clock = FakeClock(now)
+    real_time = module.time
+    module.time = clock
+    try:
+        yield clock
+    finally:
+        module.time = real_time
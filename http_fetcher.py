@@ -0,0 +1,186 @@
+import codecs
+import socket
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from browser_pool import DEFAULT_USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+# Markers of bot-protection interstitials (Cloudflare, PerimeterX, Incapsula, DataDome)
+CHALLENGE_MARKERS = [
+    "just a moment...",
+    "cf-chl-",
+    "challenge-platform",
+    "attention required! | cloudflare",
+    "px-captcha",
+    "_incapsula_resource",
+    "captcha-delivery.com",
+]
+
+# Markers of client-rendered shells whose links only exist after JavaScript runs
+JS_SHELL_MARKERS = [
+    "you need to enable javascript",
+    "please enable javascript",
+    "javascript is required",
+    '<div id="root"></div>',
+    '<div id="app"></div>',
+    '<div id="__next"></div>',
+]
+
+
+def browser_fallback_reason(page, anchors):
+    """Return why a fetched page must be re-visited in a browser, or '' if the HTTP result is usable"""
+    if page is None:
+        return "request failed"
+    if page["status"] in (401, 403, 429, 503):
+        return f"HTTP {page['status']}"
+    if page["status"] >= 400 or page["non_html"]:
+        return ""  # Dead page or a download, a browser will not do better
+    html_lower = page["html"][:200000].lower()
+    if any(marker in html_lower for marker in CHALLENGE_MARKERS):
+        return "bot challenge"
+    if not html_lower.strip():
+        return "empty response"
+    if anchors["text_length"] < 200 and len(anchors["hrefs"]) < 5:
+        return "JavaScript shell"
+    if any(marker in html_lower for marker in JS_SHELL_MARKERS) and len(anchors["hrefs"]) < 5:
+        return "JavaScript shell"
+    return ""
+
+
+def unreachable_reason(error):
+    """'dns' or 'refused' when a request error shows the host definitely does not serve the site, else ''.
+
+    Timeouts, resets, TLS errors and temporary DNS failures say nothing about the site.
+    """
+    if not isinstance(error, requests.ConnectionError) or isinstance(error, (requests.Timeout, requests.exceptions.SSLError)):
+        return ""
+    cause = error.args[0] if error.args else None
+    cause = getattr(cause, "reason", cause)
+    while cause is not None:
+        if isinstance(cause, socket.gaierror) and cause.errno in (socket.EAI_NONAME, getattr(socket, "EAI_NODATA", socket.EAI_NONAME)):
+            return "dns"
+        if isinstance(cause, ConnectionRefusedError):
+            return "refused"
+        cause = cause.__cause__ or cause.__context__
+    return ""
+
+
+class HttpFetcher:
+    """Pooled HTTP client for fetching static pages with a bounded body size"""
+
+    def __init__(self, timeout=15, max_bytes=2 * 1024 * 1024, pool_size=10, user_agent=DEFAULT_USER_AGENT):
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.max_redirects = 10
+        self.session.headers.update({
+            "User-Agent": user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+            # Includes br only when a brotli decoder is installed for urllib3
+            "Accept-Encoding": ACCEPT_ENCODING,
+        })
+
+    def fetch(self, url):
+        """GET a page following redirects; returns a dict with status, final url and (truncated) html, or None on error"""
+        try:
+            with self.session.get(url, timeout=self.timeout, allow_redirects=True, stream=True) as resp:
+                content_type = resp.headers.get("Content-Type", "")
+                if content_type and "html" not in content_type and "xml" not in content_type:
+                    return {"status": resp.status_code, "url": resp.url, "html": "", "truncated": False, "non_html": True}
+                chunks = []
+                received = 0
+                truncated = False
+                for chunk in resp.iter_content(chunk_size=16384):
+                    chunks.append(chunk)
+                    received += len(chunk)
+                    if received >= self.max_bytes:
+                        truncated = True
+                        break
+                body = b"".join(chunks)[:self.max_bytes]
+                html = body.decode(self._encoding(resp, content_type), errors="replace")
+                return {"status": resp.status_code, "url": resp.url, "html": html, "truncated": truncated, "non_html": False}
+        except requests.RequestException as e:
+            logger.debug(f"HTTP fetch failed for {url}: {e}")
+            return None
+
+    def _encoding(self, resp, content_type):
+        """Response text encoding, defaulting to UTF-8"""
+        encoding = resp.encoding or "utf-8"
+        if encoding.lower() == "iso-8859-1" and "charset" not in content_type.lower():
+            encoding = "utf-8"  # requests' default for text/* without charset is usually wrong
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = "utf-8"
+        return encoding
+
+    def scan(self, url, parser, max_bytes=None, timeout=None, meta=None):
+        """GET a page and feed it to `parser` as it downloads, stopping early once parser.done is true.
+
+        Returns the same dict as fetch() (html holds only the part that was read, plus a
+        bytes_read count), or None on error. `timeout` overrides the fetcher's default. On
+        error `meta["unreachable"]` is set to unreachable_reason() of the exception.
+        """
+        max_bytes = max_bytes or self.max_bytes
+        try:
+            with self.session.get(url, timeout=timeout or self.timeout, allow_redirects=True, stream=True) as resp:
+                content_type = resp.headers.get("Content-Type", "")
+                if content_type and "html" not in content_type and "xml" not in content_type:
+                    return {"status": resp.status_code, "url": resp.url, "html": "", "truncated": False, "non_html": True, "bytes_read": 0}
+                parser.base_url = resp.url
+                decoder = codecs.getincrementaldecoder(self._encoding(resp, content_type))(errors="replace")
+                parts = []
+                received = 0
+                truncated = False
+                for chunk in resp.iter_content(chunk_size=16384):
+                    chunk = chunk[:max_bytes - received]
+                    received += len(chunk)
+                    text = decoder.decode(chunk)
+                    parts.append(text)
+                    parser.feed(text)
+                    if getattr(parser, "done", False):
+                        break
+                    if received >= max_bytes:
+                        truncated = True
+                        break
+                else:
+                    tail = decoder.decode(b"", final=True)
+                    parts.append(tail)
+                    parser.feed(tail)
+                parser.close()
+                return {"status": resp.status_code, "url": resp.url, "html": "".join(parts), "truncated": truncated,
+                        "non_html": False, "bytes_read": received}
+        except requests.RequestException as e:
+            logger.debug(f"HTTP scan failed for {url}: {e}")
+            if meta is not None:
+                meta["unreachable"] = unreachable_reason(e)
+            return None
+
+    def adopt_browser_session(self, driver):
+        """Copy a driver's cookies for its current site and its user agent into this session; returns the cookie count.
+
+        Bot-protection clearance cookies are bound to the user agent that earned them, so
+        both are taken from the browser that passed the check.
+        """
+        user_agent = driver.execute_script("return navigator.userAgent")
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+        cookies = driver.get_cookies()
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+                secure=cookie.get("secure", False), expires=cookie.get("expiry"),
+            )
+        return len(cookies)
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
@@ -0,0 +1,100 @@
+"""
+Classify hrefs into social profile and email fields.
+
+Matching is on the URL's host (and its parent domains) rather than substrings of the whole
+URL, so dropbox.com is not mistaken for x.com and a ?ref=instagram.com query is ignored.
+The platform table is compiled once into a single regex that only matches URLs on a known
+host (rejecting every other href in one C-level match) plus a host -> rule lookup, and a
+list of hrefs is classified in a single pass.
+"""
+
+import re
+from collections import namedtuple
+from urllib.parse import unquote
+
+# field: output field suffix (ph_<field>, site_<field>); hosts: registrable domains;
+# paths: if set, the URL path must start with one of these prefixes
+Platform = namedtuple("Platform", ["field", "hosts", "paths"])
+
+PLATFORMS = [
+    Platform("instagram", ("instagram.com", "instagr.am"), None),
+    Platform("linkedin_company", ("linkedin.com",), ("/company/", "/school/", "/showcase/")),
+    Platform("linkedin_personal", ("linkedin.com",), ("/in/", "/pub/")),
+    Platform("x", ("x.com", "twitter.com"), None),
+    Platform("facebook", ("facebook.com", "fb.com", "fb.me"), None),
+    Platform("youtube", ("youtube.com", "youtu.be"), None),
+    Platform("tiktok", ("tiktok.com",), None),
+    Platform("github", ("github.com",), None),
+    Platform("discord", ("discord.gg", "discord.com", "discordapp.com"), ("/invite/",)),
+]
+
+# discord.gg links are invites on any path
+_ANY_PATH_HOSTS = {"discord.gg"}
+
+# First path segments that are share buttons, intents, embedded videos or the site's own
+# pages, not a profile
+SKIP_SEGMENTS = {"", "share", "sharer", "sharer.php", "sharearticle", "intent", "home", "login", "signup",
+                 "privacy", "legal", "about", "help", "policies", "terms", "watch", "embed", "hashtag", "explore",
+                 "discover", "features", "pricing", "sponsors"}
+
+# Product Hunt's own accounts
+SKIP_ACCOUNTS = {"producthunt"}
+
+LINK_FIELDS = [platform.field for platform in PLATFORMS] + ["email"]
+
+
+class LinkClassifier:
+    """Maps hrefs to the first profile link per platform, plus the first mailto address"""
+
+    def __init__(self, platforms=PLATFORMS, skip_segments=SKIP_SEGMENTS, skip_accounts=SKIP_ACCOUNTS):
+        self.fields = [platform.field for platform in platforms] + ["email"]
+        self.skip_segments = {s.lower() for s in skip_segments}
+        self.skip_accounts = {s.lower() for s in skip_accounts}
+        self._by_host = {}
+        for platform in platforms:
+            paths = tuple(p.lower() for p in platform.paths) if platform.paths else None
+            for host in platform.hosts:
+                self._by_host.setdefault(host.lower(), []).append((platform.field, None if host in _ANY_PATH_HOSTS else paths))
+        # scheme, optional userinfo, any subdomains, then a known host ending the authority
+        hosts = "|".join(re.escape(host) for host in sorted(self._by_host, key=len, reverse=True))
+        self._url_re = re.compile(rf"\s*https?://(?:[^/?#@\s]*@)?(?:[a-z0-9-]+\.)*({hosts})\.?(?::\d+)?(?=[/?#]|$)([^?#]*)",
+                                  re.IGNORECASE)
+
+    def classify(self, href):
+        """Return (field, value) for one href, or None if it is not a profile or email link"""
+        if not href:
+            return None
+        match = self._url_re.match(href)
+        if match is None:
+            href = href.strip()
+            if href[:7].lower() == "mailto:":
+                address = unquote(href[7:].split("?", 1)[0]).strip()
+                return ("email", address) if "@" in address else None
+            return None
+        href = href.strip()
+        rules = self._by_host[match.group(1).lower()]
+        path = match.group(2).lower()
+        segment = path.strip("/").split("/", 1)[0]
+        if segment.lstrip("@") in self.skip_accounts:
+            return None
+        for field, paths in rules:
+            if paths is None:
+                if segment in self.skip_segments:
+                    continue
+                return field, href
+            for prefix in paths:
+                account = path[len(prefix):].strip("/").split("/", 1)[0]
+                if path.startswith(prefix) and account and account.lstrip("@") not in self.skip_accounts:
+                    return field, href
+        return None
+
+    def first_links(self, hrefs):
+        """Single pass over hrefs returning {field: first matching value}; stops once every field is found"""
+        found = {}
+        for href in hrefs:
+            match = self.classify(href)
+            if match and match[0] not in found:
+                found[match[0]] = match[1]
+                if len(found) == len(self.fields):
+                    break
+        return found
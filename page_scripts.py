@@ -0,0 +1,112 @@
+"""JavaScript snippets executed inside pages with driver.execute_script"""
+
+# Shared card reader. Mirrors the selectors used by ProductHuntScraper._extract_product_data_new.
+_READ_CARD_JS = r"""
+const text = el => el ? (el.innerText || el.textContent || '').trim() : '';
+const readCard = section => {
+    const nameA = section.querySelector("a[data-test^='post-name-']");
+    let tagline = '';
+    for (const a of section.querySelectorAll('a')) {
+        if (a !== nameA && (a.href || '').includes('/products/')) {
+            tagline = text(a);
+            break;
+        }
+    }
+    const img = section.querySelector('img');
+    const vote = section.querySelector("button[data-test='vote-button'] p");
+    return {
+        post_id: (section.getAttribute('data-test') || '').replace('post-item-', ''),
+        name: text(nameA).replace(/^\d+\.\s*/, ''),
+        url: nameA ? nameA.href : '',
+        tagline: tagline,
+        image_url: img ? (img.src || '') : '',
+        topics: Array.from(section.querySelectorAll("[data-sentry-component='TagList'] a")).map(text),
+        upvotes: vote ? text(vote) : '0'
+    };
+};
+"""
+
+# Extract every homepage product card in one round trip, kept as the one-shot baseline for
+# benchmark_card_extraction.py. Returns a JSON string so the result crosses the WebDriver
+# wire as a single value.
+EXTRACT_CARDS_JS = _READ_CARD_JS + r"""
+return JSON.stringify(Array.from(document.querySelectorAll("section[data-test^='post-item-']")).map(readCard));
+"""
+
+# Capture each card once, when it mounts, and return the cards captured since the last call.
+# The first call installs a MutationObserver that reads cards into an in-page buffer as they
+# are added, so cards a virtualized feed later unmounts are not lost and each card is read
+# once. Cards that mount before their name link renders are retried on the next drain.
+DRAIN_CARDS_JS = _READ_CARD_JS + r"""
+const SELECTOR = "section[data-test^='post-item-']";
+let state = window.__phCardCapture;
+const capture = section => {
+    const id = section.getAttribute('data-test');
+    if (state.seen.has(id)) return;
+    if (!section.querySelector("a[data-test^='post-name-']")) {
+        state.pending.add(section);
+        return;
+    }
+    state.pending.delete(section);
+    state.seen.add(id);
+    state.buffer.push(readCard(section));
+};
+if (!state) {
+    state = window.__phCardCapture = {buffer: [], seen: new Set(), pending: new Set()};
+    state.observer = new MutationObserver(mutations => {
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType !== 1) continue;
+                if (node.matches(SELECTOR)) capture(node);
+                node.querySelectorAll(SELECTOR).forEach(capture);
+            }
+        }
+    });
+    state.observer.observe(document.body, {childList: true, subtree: true});
+    document.querySelectorAll(SELECTOR).forEach(capture);
+}
+Array.from(state.pending).forEach(capture);
+return JSON.stringify(state.buffer.splice(0));
+"""
+
+# Bytes the current page fetched over the network vs. from the browser's HTTP cache, from
+# Resource Timing. Cached responses have a transferSize of 0 but a non-zero body size;
+# cross-origin resources without Timing-Allow-Origin report zero for both and are counted
+# as opaque.
+RESOURCE_BYTES_JS = r"""
+const totals = {network: 0, network_bytes: 0, cache: 0, cache_bytes: 0, opaque: 0};
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+for (const entry of entries) {
+    if (entry.transferSize > 0) {
+        totals.network += 1;
+        totals.network_bytes += entry.transferSize;
+    } else if (entry.encodedBodySize > 0) {
+        totals.cache += 1;
+        totals.cache_bytes += entry.encodedBodySize;
+    } else {
+        totals.opaque += 1;
+    }
+}
+return JSON.stringify(totals);
+"""
+
+# Upper bound on the visible text returned by HARVEST_LINKS_JS, in characters
+HARVEST_TEXT_LIMIT = 200000
+
+# Every link on the page (mailto links included; the classifier decodes them) and a bounded
+# sample of the visible text in one round trip, instead of a find_elements call plus one
+# get_attribute call per anchor and a page_source download. Takes the text limit as its argument.
+HARVEST_LINKS_JS = r"""
+const maxText = arguments[0];
+const hrefs = [];
+const seen = new Set();
+for (const a of document.querySelectorAll('a[href], area[href]')) {
+    const href = a.href;
+    if (!href || seen.has(href)) continue;
+    seen.add(href);
+    hrefs.push(href);
+}
+const body = document.body;
+const text = body ? (body.innerText || body.textContent || '') : '';
+return JSON.stringify({hrefs: hrefs, text: text.slice(0, maxText)});
+"""
@@ -0,0 +1,229 @@
+"""
+Extract Product Hunt data from the state embedded in a page's HTML.
+
+Product Hunt is a Next.js app that ships the data it renders as JSON inside the page:
+App Router pages stream it through `self.__next_f.push(...)` flight chunks (Apollo query
+results included), while older pages use `__NEXT_DATA__` or `window.__APOLLO_STATE__`.
+Parsing that JSON is cheaper and more stable than walking the DOM with CSS selectors.
+"""
+
+import re
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "https://www.producthunt.com"
+
+FLIGHT_CHUNK_RE = re.compile(r'self\.__next_f\.push\(\[1,"((?:[^"\\]|\\.)*)"\]\)', re.S)
+FLIGHT_ROW_RE = re.compile(rb'([0-9a-f]+):([A-Z]{0,2})')
+FLIGHT_TEXT_ROW_RE = re.compile(rb'([0-9a-f]+):T([0-9a-f]+),')
+NEXT_DATA_RE = re.compile(r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S)
+APOLLO_STATE_RE = re.compile(r'window\.__APOLLO_STATE__\s*=\s*')
+
+
+def _flight_text(html):
+    """Concatenate the string payloads of all App Router flight chunks"""
+    parts = []
+    for raw in FLIGHT_CHUNK_RE.findall(html):
+        try:
+            parts.append(json.loads(f'"{raw}"'))
+        except ValueError:
+            continue
+    return "".join(parts)
+
+
+def _flight_objects(text):
+    """Yield every JSON row of an App Router flight payload"""
+    data = text.encode("utf-8")
+    pos = 0
+    while pos < len(data):
+        # Text rows carry an explicit byte length and are not newline terminated
+        text_row = FLIGHT_TEXT_ROW_RE.match(data, pos)
+        if text_row:
+            start = text_row.end()
+            pos = start + int(text_row.group(2), 16)
+            payload = data[start:pos]
+        else:
+            row = FLIGHT_ROW_RE.match(data, pos)
+            end = data.find(b"\n", pos)
+            end = len(data) if end == -1 else end
+            payload = data[row.end():end] if row else b""
+            pos = end + 1
+        if payload[:1] in (b"{", b"["):
+            try:
+                yield json.loads(payload)
+            except ValueError:
+                continue
+
+
+def state_objects(html):
+    """Yield the top-level JSON documents embedded in a page, whichever Next.js flavour it uses"""
+    match = NEXT_DATA_RE.search(html)
+    if match:
+        try:
+            yield json.loads(match.group(1))
+        except ValueError as e:
+            logger.debug(f"Unparseable __NEXT_DATA__: {e}")
+    match = APOLLO_STATE_RE.search(html)
+    if match:
+        try:
+            state, _ = json.JSONDecoder().raw_decode(html, match.end())
+            yield state
+        except ValueError as e:
+            logger.debug(f"Unparseable __APOLLO_STATE__: {e}")
+    text = _flight_text(html)
+    if text:
+        yield from _flight_objects(text)
+
+
+def _walk(value, refs, seen=None):
+    """Yield every dict nested in value, resolving Apollo {"__ref": ...} links through refs"""
+    seen = set() if seen is None else seen
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("__ref")
+            if ref is not None and len(node) == 1:
+                if ref in seen or ref not in refs:
+                    continue
+                seen.add(ref)
+                node = refs[ref]
+            yield node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def _resolve(value, refs):
+    """Follow a single Apollo reference, if value is one"""
+    if isinstance(value, dict) and len(value) == 1 and "__ref" in value:
+        return refs.get(value["__ref"], {})
+    return value
+
+
+def _apollo_refs(obj):
+    """Return the normalized-cache entries of an Apollo state document ('Post:123' -> dict)"""
+    if not isinstance(obj, dict):
+        return {}
+    props = obj.get("props") if isinstance(obj.get("props"), dict) else {}
+    page_props = props.get("pageProps") if isinstance(props.get("pageProps"), dict) else {}
+    for candidate in (obj, page_props.get("apolloState"), props.get("apolloState")):
+        if isinstance(candidate, dict) and any(":" in key for key in list(candidate)[:50]):
+            return {key: val for key, val in candidate.items() if isinstance(val, dict)}
+    return {}
+
+
+def iter_posts(html):
+    """Yield (post dict, apollo refs) for every Post object in the embedded state, once per id"""
+    seen_ids = set()
+    for obj in state_objects(html):
+        refs = _apollo_refs(obj)
+        for node in _walk(obj, refs):
+            if node.get("__typename") != "Post" or not node.get("name"):
+                continue
+            post_id = str(node.get("id", ""))
+            if post_id in seen_ids:
+                continue
+            seen_ids.add(post_id)
+            yield node, refs
+
+
+def _topic_names(post, refs):
+    """Topic names from either a connection ({edges: [{node}]}) or a plain list"""
+    topics = _resolve(post.get("topics"), refs)
+    if isinstance(topics, dict):
+        topics = [edge.get("node") for edge in topics.get("edges", [])]
+    names = []
+    for topic in topics or []:
+        topic = _resolve(topic, refs)
+        if isinstance(topic, dict) and topic.get("name"):
+            names.append(topic["name"])
+    return names
+
+
+def _image_url(post, refs):
+    """Thumbnail URL from a thumbnail object or a bare imgix uuid"""
+    thumbnail = _resolve(post.get("thumbnail"), refs)
+    if isinstance(thumbnail, dict) and thumbnail.get("url"):
+        return thumbnail["url"]
+    uuid = post.get("thumbnailImageUuid")
+    return f"https://ph-files.imgix.net/{uuid}" if uuid else ""
+
+
+def listing_record(post, refs):
+    """Convert a Post node into the listing fields produced by the DOM card extractor"""
+    slug = post.get("slug") or ""
+    url = post.get("url") or (f"{BASE_URL}/posts/{slug}" if slug else "")
+    if url.startswith("/"):
+        url = f"{BASE_URL}{url}"
+    votes = post.get("votesCount", post.get("latestScore", 0))
+    return {
+        "name": post.get("name", ""),
+        "tagline": post.get("tagline", ""),
+        "url": url,
+        "post_id": str(post.get("id", "")),
+        "image_url": _image_url(post, refs),
+        "topics": _topic_names(post, refs),
+        "upvotes": str(votes if votes is not None else 0),
+    }
+
+
+def extract_listing(html):
+    """Return listing records for every post embedded in a homepage's state (possibly empty)"""
+    try:
+        return [listing_record(post, refs) for post, refs in iter_posts(html)]
+    except Exception as e:
+        logger.warning(f"Failed to extract listing from embedded state: {e}")
+        return []
+
+
+def _link_urls(links, refs):
+    """URLs from a list of link objects ({url: ...}) or plain strings"""
+    urls = []
+    for link in _resolve(links, refs) or []:
+        link = _resolve(link, refs)
+        if isinstance(link, str):
+            urls.append(link)
+        elif isinstance(link, dict) and link.get("url"):
+            urls.append(link["url"])
+    return urls
+
+
+def extract_product_page(html, product_url=""):
+    """Return {"website_url", "hrefs"} for the post on a product page, or None if its post state is not found.
+
+    hrefs holds the product's own links plus its makers' websites and social profiles,
+    ready for the same social/email classification as anchors scraped from the DOM.
+    """
+    slug = product_url.rstrip("/").split("?")[0].rsplit("/", 1)[-1] if product_url else ""
+    try:
+        posts = list(iter_posts(html))
+    except Exception as e:
+        logger.warning(f"Failed to extract product page state: {e}")
+        return None
+    if not posts:
+        return None
+    if slug:
+        # Related and "also launched" posts share the page state; never take one of those
+        post, refs = next(((p, r) for p, r in posts if p.get("slug") == slug), (None, None))
+        if post is None:
+            return None
+    else:
+        post, refs = posts[0]
+    product = _resolve(post.get("product"), refs) or {}
+    website = post.get("website") or post.get("websiteUrl") or product.get("websiteUrl") or ""
+    hrefs = _link_urls(post.get("links"), refs) + _link_urls(product.get("links"), refs)
+    for maker in _resolve(post.get("makers"), refs) or []:
+        maker = _resolve(maker, refs)
+        if not isinstance(maker, dict):
+            continue
+        if maker.get("twitterUsername"):
+            hrefs.append(f"https://x.com/{maker['twitterUsername']}")
+        if maker.get("websiteUrl"):
+            hrefs.append(maker["websiteUrl"])
+        hrefs.extend(_link_urls(maker.get("links"), refs))
+    if website.startswith("/"):
+        website = f"{BASE_URL}{website}"
+    return {"website_url": website, "hrefs": hrefs}
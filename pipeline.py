@@ -0,0 +1,99 @@
+import time
+import queue
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class Stage:
+    """One pipeline step: `func(item)` returns the item for the next stage, or None to drop it"""
+
+    def __init__(self, name, func, workers=1, queue_size=20):
+        self.name = name
+        self.func = func
+        self.workers = max(1, int(workers))
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.stats = {"processed": 0, "dropped": 0, "errors": 0, "busy_seconds": 0.0, "max_queued": 0}
+        self._remaining = self.workers
+        self._lock = threading.Lock()
+
+
+class Pipeline:
+    """Stages connected by bounded queues, each stage with its own worker threads.
+
+    Items flow from a source iterable through the stages in order as soon as each stage
+    finishes with them, so a slow stage only holds back items behind it. A full queue
+    blocks the upstream stage (backpressure) instead of buffering the whole run in memory.
+    """
+
+    def __init__(self, stages):
+        self.stages = stages
+        self.results = []
+
+    def _put(self, index, item):
+        """Hand an item to stage `index`, or collect it if it came out of the last stage"""
+        if index == len(self.stages):
+            self.results.append(item)
+            return
+        stage = self.stages[index]
+        stage.queue.put(item)
+        depth = stage.queue.qsize()
+        if depth > stage.stats["max_queued"]:
+            stage.stats["max_queued"] = depth
+
+    def _worker(self, index):
+        """Process items for stage `index` until the upstream stage signals it is done"""
+        stage = self.stages[index]
+        while True:
+            item = stage.queue.get()
+            if item is _DONE:
+                break
+            started = time.perf_counter()
+            try:
+                output = stage.func(item)
+            except Exception as e:
+                output = None
+                with stage._lock:
+                    stage.stats["errors"] += 1
+                logger.warning(f"Pipeline stage '{stage.name}' failed on an item: {e}")
+            with stage._lock:
+                stage.stats["busy_seconds"] += time.perf_counter() - started
+                stage.stats["processed" if output is not None else "dropped"] += 1
+            if output is not None:
+                self._put(index + 1, output)
+        # The last worker of a stage to finish closes the next stage
+        with stage._lock:
+            stage._remaining -= 1
+            last = stage._remaining == 0
+        if last and index + 1 < len(self.stages):
+            for _ in range(self.stages[index + 1].workers):
+                self.stages[index + 1].queue.put(_DONE)
+
+    def run(self, source):
+        """Feed every item from source through the stages and return the final outputs"""
+        threads = []
+        for index, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                thread = threading.Thread(target=self._worker, args=(index,), name=f"{stage.name}-{n + 1}", daemon=True)
+                thread.start()
+                threads.append(thread)
+        try:
+            for item in source:
+                self._put(0, item)
+        finally:
+            for _ in range(self.stages[0].workers):
+                self.stages[0].queue.put(_DONE)
+            for thread in threads:
+                thread.join()
+        return self.results
+
+    def log_summary(self):
+        """Log throughput and queueing for each stage"""
+        for stage in self.stages:
+            stats = stage.stats
+            logger.info(f"Stage '{stage.name}' ({stage.workers} workers): {stats['processed']} passed, "
+                        f"{stats['dropped']} dropped, {stats['errors']} errors, busy {stats['busy_seconds']:.1f}s, "
+                        f"max queued {stats['max_queued']}")
@@ -0,0 +1,154 @@
+"""
+Durable SQLite record of every product the scraper has seen and how far it got.
+
+One row per product, keyed by its Product Hunt URL and indexed by post id, holds the
+latest record plus a status and timestamp per enrichment stage (ph_page, website,
+delivery). Resume is a single indexed lookup per listed product, works across midnight
+and lets products fully enriched and delivered on an earlier day be skipped. The database runs in
+WAL mode so pipeline workers can write while the listing keeps reading.
+"""
+
+import csv
+import json
+import time
+import sqlite3
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("ph_page", "website", "delivery")
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    url TEXT PRIMARY KEY,
+    post_id TEXT,
+    first_listed_on TEXT NOT NULL,
+    last_listed_on TEXT NOT NULL,
+    data TEXT NOT NULL,
+    ph_page_status TEXT,
+    ph_page_at REAL,
+    website_status TEXT,
+    website_at REAL,
+    delivery_status TEXT,
+    delivery_at REAL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS products_post_id ON products (post_id);
+CREATE INDEX IF NOT EXISTS products_last_listed_on ON products (last_listed_on);
+"""
+
+
+def _encode(record):
+    """JSON for a record; listing records are read-only mappings, which json cannot encode directly"""
+    return json.dumps(dict(record), ensure_ascii=False)
+
+
+class ProductStore:
+    """Product rows with per-stage status, safe to share between pipeline worker threads"""
+
+    def __init__(self, path="producthunt_products.sqlite3"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # WAL keeps committed transactions durable across crashes at NORMAL, without an fsync per write
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self.created = self._db.execute("SELECT 1 FROM sqlite_master WHERE name = 'products'").fetchone() is None
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+        self.stats = {"new": 0, "resumed": 0, "skipped": 0}
+
+    def _find(self, url, post_id):
+        if post_id:
+            row = self._db.execute("SELECT * FROM products WHERE post_id = ?", (post_id,)).fetchone()
+            if row is not None:
+                return row
+        return self._db.execute("SELECT * FROM products WHERE url = ?", (url,)).fetchone()
+
+    @staticmethod
+    def complete(row):
+        """Whether every stage of a stored row succeeded; a failed stage is redone on resume"""
+        return all(row[f"{stage}_status"] == DONE for stage in STAGES)
+
+    def get(self, url, post_id=None):
+        """Stored row for a product as a dict (data decoded), or None"""
+        with self._lock:
+            row = self._find(url, post_id)
+        if row is None:
+            return None
+        row = dict(row)
+        row["data"] = json.loads(row["data"])
+        return row
+
+    def seen(self, record, listed_on):
+        """Record a listing sighting of `record` on date `listed_on` and return its stored row (None if new).
+
+        Complete rows count as skipped, other known rows as resumed.
+        """
+        url, post_id = record.get("url"), record.get("post_id") or None
+        now = time.time()
+        with self._lock:
+            row = self._find(url, post_id)
+            if row is None:
+                self._db.execute("INSERT INTO products (url, post_id, first_listed_on, last_listed_on, data, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                                 (url, post_id, listed_on, listed_on, _encode(record), now))
+                self._db.commit()
+                self.stats["new"] += 1
+                return None
+            self._db.execute("UPDATE products SET last_listed_on = ?, post_id = COALESCE(post_id, ?), updated_at = ? WHERE url = ?",
+                             (listed_on, post_id, now, row["url"]))
+            self._db.commit()
+            self.stats["skipped" if self.complete(row) else "resumed"] += 1
+        row = dict(row)
+        row["data"] = json.loads(row["data"])
+        return row
+
+    def mark(self, record, stage, status):
+        """Set a stage's status for a product (matched by url or post id) and store `record` as its latest data"""
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage {stage!r}")
+        now = time.time()
+        with self._lock:
+            try:
+                self._db.execute(f"UPDATE products SET {stage}_status = ?, {stage}_at = ?, data = ?, updated_at = ? WHERE url = ? OR post_id = ?",
+                                 (status, now, _encode(record), now, record.get("url"), record.get("post_id") or None))
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to record {stage}={status} for {record.get('url')}: {e}")
+
+    def products(self, listed_on):
+        """Latest records of the products listed on a date, in first-seen order"""
+        with self._lock:
+            rows = self._db.execute("SELECT data FROM products WHERE last_listed_on = ? ORDER BY rowid", (listed_on,)).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def import_csv(self, filename, listed_on):
+        """Load rows of a pre-store daily CSV as delivered products; returns how many were new"""
+        imported = 0
+        now = time.time()
+        with open(filename, "r", encoding="utf-8") as f, self._lock:
+            for row in csv.DictReader(f):
+                if not row.get("url"):
+                    continue
+                cursor = self._db.execute(
+                    "INSERT OR IGNORE INTO products (url, post_id, first_listed_on, last_listed_on, data, ph_page_status, ph_page_at, "
+                    "website_status, website_at, delivery_status, delivery_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (row["url"], row.get("post_id") or None, listed_on, listed_on, json.dumps(row, ensure_ascii=False),
+                     DONE, now, DONE, now, DONE, now, now))
+                imported += cursor.rowcount
+            self._db.commit()
+        return imported
+
+    def log_summary(self):
+        """Log how many listed products were new, resumed or skipped this run"""
+        s = self.stats
+        logger.info(f"Product store: {s['new']} new products, {s['resumed']} resumed mid-enrichment, "
+                    f"{s['skipped']} skipped as already delivered")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,129 @@
+import os
+import time
+import logging
+from datetime import datetime, timedelta
+import pytz
+import requests
+
+logger = logging.getLogger(__name__)
+
+API_URL = "https://api.producthunt.com/v2/api/graphql"
+PRODUCTHUNT_TZ = pytz.timezone("America/Los_Angeles")
+
+# Only the fields the listing stage emits
+POSTS_QUERY = """
+query DailyPosts($postedAfter: DateTime!, $postedBefore: DateTime!, $first: Int!, $after: String) {
+  posts(postedAfter: $postedAfter, postedBefore: $postedBefore, first: $first, after: $after, order: RANKING) {
+    pageInfo { hasNextPage endCursor }
+    edges {
+      node {
+        id
+        name
+        slug
+        tagline
+        votesCount
+        thumbnail { url }
+        topics { edges { node { name } } }
+      }
+    }
+  }
+}
+"""
+
+
+class ProductHuntAPI:
+    """Client for Product Hunt's GraphQL API v2, used when the browser path is blocked or too slow.
+
+    Pulls one Product Hunt day (midnight to midnight Pacific) of posts with cursor
+    pagination and converts each post to the same listing record the homepage scraper
+    produces. Needs a developer token, passed in or read from PRODUCTHUNT_API_TOKEN.
+    """
+
+    def __init__(self, token=None, api_url=API_URL, page_size=20, timeout=30, max_retries=3):
+        self.token = token or os.environ.get("PRODUCTHUNT_API_TOKEN")
+        if not self.token:
+            raise ValueError("A Product Hunt API token is required (set PRODUCTHUNT_API_TOKEN)")
+        self.api_url = api_url
+        self.page_size = page_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        })
+        self.stats = {"requests": 0, "posts": 0, "seconds": 0.0}
+
+    def _query(self, query, variables):
+        """POST a GraphQL query, waiting out rate limits; returns the data object"""
+        for attempt in range(self.max_retries + 1):
+            started = time.perf_counter()
+            resp = self.session.post(self.api_url, json={"query": query, "variables": variables}, timeout=self.timeout)
+            self.stats["requests"] += 1
+            self.stats["seconds"] += time.perf_counter() - started
+            if resp.status_code == 429 and attempt < self.max_retries:
+                # X-Rate-Limit-Reset is the number of seconds until the quota resets
+                wait = min(900, int(resp.headers.get("X-Rate-Limit-Reset", "60") or 60))
+                logger.warning(f"Product Hunt API rate limited, waiting {wait} seconds")
+                time.sleep(wait)
+                continue
+            resp.raise_for_status()
+            payload = resp.json()
+            if payload.get("errors"):
+                raise Exception(f"Product Hunt API error: {payload['errors'][0].get('message', payload['errors'])}")
+            return payload["data"]
+        raise Exception("Product Hunt API rate limit retries exhausted")
+
+    def _day_bounds(self, day=None):
+        """ISO timestamps for the start and end of a Product Hunt (Pacific) day"""
+        if day is None:
+            day = datetime.now(PRODUCTHUNT_TZ).date()
+        start = PRODUCTHUNT_TZ.localize(datetime(day.year, day.month, day.day))
+        end = PRODUCTHUNT_TZ.localize(datetime(day.year, day.month, day.day) + timedelta(days=1))
+        return start.isoformat(), end.isoformat()
+
+    def iter_posts(self, day=None):
+        """Yield listing records for every post launched on `day` (default: today), page by page"""
+        posted_after, posted_before = self._day_bounds(day)
+        cursor = None
+        while True:
+            data = self._query(POSTS_QUERY, {
+                "postedAfter": posted_after,
+                "postedBefore": posted_before,
+                "first": self.page_size,
+                "after": cursor,
+            })
+            posts = data["posts"]
+            for edge in posts["edges"]:
+                self.stats["posts"] += 1
+                yield self._listing_record(edge["node"])
+            page_info = posts["pageInfo"]
+            if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+                break
+            cursor = page_info["endCursor"]
+
+    def _listing_record(self, node):
+        """Convert an API post node into the homepage listing record schema"""
+        thumbnail = node.get("thumbnail") or {}
+        topics = (node.get("topics") or {}).get("edges", [])
+        return {
+            "name": node.get("name", ""),
+            "tagline": node.get("tagline", ""),
+            # The API's own url carries utm parameters, the slug gives the canonical page
+            "url": f"https://www.producthunt.com/posts/{node.get('slug', '')}",
+            "post_id": str(node.get("id", "")),
+            "image_url": thumbnail.get("url") or "",
+            "topics": [edge["node"]["name"] for edge in topics if edge.get("node")],
+            "upvotes": str(node.get("votesCount") or 0),
+        }
+
+    def log_summary(self):
+        """Log request and post throughput for the run"""
+        seconds = self.stats["seconds"] or 1e-9
+        logger.info(f"Product Hunt API: {self.stats['requests']} requests, {self.stats['posts']} posts in {self.stats['seconds']:.1f}s "
+                    f"({self.stats['requests'] / seconds:.2f} requests/sec, {self.stats['posts'] / seconds:.1f} posts/sec)")
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
@@ -5,30 +5,108 @@ import os
 from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import logging
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import argparse
+from types import MappingProxyType
 from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 import undetected_chromedriver as uc
-import random
 import warnings
 warnings.filterwarnings("ignore", message="could not detect version_main")
 import requests
+from browser_pool import BrowserPool, TransferStats
+from profile_pool import ProfilePool, FirstPageStats
+from resource_policy import ResourcePolicy
+from http_fetcher import HttpFetcher, CHALLENGE_MARKERS, browser_fallback_reason
+from page_scripts import DRAIN_CARDS_JS, HARVEST_LINKS_JS, HARVEST_TEXT_LIMIT
+from wait_policy import WaitPolicy, PolitenessPolicy
+from page_state import extract_listing, extract_product_page
+from producthunt_api import ProductHuntAPI
+from rate_limiter import HostRateLimiter
+from concurrency import AdaptiveConcurrency, MemoryAdmission, block_signal
+from pipeline import Pipeline, Stage
+from link_classifier import LinkClassifier, LINK_FIELDS
+from contact_scanner import ContactScanner, scan_html
+from contact_crawl import ContactCrawler
+from domain_cache import DomainCache, DAY
+from redirect_resolver import RedirectResolver, is_redirect_link
+from product_store import ProductStore, DONE, FAILED
+
+# Fields whose change makes an already-delivered product worth sending to the webhook again
+DELIVERED_FIELDS = ["website_url"] + [f"{prefix}_{field}" for prefix in ("ph", "site") for field in LINK_FIELDS]
 
 class ProductHuntScraper:
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, pool_size=4, politeness_delay=(1.0, 3.0), rate_limits=None, stage_workers=None,
+                 source="browser", api_token=None, profile_dir=None, cache_dir=None, resource_policy=None,
+                 contact_crawl=False, domain_cache=None, store_path="producthunt_products.sqlite3"):
         self.base_url = "https://www.producthunt.com"
         self.today_url = self.base_url  # Use homepage for today's products
         self.products = []
-        self.request_count = 0
-        self.last_request_time = 0
+        self.waits = WaitPolicy()
+        # Jitter between page visits, configured independently of readiness waits
+        self.politeness = PolitenessPolicy(*politeness_delay)
+        # Shared per-host token buckets for producthunt.com and each maker domain
+        self.rate_limiter = HostRateLimiter(rate_limits)
+        self.headless = headless
+        # Listing source: "browser" scrapes the homepage, "api" uses the GraphQL API v2
+        self.source = source
+        self.api_token = api_token
+        self.api_client = None
+        self.driver = None
+        # Persistent Chrome profiles (one per pooled driver plus the homepage driver) keep
+        # bot-check clearance between launches; None launches every driver on a temp profile
+        self.profiles = ProfilePool(profile_dir, size=pool_size + 1) if profile_dir else None
+        self.homepage_profile = None
+        self.homepage_profile_reused = False
+        self.first_page_stats = FirstPageStats()
+        # Shared on-disk HTTP cache root; Chrome cannot share one cache directory between
+        # running processes, so each driver locks its own slot under it
+        self.cache_slots = ProfilePool(cache_dir, size=pool_size + 1, prefix="cache") if cache_dir else None
+        self.homepage_cache = None
+        self.transfer_stats = TransferStats()
+        # Images, media, fonts, analytics, ads and chat widgets are blocked in enrichment
+        # browsers; pass a ResourcePolicy to change the lists, or False to load everything
+        self.resource_policy = ResourcePolicy() if resource_policy is None else resource_policy or None
         self.setup_logging()
-        self.setup_driver(headless)
+        if source == "browser":
+            self.setup_driver(headless)
+        # Warm drivers shared by product page and external website visits; pool_size is the
+        # worker ceiling, actual parallelism is admitted by free memory and block signals
+        self.pool_size = pool_size
+        # Per-stage worker overrides for the enrichment pipeline, e.g. {"website": 8}
+        self.stage_workers = stage_workers or {}
+        self.browser_pool = BrowserPool(size=pool_size, headless=headless, profiles=self.profiles, first_page_stats=self.first_page_stats,
+                                        cache_slots=self.cache_slots, transfer_stats=self.transfer_stats,
+                                        resource_policy=self.resource_policy)
+        self.memory_admission = MemoryAdmission(max_workers=pool_size)
+        # Starts at one worker and grows towards pool_size while pages load cleanly
+        self.concurrency = AdaptiveConcurrency(initial=1, max_limit=pool_size, admission=self.memory_admission)
+        self.http_fetcher = HttpFetcher()
+        # Product pages are fetched over HTTP with the homepage browser's cookies and user
+        # agent, falling back to a pooled browser when Product Hunt serves a challenge
+        self.ph_http = HttpFetcher(pool_size=pool_size)
+        self.stats_lock = threading.Lock()
+        self.website_fetch_stats = {"http": 0, "browser": 0, "failed": 0}
+        self.product_page_fetch_stats = {"http": 0, "browser": 0, "failed": 0}
+        # Host-based social/email link classification shared by both link scrapers
+        self.link_classifier = LinkClassifier()
+        # Optional shallow crawl of /contact, /about, /imprint... when a maker site's landing
+        # page has no email, bounded per domain so it never dominates run time
+        self.contact_crawler = ContactCrawler(self.http_fetcher, self.rate_limiter, self.link_classifier) if contact_crawl else None
+        # Cross-run cache of site_* fields by registrable domain: a DomainCache, or a path to
+        # its SQLite file; None visits every website
+        self.domain_cache = DomainCache(domain_cache) if isinstance(domain_cache, str) else domain_cache
+        # Per-product stage status for resume across runs and days, opened on the first run
+        self.store_path = store_path
+        self.store = None
+        # Product Hunt /r/ redirect links are followed over HTTP with the homepage browser's
+        # cookies; resolutions are kept alongside the domain cache so later days reuse them
+        self.redirect_resolver = RedirectResolver(self.ph_http, self.rate_limiter, clean=self.clean_url,
+                                                  path=self.domain_cache.path if self.domain_cache else None)
     
     def setup_logging(self):
         """Setup logging configuration"""
@@ -56,42 +134,31 @@ class ProductHuntScraper:
         # Server optimization options
         chrome_options.add_argument("--disable-extensions")
         chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")  # Don't load images to save memory
         chrome_options.add_argument("--disable-web-security")
         chrome_options.add_argument("--disable-features=VizDisplayCompositor")
         chrome_options.add_argument("--memory-pressure-off")
         chrome_options.add_argument("--max_old_space_size=1024")  # 1GB for 2GB server
+        # CDP network events for readiness waits (WaitPolicy.wait_for_network_idle)
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
         
+        if self.cache_slots:
+            self.homepage_cache = self.cache_slots.acquire()[0]
+            chrome_options.add_argument(f"--disk-cache-dir={self.homepage_cache}")
+        if self.profiles:
+            self.homepage_profile, self.homepage_profile_reused = self.profiles.acquire()
+            self.logger.info(f"Homepage driver using {'reused' if self.homepage_profile_reused else 'fresh'} profile {self.homepage_profile}")
         try:
-            self.driver = uc.Chrome(options=chrome_options, headless=headless)
+            self.driver = uc.Chrome(options=chrome_options, headless=headless, user_data_dir=self.homepage_profile)
             # Set longer timeouts for server environments
             self.driver.set_page_load_timeout(60)
-            self.driver.implicitly_wait(10)
+            # No implicit wait: absent optional elements must fail fast, required ones use WaitPolicy
+            self.driver.implicitly_wait(0)
             self.logger.info("Undetected Chrome WebDriver initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize undetected Chrome WebDriver: {e}")
+            self._release_homepage_dirs()
             raise
     
-    def rate_limit_delay(self):
-        """Add rate limiting delay between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        # Ensure minimum 2 seconds between requests
-        min_delay = 2
-        if time_since_last < min_delay:
-            sleep_time = min_delay - time_since_last
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
-        self.request_count += 1
-        
-        # Add exponential backoff every 10 requests
-        if self.request_count % 10 == 0:
-            backoff_time = min(30, 2 ** (self.request_count // 10))  # Max 30 seconds
-            self.logger.info(f"Rate limiting: waiting {backoff_time} seconds after {self.request_count} requests")
-            time.sleep(backoff_time)
-    
     def clean_url(self, url):
         """Remove ?ref=producthunt and similar tracking params from a URL."""
         if not url or not isinstance(url, str):
@@ -121,154 +188,239 @@ class ProductHuntScraper:
         return ph_val
 
     def get_todays_products(self):
-        """Scrape all products from today's ProductHunt homepage and their website/social/email links in parallel, resuming from CSV if present, and send each to a webhook."""
+        """Scrape all products from today's ProductHunt homepage and stream them through enrichment stages (PH page, website, merge, webhook delivery), resuming from the product store."""
         try:
-            self.logger.info(f"Starting to scrape products from: {self.today_url}")
-            # Resume logic: read existing CSV and collect already-scraped URLs and rows
+            self.logger.info(f"Starting to scrape products from: {self.today_url if self.source == 'browser' else 'Product Hunt API'}")
+            listed_on = datetime.now().strftime('%Y-%m-%d')
+            if self.store is None:
+                self.store = ProductStore(self.store_path)
+            # One-time migration: a store created next to today's CSV from an older run starts from its rows
             filename = f"producthunt_products_{datetime.now().strftime('%Y%m%d')}.csv"
-            already_scraped_urls = set()
-            existing_products = []
-            if os.path.exists(filename):
-                with open(filename, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if 'url' in row and row['url']:
-                            already_scraped_urls.add(row['url'])
-                        existing_products.append(row)
-                self.logger.info(f"Loaded {len(already_scraped_urls)} already-scraped products from CSV.")
-            
-            # Load the homepage with retry logic
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    self.rate_limit_delay()
-                    self.driver.get(self.today_url)
-                    self.logger.info(f"Page loaded successfully (attempt {attempt + 1})")
-                    break
-                except Exception as e:
-                    self.logger.warning(f"Failed to load page (attempt {attempt + 1}): {e}")
-                    if attempt == max_retries - 1:
-                        raise
-                    time.sleep(2)
-            
-            time.sleep(5)  # Longer wait for page to load
-            self.logger.info(f"Page title: {self.driver.title}")
-            
-            # Click the 'See all of today's products' button if present
-            try:
-                see_all_btn = self.driver.find_element(By.XPATH, "//span[contains(text(), \"See all of today's products\")]")
-                self.logger.info("Found 'See all of today's products' button, clicking it...")
-                see_all_btn.click()
-                time.sleep(2)  # Wait for products to load
-            except Exception as e:
-                self.logger.info("'See all of today's products' button not found or already expanded.")
+            if self.store.created and os.path.exists(filename):
+                self.logger.info(f"Imported {self.store.import_csv(filename, listed_on)} already-scraped products from {filename}")
+            # Products whose website stage finished in an earlier, interrupted run
+            websites_done = set()
+            # Stored data of products already delivered, by URL, so a retried stage only
+            # re-sends them to the webhook when it found something new
+            delivered = {}
             
-            # Scroll to load all products via infinite scroll
-            self._scroll_to_load_all_products()
-            
-            # Use the new selector for product listings
-            product_elements = self.driver.find_elements(By.CSS_SELECTOR, "section[data-test^='post-item-']")
-            self.logger.info(f"Found {len(product_elements)} product elements with new selector.")
-            
-            if not product_elements:
-                # Take a screenshot for debugging
-                screenshot_path = f"producthunt_debug_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                self.driver.save_screenshot(screenshot_path)
-                self.logger.error(f"No product elements found. Screenshot saved as: {screenshot_path}")
-                self.logger.error(f"Page source preview: {self.driver.page_source[:500]}...")
-                raise Exception("No product elements found on the page")
+            # Products are emitted as they are discovered, so enrichment starts on the first
+            # ones while the rest of the listing is still loading
+            listing = self._api_listing() if self.source == "api" else self._browser_listing()
+
+            # Streaming pipeline: each stage hands a product on as soon as it is done with it,
+            # so slow maker websites never hold up Product Hunt page fetching or delivery
+            webhook_url = "https://services.leadconnectorhq.com/hooks/knCxBYvGSI3aHQOSBd35/webhook-trigger/28e182ff-acc2-4d86-8ca6-e10990c103ee"
+            workers = {"ph_page": self.pool_size, "website": self.pool_size * 2, "merge": 1, "delivery": 2}
+            workers.update(self.stage_workers)
+
+            def ph_page_stage(record):
+                # One indexed lookup: skip products fully enriched and delivered on any earlier
+                # run or day, and pick up the others after their last successful stage
+                stored = self.store.seen(record, listed_on)
+                if stored and ProductStore.complete(stored):
+                    self.logger.info(f"Skipping already-delivered product: {record.get('url')}")
+                    return None
+                if stored and stored["delivery_status"] == DONE:
+                    delivered[self.clean_url(record.get("url"))] = stored["data"]
+                # Listing records are read-only, enrichment works on a copy
+                product_data = dict(record, topics=list(record["topics"]))
+                if stored and stored["ph_page_status"] == DONE:
+                    product_data = dict(stored["data"], **product_data)
+                    if stored["website_status"] == DONE:
+                        websites_done.add(record.get("url"))
+                    return product_data
+                # Politeness jitter before taking a slot, so a sleeping worker never holds one
+                self.politeness.pause()
+                # Concurrency and delay adapt to block/challenge signals (AIMD)
+                meta = {}
+                with self.concurrency.slot():
+                    # Scrape ProductHunt product page for website, socials, email
+                    product_data.update(self._get_links_from_product_page_separate_driver(product_data.get("url"), meta))
+                self.store.mark(product_data, "ph_page", FAILED if meta.get("path") == "failed" else DONE)
+                return product_data
+
+            def website_stage(product_data):
+                if product_data.get("url") in websites_done:
+                    return product_data
+                # The website stage works on the maker's canonical URL, never the redirect link;
+                # direct links to the maker's site only need their tracking params removed
+                website_url = product_data.get("website_url")
+                if is_redirect_link(website_url):
+                    product_data["website_url"] = self.redirect_resolver.resolve(website_url)
+                else:
+                    product_data["website_url"] = self.clean_url(website_url)
+                # Scrape the external website for socials, email
+                meta = {}
+                product_data.update(self._get_website_links(product_data.get("website_url"), meta))
+                self.store.mark(product_data, "website", FAILED if meta.get("path") == "failed" else DONE)
+                return product_data
 
-            def scrape_product(element):
+            def merge_stage(data):
+                # Clean all URLs
+                social_keys = [f"{prefix}_{field}" for prefix in ("ph", "site") for field in LINK_FIELDS if field != "email"]
+                for key in ["url", "website_url"] + social_keys:
+                    if key in data and data[key]:
+                        data[key] = self.clean_url(data[key])
+                # Combine fields for webhook
+                combined = dict(data)
+                for field in LINK_FIELDS:
+                    combined[field] = self.combine_fields(data.get(f'ph_{field}'), data.get(f'site_{field}'))
+                return combined
+
+            def delivery_stage(combined):
+                previous = delivered.get(combined.get("url"))
+                if previous is not None and all(previous.get(key) == combined.get(key) for key in DELIVERED_FIELDS):
+                    self.logger.info(f"Not re-sending unchanged product to webhook: {combined.get('url')}")
+                    self.store.mark(combined, "delivery", DONE)
+                    return combined
+                # Send to webhook; failed deliveries are retried on the next run
+                status = FAILED
                 try:
-                    product_data = self._extract_product_data_new(element)
-                    if product_data:
-                        # Skip if already scraped
-                        if product_data.get('url') in already_scraped_urls:
-                            self.logger.info(f"Skipping already-scraped product: {product_data.get('url')}")
-                            return None
-                        # Step 1: Scrape ProductHunt product page for website, socials, email
-                        ph_links = self._get_links_from_product_page_separate_driver(product_data.get("url"))
-                        product_data.update(ph_links)
-                        # Step 2: Scrape the external website for socials, email
-                        site_links = self._get_links_from_external_website(product_data.get("website_url"))
-                        product_data.update(site_links)
-                        # Clean all URLs
-                        for key in ["url", "website_url", "ph_instagram", "ph_linkedin_company", "ph_linkedin_personal", "ph_x", "ph_facebook", "site_instagram", "site_linkedin_company", "site_linkedin_personal", "site_x", "site_facebook"]:
-                            if key in product_data and product_data[key]:
-                                product_data[key] = self.clean_url(product_data[key])
-                        return product_data
+                    resp = requests.post(webhook_url, json=combined, timeout=15)
+                    if resp.status_code == 200:
+                        status = DONE
+                        self.logger.info(f"Sent product to webhook: {combined.get('url')}")
+                    else:
+                        self.logger.warning(f"Webhook failed for {combined.get('url')}: {resp.status_code}")
                 except Exception as e:
-                    self.logger.warning(f"Failed to extract product data: {e}")
-                    return None
+                    self.logger.warning(f"Webhook error for {combined.get('url')}: {e}")
+                self.store.mark(combined, "delivery", status)
+                return combined
 
-            # Process products in batches to avoid memory issues on server
-            batch_size = 30  # Process 30 products at a time (2GB server)
-            results = []
-            webhook_url = "https://services.leadconnectorhq.com/hooks/knCxBYvGSI3aHQOSBd35/webhook-trigger/28e182ff-acc2-4d86-8ca6-e10990c103ee"
-            
-            for i in range(0, len(product_elements), batch_size):
-                batch = product_elements[i:i + batch_size]
-                self.logger.info(f"Processing batch {i//batch_size + 1}/{(len(product_elements) + batch_size - 1)//batch_size} ({len(batch)} products)")
-                
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    future_to_element = {executor.submit(scrape_product, el): el for el in batch}
-                    for future in as_completed(future_to_element):
-                        data = future.result()
-                        if data:
-                            results.append(data)
-                            # Combine fields for webhook
-                            combined = dict(data)
-                            combined['instagram'] = self.combine_fields(data.get('ph_instagram'), data.get('site_instagram'))
-                            combined['linkedin_company'] = self.combine_fields(data.get('ph_linkedin_company'), data.get('site_linkedin_company'))
-                            combined['linkedin_personal'] = self.combine_fields(data.get('ph_linkedin_personal'), data.get('site_linkedin_personal'))
-                            combined['x'] = self.combine_fields(data.get('ph_x'), data.get('site_x'))
-                            combined['facebook'] = self.combine_fields(data.get('ph_facebook'), data.get('site_facebook'))
-                            combined['email'] = self.combine_fields(data.get('ph_email'), data.get('site_email'))
-                            # Send to webhook
-                            try:
-                                resp = requests.post(webhook_url, json=combined, timeout=15)
-                                if resp.status_code == 200:
-                                    self.logger.info(f"Sent product to webhook: {data.get('url')}")
-                                else:
-                                    self.logger.warning(f"Webhook failed for {data.get('url')}: {resp.status_code}")
-                            except Exception as e:
-                                self.logger.warning(f"Webhook error for {data.get('url')}: {e}")
-                            # Add to existing products for CSV
-                            existing_products.append(combined)
-                
-                # Memory cleanup between batches
-                self.logger.info(f"Completed batch {i//batch_size + 1}, processed {len(results)} total products")
-                time.sleep(10)  # Longer pause between batches to avoid rate limiting
-            
-            self.products = existing_products + results
+            pipeline = Pipeline([
+                # Room for the whole listing so scrolling is never blocked by enrichment backpressure
+                Stage("ph_page", ph_page_stage, workers["ph_page"], queue_size=400),
+                Stage("website", website_stage, workers["website"]),
+                Stage("merge", merge_stage, workers["merge"]),
+                Stage("delivery", delivery_stage, workers["delivery"]),
+            ])
+            pipeline.run(listing)
+            pipeline.log_summary()
+
+            # Everything listed today, including products finished by earlier runs, for the JSON/CSV exports
+            self.products = self.store.products(listed_on)
             self.logger.info(f"Successfully processed {len(self.products)} products (webhook mode)")
+            self.waits.log_report()
+            self.concurrency.log_summary()
+            self.first_page_stats.log_summary()
+            self.transfer_stats.log_summary()
+            if self.resource_policy:
+                self.resource_policy.log_summary()
+            if self.contact_crawler:
+                self.contact_crawler.log_summary()
+            if self.domain_cache:
+                self.domain_cache.log_summary()
+            self.redirect_resolver.log_summary()
+            self.store.log_summary()
+            self.logger.info(f"Politeness delay: {self.politeness.total_delay:.1f}s total")
+            self.logger.info(f"Rate limiter: {self.rate_limiter.stats['acquired']} requests, {self.rate_limiter.stats['delayed']} delayed for {self.rate_limiter.stats['wait_seconds']:.1f}s total")
+            self.logger.info(f"External websites served by HTTP: {self.website_fetch_stats['http']}, by browser: {self.website_fetch_stats['browser']}, failed: {self.website_fetch_stats['failed']}")
+            page_stats = self.product_page_fetch_stats
+            page_total = sum(page_stats.values())
+            if page_total:
+                self.logger.info(f"Product pages served by HTTP: {page_stats['http']}, by browser: {page_stats['browser']}, failed: {page_stats['failed']} "
+                                 f"(fast path hit rate {page_stats['http'] / page_total:.0%})")
             return self.products
             
         except Exception as e:
             self.logger.error(f"Error scraping products: {e}")
             raise
     
-    def _scroll_to_load_all_products(self):
-        """Scroll down to load all products via infinite scroll - optimized for server environments"""
+    def _browser_listing(self):
+        """Load today's homepage in the main driver and return a generator of products discovered while scrolling"""
+        if self.driver is None:
+            # The homepage driver is released after each listing, relaunch it for a new run
+            self.setup_driver(self.headless)
+        # Load the homepage with retry logic
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                self.rate_limiter.acquire(self.today_url)
+                started = time.perf_counter()
+                self.driver.get(self.today_url)
+                if attempt == 0:
+                    self.first_page_stats.record(self.homepage_profile_reused,
+                                                 time.perf_counter() - started, block_signal(title=self.driver.title))
+                self.logger.info(f"Page loaded successfully (attempt {attempt + 1})")
+                break
+            except Exception as e:
+                self.logger.warning(f"Failed to load page (attempt {attempt + 1}): {e}")
+                if attempt == max_retries - 1:
+                    raise
+                time.sleep(2)
+        
+        # Wait for the first product cards, then for the page to settle
+        if self.waits.wait_until_ready(self.driver, "section[data-test^='post-item-']", timeout=20):
+            # Product page workers start while the feed is still scrolling, so they need the
+            # clearance cookies now; the copy is refreshed when the driver is released
+            self._share_browser_session(self.driver)
+        else:
+            self.logger.warning("Homepage did not report ready within 20 seconds, continuing")
+        self.logger.info(f"Page title: {self.driver.title}")
+        
+        # Click the 'See all of today's products' button if present
+        see_all_btn = self.waits.find_optional(self.driver, By.XPATH, "//span[contains(text(), \"See all of today's products\")]")
+        if see_all_btn:
+            self.logger.info("Found 'See all of today's products' button, clicking it...")
+            try:
+                see_all_btn.click()
+                self.waits.wait_until_ready(self.driver, timeout=5)  # Wait for products to load
+            except Exception as e:
+                self.logger.warning(f"Failed to click 'See all of today's products' button: {e}")
+        else:
+            self.logger.info("'See all of today's products' button not found or already expanded.")
+        
+        # Products are emitted as they are discovered while scrolling continues, so
+        # enrichment starts on the first cards within seconds of the page loading
+        return self._scroll_and_emit_products()
+
+    def _api_listing(self):
+        """Yield today's products from the Product Hunt GraphQL API as immutable listing records"""
+        if self.api_client is None:
+            self.api_client = ProductHuntAPI(token=self.api_token)
+        seen_ids = set()
+        for record in self.api_client.iter_posts():
+            for product in self._new_product_records([record], seen_ids, datetime.now()):
+                yield product
+        self.logger.info(f"Found {len(seen_ids)} products via the Product Hunt API")
+        self.api_client.log_summary()
+        if not seen_ids:
+            raise Exception("No products returned by the Product Hunt API")
+    
+    def _scroll_and_emit_products(self):
+        """Scroll down through the infinite-scroll feed, yielding each product once as soon as its card appears"""
         self.logger.info("Scrolling to load all products...")
+        seen_ids = set()
+        # Posts shipped in the embedded page state need no DOM work at all
+        embedded = extract_listing(self.driver.page_source)
+        if embedded:
+            self.logger.info(f"Found {len(embedded)} products in the embedded page state")
+        for product in self._new_product_records(embedded, seen_ids, datetime.now()):
+            yield product
+        # Cards already rendered before the first scroll (DOM path for anything not in the state)
+        for product in self._collect_new_products(seen_ids):
+            yield product
         last_height = self.driver.execute_script("return document.body.scrollHeight")
         scroll_attempts = 0
         max_attempts = 15  # Increased for server environments
-        products_before = 0
+        products_before = len(seen_ids)
         
         while scroll_attempts < max_attempts:
             try:
                 # Scroll down in smaller increments for server environments
                 current_height = self.driver.execute_script("return window.pageYOffset")
                 self.driver.execute_script(f"window.scrollTo(0, {current_height + 800});")
-                time.sleep(5)  # Longer wait for server environments and rate limiting
+                # Wait for lazy-loaded products to arrive and render, capped for slow servers
+                self.waits.wait_until_ready(self.driver, timeout=5)
                 
                 # Calculate new scroll height
                 new_height = self.driver.execute_script("return document.body.scrollHeight")
                 
-                # Check current product count
-                product_elements = self.driver.find_elements(By.CSS_SELECTOR, "section[data-test^='post-item-']")
-                current_products = len(product_elements)
+                # Hand newly appeared products to the enrichment pipeline right away
+                for product in self._collect_new_products(seen_ids):
+                    yield product
+                current_products = len(seen_ids)
                 
                 self.logger.info(f"Scroll attempt {scroll_attempts + 1}: {current_products} products loaded")
                 
@@ -287,21 +439,115 @@ class ProductHuntScraper:
                     
                 # Memory management: clear some elements periodically
                 if scroll_attempts % 5 == 0:
-                    self.driver.execute_script("window.gc();")  # Force garbage collection
+                    self.driver.execute_script("if (window.gc) { window.gc(); }")  # Only exposed with --js-flags=--expose-gc
                     
             except Exception as e:
                 self.logger.warning(f"Error during scroll attempt {scroll_attempts + 1}: {e}")
                 scroll_attempts += 1
                 time.sleep(2)
         
-        self.logger.info("Finished scrolling")
+        self.logger.info(f"Finished scrolling, found {len(seen_ids)} products")
+        if not seen_ids:
+            # Take a screenshot for debugging
+            screenshot_path = f"producthunt_debug_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+            self.driver.save_screenshot(screenshot_path)
+            self.logger.error(f"No product elements found. Screenshot saved as: {screenshot_path}")
+            self.logger.error(f"Page source preview: {self.driver.page_source[:500]}...")
+            raise Exception("No product elements found on the page")
+        # Every product is already a plain record, so the homepage browser is no longer needed
+        self._release_homepage_driver()
     
+    def _release_homepage_driver(self):
+        """Quit the homepage driver once the listing is captured, logging Chrome memory before and after"""
+        before = self.memory_admission.snapshot()
+        # Refresh the HTTP fast path's copy of the session with any cookies set while scrolling
+        self._share_browser_session(self.driver)
+        self.transfer_stats.sample(self.driver)
+        try:
+            self.driver.quit()
+        except Exception as e:
+            self.logger.warning(f"Error closing homepage driver: {e}")
+        self.driver = None
+        self._release_homepage_dirs()
+        after = self.memory_admission.snapshot()
+        if before and after:
+            self.logger.info(f"Released homepage driver: Chrome RSS {before[0]:.0f}MB -> {after[0]:.0f}MB, "
+                             f"available memory {before[1]:.0f}MB -> {after[1]:.0f}MB")
+        else:
+            self.logger.info("Released homepage driver")
+    
+    def _release_homepage_dirs(self):
+        """Unlock the homepage driver's persistent profile and cache slot, if it has them"""
+        if self.homepage_profile:
+            self.profiles.release(self.homepage_profile)
+            self.homepage_profile = None
+        if self.homepage_cache:
+            self.cache_slots.release(self.homepage_cache)
+            self.homepage_cache = None
+    
+    def _share_browser_session(self, driver):
+        """Export a driver's Product Hunt cookies and user agent to the HTTP client used for product pages"""
+        try:
+            count = self.ph_http.adopt_browser_session(driver)
+            self.logger.info(f"Shared {count} Product Hunt cookies with the HTTP product page client")
+        except Exception as e:
+            self.logger.warning(f"Could not export browser cookies: {e}")
+    
+    def _collect_new_products(self, seen_ids):
+        """Return products captured since the last call whose post id has not been emitted yet, adding them to seen_ids"""
+        # Cards are captured in-page as they mount; fall back to per-element extraction if the script fails
+        products = self._drain_captured_products()
+        if products is None:
+            elements = self.waits.find_all(self.driver, By.CSS_SELECTOR, "section[data-test^='post-item-']")
+            products = []
+            for el in elements:
+                if (el.get_attribute("data-test") or "").replace("post-item-", "") not in seen_ids:
+                    products.append(self._extract_product_data_new(el))
+        return self._new_product_records(products, seen_ids)
+    
+    def _new_product_records(self, products, seen_ids, scraped_at=None):
+        """Return immutable records for products whose post id is not in seen_ids, adding them to it"""
+        new_products = []
+        for product in products:
+            key = product and (product.get("post_id") or product.get("url"))
+            if key and key not in seen_ids:
+                seen_ids.add(key)
+                if scraped_at:
+                    product = dict(product, scraped_at=scraped_at.isoformat(), date=scraped_at.strftime("%Y-%m-%d"))
+                # Snapshot to an immutable plain record: no WebElement handles outlive the listing
+                new_products.append(MappingProxyType(dict(product, topics=tuple(product.get("topics") or ()))))
+        return new_products
+    
+    def _drain_captured_products(self):
+        """Drain the in-page MutationObserver buffer of newly mounted cards; returns None if the script fails"""
+        try:
+            cards = json.loads(self.driver.execute_script(DRAIN_CARDS_JS))
+        except Exception as e:
+            self.logger.warning(f"Card capture script failed, falling back to per-element extraction: {e}")
+            return None
+        scraped_at = datetime.now()
+        return [self._card_to_product(card, scraped_at) for card in cards]
+
+    def _card_to_product(self, card, scraped_at):
+        """Convert a card dict returned by an in-page script into a product record"""
+        return {
+            "name": card.get("name", ""),
+            "tagline": card.get("tagline", ""),
+            "url": card.get("url", ""),
+            "post_id": card.get("post_id", ""),
+            "image_url": card.get("image_url", ""),
+            "topics": card.get("topics", []),
+            "upvotes": card.get("upvotes") or "0",
+            "scraped_at": scraped_at.isoformat(),
+            "date": scraped_at.strftime("%Y-%m-%d")
+        }
+
     def _extract_product_data_new(self, element):
         """Extract product data from a new-style homepage product section"""
         try:
             # Product name
+            name_a = self.waits.find_optional(element, By.CSS_SELECTOR, "a[data-test^='post-name-']")
             try:
-                name_a = element.find_element(By.CSS_SELECTOR, "a[data-test^='post-name-']")
                 name = name_a.text.strip()
                 # Remove leading number and dot (e.g., '19. daily backlinks' -> 'daily backlinks')
                 name = re.sub(r'^\d+\.\s*', '', name)
@@ -314,35 +560,35 @@ class ProductHuntScraper:
             
             # Tagline (the next <a> after the name link)
             try:
-                tagline_a = element.find_elements(By.CSS_SELECTOR, "a")
+                tagline_a = self.waits.find_all(element, By.CSS_SELECTOR, "a")
                 tagline = ""
                 for a in tagline_a:
-                    if a != name_a and "/products/" in a.get_attribute("href"):
+                    if a != name_a and "/products/" in (a.get_attribute("href") or ""):
                         tagline = a.text.strip()
                         break
             except Exception:
                 tagline = ""
             
             # Image
+            img = self.waits.find_optional(element, By.CSS_SELECTOR, "img")
             try:
-                img = element.find_element(By.CSS_SELECTOR, "img")
-                image_url = img.get_attribute("src")
+                image_url = img.get_attribute("src") if img else ""
             except Exception:
                 image_url = ""
             
             # Topics (all <a> inside the tag list)
             try:
                 topics = []
-                taglist = element.find_elements(By.CSS_SELECTOR, "[data-sentry-component='TagList'] a")
+                taglist = self.waits.find_all(element, By.CSS_SELECTOR, "[data-sentry-component='TagList'] a")
                 for t in taglist:
                     topics.append(t.text.strip())
             except Exception:
                 topics = []
             
             # Upvotes (from the vote button)
+            upvote_btn = self.waits.find_optional(element, By.CSS_SELECTOR, "button[data-test='vote-button'] p")
             try:
-                upvote_btn = element.find_element(By.CSS_SELECTOR, "button[data-test='vote-button'] p")
-                upvotes = upvote_btn.text.strip()
+                upvotes = upvote_btn.text.strip() if upvote_btn else "0"
             except Exception:
                 upvotes = "0"
             
@@ -350,6 +596,7 @@ class ProductHuntScraper:
                 "name": name,
                 "tagline": tagline,
                 "url": product_url,
+                "post_id": (element.get_attribute("data-test") or "").replace("post-item-", ""),
                 "image_url": image_url,
                 "topics": topics,
                 "upvotes": upvotes,
@@ -361,132 +608,212 @@ class ProductHuntScraper:
             self.logger.warning(f"Error extracting product data (new): {e}")
             return None
     
-    def _get_links_from_product_page_separate_driver(self, product_url):
-        """Open a new undetected Chrome WebDriver to visit the product page and extract website URL, social and email links."""
-        result = {"website_url": "", "ph_instagram": "", "ph_linkedin_company": "", "ph_linkedin_personal": "", "ph_x": "", "ph_facebook": "", "ph_email": ""}
-        # Social links to skip (ProductHunt's own)
-        skip_socials = [
-            "facebook.com/producthunt",
-            "x.com/producthunt",
-            "twitter.com/producthunt",
-            "linkedin.com/company/producthunt",
-            "instagram.com/producthunt"
-        ]
+    def _fetch_product_page_http(self, product_url):
+        """Fetch a product page over HTTP; returns (page state, html, '') or (None, None, reason to use a browser)"""
+        self.rate_limiter.acquire(product_url)
+        page = self.ph_http.fetch(product_url)
+        if page is None:
+            return None, None, "request failed"
+        if page["status"] in (403, 429, 503):
+            self.concurrency.record_block(f"HTTP {page['status']} on product page")
+        if page["status"] != 200:
+            return None, None, f"HTTP {page['status']}"
+        if any(marker in page["html"][:200000].lower() for marker in CHALLENGE_MARKERS):
+            self.concurrency.record_block("bot challenge on product page")
+            return None, None, "bot challenge"
+        state = extract_product_page(page["html"], product_url)
+        if not state or not state["website_url"]:
+            return None, None, "no embedded page state"
+        return state, page["html"], ""
+
+    def _get_links_from_product_page_separate_driver(self, product_url, meta=None):
+        """Fetch the product page over HTTP, or lease a pooled Chrome WebDriver when that is challenged, and extract website URL, social and email links.
+
+        If given, `meta["path"]` is set to the path that served the page (http, browser or failed).
+        """
+        result = {"website_url": "", **{f"ph_{field}": "" for field in LINK_FIELDS}}
+        meta = {} if meta is None else meta
         try:
-            chrome_options = uc.ChromeOptions()
-            chrome_options.add_argument("--headless=new")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-            
-            driver = None
-            try:
-                driver = uc.Chrome(options=chrome_options, headless=True)
-                driver.get(product_url)
-                time.sleep(random.uniform(5, 15))  # Longer random delay to avoid rate limiting
-                # Website URL
-                try:
-                    website_btn = WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "a[data-test='visit-website-button']"))
-                    )
-                    result["website_url"] = website_btn.get_attribute("href")
-                except Exception:
-                    result["website_url"] = ""
-                # Social and email links
-                all_links = driver.find_elements(By.CSS_SELECTOR, "a[href]")
-                for a in all_links:
-                    href = a.get_attribute("href")
-                    if not href:
-                        continue
-                    href_lower = href.lower()
-                    if any(s in href_lower for s in skip_socials):
-                        continue
-                    if "instagram.com" in href_lower and not result["ph_instagram"]:
-                        result["ph_instagram"] = href
-                    elif "linkedin.com" in href_lower:
-                        if "/company/" in href_lower and not result["ph_linkedin_company"]:
-                            result["ph_linkedin_company"] = href
-                        elif "/company/" not in href_lower and not result["ph_linkedin_personal"]:
-                            result["ph_linkedin_personal"] = href
-                    elif ("twitter.com" in href_lower or "x.com" in href_lower) and not result["ph_x"]:
-                        result["ph_x"] = href
-                    elif "facebook.com" in href_lower and not result["ph_facebook"]:
-                        result["ph_facebook"] = href
-                    elif href_lower.startswith("mailto:") and not result["ph_email"]:
-                        result["ph_email"] = href.replace("mailto:", "")
-                # Also search for visible emails in the page text
-                if not result["ph_email"]:
-                    page_text = driver.page_source
-                    email_match = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", page_text)
-                    if email_match:
-                        result["ph_email"] = email_match.group(0)
-            finally:
-                if driver:
-                    driver.quit()
+            # Fast path: the embedded page state is server rendered, so a plain HTTP request
+            # carrying the browser's cookies gets everything the browser would
+            state, page_text, reason = self._fetch_product_page_http(product_url)
+            if not reason:
+                result["website_url"] = state["website_url"]
+                self._extract_social_links(result, state["hrefs"], "ph")
+                self._count_product_page_fetch("http")
+                meta["path"] = "http"
+            else:
+                self.logger.info(f"Loading product page {product_url} in browser: {reason}")
+                page_text = self._get_product_page_in_browser(product_url, result, refresh_session=reason != "no embedded page state")
+                self._count_product_page_fetch("browser")
+                meta["path"] = "browser"
+            # Also search for visible emails in the page text
+            if not result["ph_email"]:
+                result["ph_email"] = self._find_email(page_text)
+            self.concurrency.record_success()
+        except TimeoutException as e:
+            self._count_product_page_fetch("failed")
+            meta["path"] = "failed"
+            self.concurrency.record_block("timeout")
+            self.logger.warning(f"Timed out visiting product page {product_url}: {e}")
         except Exception as e:
+            self._count_product_page_fetch("failed")
+            meta["path"] = "failed"
             self.logger.warning(f"Failed to visit product page {product_url}: {e}")
         return result
 
-    def _get_links_from_external_website(self, website_url):
-        """Open a new undetected Chrome WebDriver to visit the external website and extract social and email links."""
+    def _get_product_page_in_browser(self, product_url, result, refresh_session=False):
+        """Visit a product page in a leased driver, filling result's website and ph_* fields; returns the text to search for emails"""
+        # Wait for the host's token before leasing, so a throttled host never holds a warm driver idle
+        self.rate_limiter.acquire(product_url)
+        with self.browser_pool.lease() as driver:
+            self.browser_pool.get(driver, product_url)
+            block = block_signal(title=driver.title)
+            if block:
+                self.concurrency.record_block(block)
+                raise Exception(f"Blocked: {block}")
+            if refresh_session:
+                # This driver got past whatever stopped the HTTP client, reuse its clearance
+                self._share_browser_session(driver)
+            page_text = driver.page_source
+            state = extract_product_page(page_text, product_url)
+            if state and state["website_url"]:
+                # Website and maker links straight from the embedded page state
+                result["website_url"] = state["website_url"]
+                self._extract_social_links(result, state["hrefs"], "ph")
+                return page_text
+            # DOM fallback: website button and every anchor on the rendered page
+            try:
+                website_btn = self.waits.find_required(driver, By.CSS_SELECTOR, "a[data-test='visit-website-button']", timeout=10)
+                result["website_url"] = website_btn.get_attribute("href")
+            except Exception:
+                result["website_url"] = ""
+            self.waits.wait_for_dom_quiet(driver, timeout=3)  # Let maker/social links finish rendering
+            links = self._harvest_links(driver)
+            self._extract_social_links(result, links["hrefs"], "ph")
+            return links["text"]
+
+    def _get_website_links(self, website_url, meta=None):
+        """site_* fields for a maker website, from the domain cache when a fresh entry exists, else fetched and cached.
+
+        `meta` is filled as by _get_links_from_external_website; a cache hit sets path "cache".
+        """
+        meta = {} if meta is None else meta
+        if self.domain_cache is None:
+            return self._get_links_from_external_website(website_url, meta)
+        cached = self.domain_cache.get(website_url)
+        if cached:
+            status, fields = cached
+            self.logger.info(f"Domain cache {'hit' if status == 'ok' else 'hit (dead site)'} for {website_url}")
+            meta["path"] = "cache"
+            return {f"site_{field}": fields.get(f"site_{field}", "") for field in LINK_FIELDS}
+        result = self._get_links_from_external_website(website_url, meta)
+        status = meta.get("http_status")
+        if meta.get("path") == "unreachable":
+            # DNS says the host does not exist, or it refuses connections
+            self.domain_cache.put(website_url, result, "http", meta.get("final_url"), dead=True)
+        elif (meta.get("path") == "browser" and meta.get("hrefs")) or (meta.get("path") == "http" and status is not None and status < 400):
+            self.domain_cache.put(website_url, result, meta["path"], meta.get("final_url"))
+        # Anything else (timeouts, challenges, 404s, browser errors or error pages) may be temporary and is not cached
+        return result
+
+    def _get_links_from_external_website(self, website_url, meta=None):
+        """Fetch the external website over HTTP, escalating to a pooled Chrome WebDriver only when needed, and extract social and email links.
+
+        If given, `meta` is filled with the fetch path, HTTP status, final URL, number of links seen
+        and, when the HTTP request failed, whether the host is definitely unreachable. An
+        unreachable host is not retried in a browser and gets path "unreachable".
+        """
+        result = {f"site_{field}": "" for field in LINK_FIELDS}
         if not website_url or not website_url.startswith("http"):
-            return {"site_instagram": "", "site_linkedin_company": "", "site_linkedin_personal": "", "site_x": "", "site_facebook": "", "site_email": ""}
-        result = {"site_instagram": "", "site_linkedin_company": "", "site_linkedin_personal": "", "site_x": "", "site_facebook": "", "site_email": ""}
-        # Social links to skip (ProductHunt's own)
-        skip_socials = [
-            "facebook.com/producthunt",
-            "x.com/producthunt",
-            "twitter.com/producthunt",
-            "linkedin.com/company/producthunt",
-            "instagram.com/producthunt"
-        ]
+            return result
+        meta = {} if meta is None else meta
+        # Fast path: most maker websites ship their footer links in static HTML, scanned as
+        # it downloads and abandoned as soon as every link and the email are found
+        self.rate_limiter.acquire(website_url)
+        scanner = ContactScanner(website_url, self.link_classifier)
+        page = self.http_fetcher.scan(website_url, scanner, meta=meta)
+        if page and page["status"] == 429:
+            # 403s from maker sites are usually permanent bot walls, only 429 reflects our request rate
+            self.concurrency.record_block(f"HTTP 429 from {website_url}")
+        meta.update(http_status=page["status"] if page else None, final_url=page["url"] if page else None,
+                    hrefs=len(scanner.hrefs), path="http")
+        if meta.get("unreachable"):
+            # Chrome would fail the same way, don't spend a browser lease on it
+            self._count_website_fetch("failed")
+            meta["path"] = "unreachable"
+            self.logger.info(f"Website {website_url} is unreachable ({meta['unreachable']}), not escalating to browser")
+            return result
+        reason = browser_fallback_reason(page, {"hrefs": scanner.hrefs, "text_length": scanner.text_length})
+        if not reason:
+            self._fill_links(result, scanner.links, "site")
+            self._count_website_fetch("http")
+            self._crawl_contact_pages(result, scanner.base_url, scanner.hrefs)
+            return result
+        self.logger.info(f"Escalating {website_url} to browser: {reason}")
         try:
-            chrome_options = uc.ChromeOptions()
-            chrome_options.add_argument("--headless=new")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-            
-            driver = None
-            try:
-                driver = uc.Chrome(options=chrome_options, headless=True)
-                driver.get(website_url)
-                time.sleep(random.uniform(5, 15))  # Longer random delay to avoid rate limiting
-                all_links = driver.find_elements(By.CSS_SELECTOR, "a[href]")
-                for a in all_links:
-                    href = a.get_attribute("href")
-                    if not href:
-                        continue
-                    href_lower = href.lower()
-                    if any(s in href_lower for s in skip_socials):
-                        continue
-                    if "instagram.com" in href_lower and not result["site_instagram"]:
-                        result["site_instagram"] = href
-                    elif "linkedin.com" in href_lower:
-                        if "/company/" in href_lower and not result["site_linkedin_company"]:
-                            result["site_linkedin_company"] = href
-                        elif "/company/" not in href_lower and not result["site_linkedin_personal"]:
-                            result["site_linkedin_personal"] = href
-                    elif ("twitter.com" in href_lower or "x.com" in href_lower) and not result["site_x"]:
-                        result["site_x"] = href
-                    elif "facebook.com" in href_lower and not result["site_facebook"]:
-                        result["site_facebook"] = href
-                    elif href_lower.startswith("mailto:") and not result["site_email"]:
-                        result["site_email"] = href.replace("mailto:", "")
+            self.rate_limiter.acquire(website_url)
+            with self.concurrency.slot(), self.browser_pool.lease() as driver:
+                self.browser_pool.get(driver, website_url)
+                self.waits.wait_until_ready(driver, timeout=10)
+                landing_url = driver.current_url
+                links = self._harvest_links(driver)
+                self._extract_social_links(result, links["hrefs"], "site")
                 # Also search for visible emails in the page text
                 if not result["site_email"]:
-                    page_text = driver.page_source
-                    email_match = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", page_text)
-                    if email_match:
-                        result["site_email"] = email_match.group(0)
-            finally:
-                if driver:
-                    driver.quit()
+                    result["site_email"] = self._find_email(links["text"])
+            self._count_website_fetch("browser")
+            meta.update(path="browser", final_url=landing_url, hrefs=len(links["hrefs"]))
+            # Crawl after handing the driver back, the contact pages are fetched over HTTP
+            self._crawl_contact_pages(result, landing_url, links["hrefs"])
         except Exception as e:
+            self._count_website_fetch("failed")
+            meta["path"] = "failed"
             self.logger.warning(f"Failed to visit external website {website_url}: {e}")
         return result
+
+    def _crawl_contact_pages(self, result, landing_url, hrefs):
+        """Fill site_email from the site's contact/about/imprint pages when the landing page had none"""
+        if self.contact_crawler is None or result["site_email"]:
+            return
+        try:
+            result["site_email"] = self.contact_crawler.find_email(landing_url, hrefs)
+        except Exception as e:
+            self.logger.warning(f"Contact page crawl failed for {landing_url}: {e}")
+
+    def _harvest_links(self, driver):
+        """Return {"hrefs", "text"} for the driver's page in one script call, falling back to per-anchor lookups"""
+        try:
+            return json.loads(driver.execute_script(HARVEST_LINKS_JS, HARVEST_TEXT_LIMIT))
+        except Exception as e:
+            self.logger.warning(f"Link harvest script failed, falling back to per-anchor lookups: {e}")
+            hrefs = [a.get_attribute("href") for a in self.waits.find_all(driver, By.CSS_SELECTOR, "a[href]")]
+            return {"hrefs": hrefs, "text": driver.page_source}
+
+    def _extract_social_links(self, result, hrefs, prefix):
+        """Fill the empty <prefix>_* social and email fields of result (prefix 'ph' or 'site') from a list of hrefs"""
+        self._fill_links(result, self.link_classifier.first_links(hrefs), prefix)
+
+    def _fill_links(self, result, links, prefix):
+        """Copy classified {field: value} links into the empty <prefix>_* fields of result"""
+        for field, value in links.items():
+            key = f"{prefix}_{field}"
+            if not result.get(key):
+                result[key] = value
+
+    def _find_email(self, text):
+        """First plausible email in page HTML or visible text, skipping scripts, styles and asset-like matches"""
+        return scan_html(text or "", classifier=self.link_classifier, fields=["email"]).links.get("email", "")
+
+    def _count_website_fetch(self, path):
+        """Record which path (http, browser, failed) served an external website"""
+        with self.stats_lock:
+            self.website_fetch_stats[path] += 1
+    
+    def _count_product_page_fetch(self, path):
+        """Record which path (http, browser, failed) served a Product Hunt product page"""
+        with self.stats_lock:
+            self.product_page_fetch_stats[path] += 1
     
     def save_to_json(self, filename=None):
         """Save scraped products to JSON file"""
@@ -510,7 +837,8 @@ class ProductHuntScraper:
                 self.logger.warning("No products to save")
                 return
             
-            fieldnames = self.products[0].keys()
+            # Rows resumed from an older CSV may lack newer fields, so take the union in first-seen order
+            fieldnames = list(dict.fromkeys(key for product in self.products for key in product))
             with open(filename, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
@@ -520,16 +848,53 @@ class ProductHuntScraper:
             self.logger.error(f"Error saving to CSV: {e}")
     
     def close(self):
-        """Close the WebDriver"""
-        if hasattr(self, 'driver'):
+        """Close the WebDriver and the enrichment browser pool"""
+        if hasattr(self, 'browser_pool'):
+            self.browser_pool.close()
+        if hasattr(self, 'http_fetcher'):
+            self.http_fetcher.close()
+        if hasattr(self, 'ph_http'):
+            self.ph_http.close()
+        if getattr(self, 'api_client', None):
+            self.api_client.close()
+        if hasattr(self, 'redirect_resolver'):
+            self.redirect_resolver.close()
+        if getattr(self, 'store', None):
+            self.store.close()
+        if getattr(self, 'domain_cache', None):
+            self.domain_cache.close()
+        if getattr(self, 'driver', None):
             self.driver.quit()
             self.logger.info("WebDriver closed")
+        if getattr(self, 'homepage_profile', None) or getattr(self, 'homepage_cache', None):
+            self._release_homepage_dirs()
 
 def main():
     """Main function to run the scraper"""
+    parser = argparse.ArgumentParser(description="Scrape today's Product Hunt launches")
+    parser.add_argument("--source", choices=["browser", "api"], default="browser",
+                        help="Where the daily listing comes from: the homepage in Chrome, or the GraphQL API (needs PRODUCTHUNT_API_TOKEN)")
+    parser.add_argument("--profile-dir", default=None,
+                        help="Directory of persistent Chrome profiles reused across drivers and runs (default: a fresh temp profile per driver)")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Shared directory for Chrome's on-disk HTTP cache, so static bundles are downloaded once per deploy")
+    parser.add_argument("--no-block-resources", action="store_true",
+                        help="Load images, fonts, media and third-party scripts in enrichment browsers")
+    parser.add_argument("--contact-crawl", action="store_true",
+                        help="When a maker site's landing page has no email, check a few of its contact/about/imprint pages")
+    parser.add_argument("--store", default="producthunt_products.sqlite3",
+                        help="SQLite file recording each product's enrichment progress, used to resume and to skip delivered products")
+    parser.add_argument("--domain-cache", default=None,
+                        help="SQLite file caching website links by domain across runs, so relaunches skip the site visit")
+    parser.add_argument("--domain-cache-ttl", type=float, default=14,
+                        help="Days a cached domain is reused before the site is visited again (dead sites: 2 days)")
+    args = parser.parse_args()
     scraper = None
     try:
-        scraper = ProductHuntScraper(headless=True)
+        scraper = ProductHuntScraper(headless=True, source=args.source, profile_dir=args.profile_dir, cache_dir=args.cache_dir,
+                                     resource_policy=False if args.no_block_resources else None, contact_crawl=args.contact_crawl,
+                                     domain_cache=DomainCache(args.domain_cache, ttl=args.domain_cache_ttl * DAY) if args.domain_cache else None,
+                                     store_path=args.store)
         products = scraper.get_todays_products()
         
         if products:
@@ -0,0 +1,160 @@
+import os
+import time
+import uuid
+import socket
+import logging
+import threading
+
+try:
+    import psutil
+except ImportError:  # Stale locks are detected by age alone without psutil
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilePool:
+    """Persistent Chrome user-data-dirs that drivers rotate through, each locked while in use.
+
+    Profiles live under `root` as profile-1 ... profile-N and keep cookies, clearance
+    tokens, HSTS state and the HTTP cache between launches and runs. The same locking
+    also hands out per-driver --disk-cache-dir slots (prefix="cache"). A profile is locked
+    with a sibling `.lock` file created with O_EXCL, which is atomic on Windows and POSIX,
+    so two drivers or two scraper processes never open the same profile. Held locks are
+    touched periodically; locks left by a crashed process are taken over once its pid is
+    gone or the lock has not been touched for `stale_after` seconds.
+    """
+
+    def __init__(self, root="chrome_profiles", size=4, stale_after=12 * 3600, prefix="profile"):
+        self.root = os.path.abspath(root)
+        self.size = max(1, int(size))
+        self.prefix = prefix
+        self.stale_after = stale_after
+        self._next = 0
+        self._lock = threading.Lock()
+        self._held = set()
+        self._heartbeat = None
+        os.makedirs(self.root, exist_ok=True)
+
+    def _lock_path(self, path):
+        return f"{path}.lock"
+
+    def _is_stale(self, lock_path):
+        """Whether a lock file was left behind by a process that no longer holds it"""
+        try:
+            with open(lock_path, "r", encoding="utf-8") as f:
+                pid_text, _, host = f.read().strip().partition(" ")
+            age = time.time() - os.path.getmtime(lock_path)
+        except OSError:
+            return False
+        if age > self.stale_after:
+            return True
+        if psutil is not None and host == socket.gethostname() and pid_text.isdigit():
+            return not psutil.pid_exists(int(pid_text))
+        return False
+
+    def _take_over(self, lock_path):
+        """Move a stale lock out of the way atomically; returns True if it was stale and is gone.
+
+        Two processes may both judge the same lock stale. Renaming it to a unique name
+        succeeds for only one of them, and the renamed file is checked again in case it
+        was a fresh lock created in between, which is then put back.
+        """
+        moved = f"{lock_path}.stale-{os.getpid()}-{uuid.uuid4().hex}"
+        try:
+            os.rename(lock_path, moved)
+        except OSError:
+            return False
+        if self._is_stale(moved):
+            logger.info(f"Took over stale Chrome profile lock {lock_path}")
+            os.remove(moved)
+            return True
+        try:
+            os.link(moved, lock_path)
+        except OSError as e:
+            logger.warning(f"Could not restore Chrome profile lock {lock_path}: {e}")
+        os.remove(moved)
+        return False
+
+    def _try_lock(self, path):
+        """Create the profile's lock file, taking over a stale one; returns True if the profile is ours"""
+        lock_path = self._lock_path(path)
+        for _ in range(2):
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if not self._is_stale(lock_path) or not self._take_over(lock_path):
+                    return False
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(f"{os.getpid()} {socket.gethostname()}")
+            self._held.add(lock_path)
+            self._start_heartbeat()
+            return True
+        return False
+
+    def _start_heartbeat(self):
+        if self._heartbeat is None:
+            self._heartbeat = threading.Thread(target=self._touch_held_locks, name=f"{self.prefix}-lock-heartbeat", daemon=True)
+            self._heartbeat.start()
+
+    def _touch_held_locks(self):
+        """Refresh the mtime of held locks so a long run's locks never look stale by age"""
+        interval = max(1.0, min(300.0, self.stale_after / 4))
+        while True:
+            time.sleep(interval)
+            with self._lock:
+                held = list(self._held)
+            for lock_path in held:
+                try:
+                    os.utime(lock_path)
+                except OSError as e:
+                    logger.warning(f"Could not refresh Chrome profile lock {lock_path}: {e}")
+
+    def acquire(self):
+        """Lock the next free profile; returns (path, reused) where reused means Chrome has used it before"""
+        with self._lock:
+            for offset in range(self.size):
+                index = (self._next + offset) % self.size
+                path = os.path.join(self.root, f"{self.prefix}-{index + 1}")
+                if self._try_lock(path):
+                    self._next = index + 1
+                    # Chrome creates the Default profile directory on first launch
+                    reused = os.path.isdir(os.path.join(path, "Default"))
+                    os.makedirs(path, exist_ok=True)
+                    return path, reused
+        raise RuntimeError(f"All {self.size} Chrome profiles under {self.root} are in use")
+
+    def release(self, path):
+        """Unlock a profile acquired from this pool"""
+        with self._lock:
+            self._held.discard(self._lock_path(path))
+        try:
+            os.remove(self._lock_path(path))
+        except OSError as e:
+            logger.warning(f"Could not unlock Chrome profile {path}: {e}")
+
+
+class FirstPageStats:
+    """First page load of each launched driver, split by whether its profile was reused"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.data = {reused: {"drivers": 0, "challenged": 0, "seconds": 0.0} for reused in (True, False)}
+
+    def record(self, reused, seconds, challenged):
+        """Record one driver's first page load"""
+        with self._lock:
+            entry = self.data[bool(reused)]
+            entry["drivers"] += 1
+            entry["challenged"] += int(bool(challenged))
+            entry["seconds"] += seconds
+
+    def log_summary(self):
+        """Log challenge rate and mean first-page latency with and without profile reuse"""
+        for reused, label in ((True, "reused profile"), (False, "fresh profile")):
+            entry = self.data[reused]
+            if entry["drivers"]:
+                logger.info(f"First page with {label}: {entry['drivers']} drivers, "
+                            f"challenge rate {entry['challenged'] / entry['drivers']:.0%}, "
+                            f"mean latency {entry['seconds'] / entry['drivers']:.1f}s")
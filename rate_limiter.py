@@ -0,0 +1,68 @@
+import time
+import logging
+import threading
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Requests per second and burst size per host. Product Hunt is shared by every product
+# page visit, so it gets a conservative budget; maker domains are each hit only a few times.
+DEFAULT_HOST_LIMITS = {
+    "producthunt.com": (0.5, 2),
+}
+DEFAULT_RATE = 1.0
+DEFAULT_BURST = 3
+
+
+def host_key(url):
+    """Normalize a URL or bare host to the key used for rate limiting (lowercase, no www.)"""
+    host = urlparse(url).hostname if "//" in url else url
+    host = (host or "").lower().rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+class HostRateLimiter:
+    """Token-bucket rate limiter keyed by host, safe to share between worker threads.
+
+    Each host has its own bucket that refills at `rate` tokens per second up to `burst`.
+    acquire() reserves a token under the lock and sleeps outside it, so workers hitting
+    different domains never wait on each other.
+    """
+
+    def __init__(self, host_limits=None, default_rate=DEFAULT_RATE, default_burst=DEFAULT_BURST):
+        self.host_limits = dict(DEFAULT_HOST_LIMITS if host_limits is None else host_limits)
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.stats = {"acquired": 0, "delayed": 0, "wait_seconds": 0.0}
+
+    def _limits_for(self, host):
+        """Return (rate, burst) for a host, matching configured parent domains"""
+        for configured, limits in self.host_limits.items():
+            if host == configured or host.endswith("." + configured):
+                return configured, limits
+        return host, (self.default_rate, self.default_burst)
+
+    def acquire(self, url):
+        """Block until a request to url's host is allowed; returns the seconds waited"""
+        key, (rate, burst) = self._limits_for(host_key(url))
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = {"tokens": float(burst), "updated": now}
+            bucket["tokens"] = min(burst, bucket["tokens"] + (now - bucket["updated"]) * rate)
+            bucket["updated"] = now
+            bucket["tokens"] -= 1
+            wait = -bucket["tokens"] / rate if bucket["tokens"] < 0 else 0.0
+            self.stats["acquired"] += 1
+            if wait:
+                self.stats["delayed"] += 1
+                self.stats["wait_seconds"] += wait
+        if wait:
+            logger.debug(f"Rate limiting {key}: waiting {wait:.1f} seconds")
+            time.sleep(wait)
+        return wait
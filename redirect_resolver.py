@@ -0,0 +1,151 @@
+"""
+Resolve "visit website" redirect links to the maker's canonical URL over plain HTTP.
+
+Product Hunt's visit-website button points at a /r/<code> redirect. The chain is followed
+hop by hop with HEAD requests (falling back to a GET whose body is never read when a
+server rejects HEAD) on a pooled session, so no browser is launched just to follow it.
+The final URL is cleaned of tracking parameters and memoized in memory for the run and,
+when a SQLite path is given, across runs.
+"""
+
+import time
+import sqlite3
+import logging
+import threading
+from urllib.parse import urljoin, urldefrag, urlparse
+import requests
+
+logger = logging.getLogger(__name__)
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Servers that refuse or mishandle HEAD; retry the hop with a GET
+HEAD_UNSUPPORTED = {400, 403, 404, 405, 406, 501}
+MAX_HOPS = 10
+DAY = 24 * 3600
+
+
+def is_redirect_link(url):
+    """Whether url is one of Product Hunt's own links (such as /r/<code>) that redirects to a maker's site"""
+    try:
+        host = (urlparse(url).hostname or "").lower()
+    except (TypeError, ValueError):
+        return False
+    return host == "producthunt.com" or host.endswith(".producthunt.com")
+
+
+class RedirectResolver:
+    """Follows redirect chains with `fetcher`'s session and memoizes url -> canonical final url"""
+
+    def __init__(self, fetcher, rate_limiter, clean=None, path=None, ttl=30 * DAY, timeout=10):
+        self.fetcher = fetcher
+        self.rate_limiter = rate_limiter
+        self.clean = clean or (lambda url: url)
+        self.ttl = ttl
+        self.timeout = timeout
+        self._memo = {}
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("""CREATE TABLE IF NOT EXISTS redirects (
+                url TEXT PRIMARY KEY,
+                final_url TEXT NOT NULL,
+                hops INTEGER NOT NULL,
+                resolved_at REAL NOT NULL)""")
+            self._db.commit()
+        self.stats = {"resolved": 0, "memo_hits": 0, "stored_hits": 0, "failed": 0, "hops": 0, "seconds": 0.0}
+
+    def _hop(self, url):
+        """One request without following redirects; returns the response status and Location header"""
+        self.rate_limiter.acquire(url)
+        session = self.fetcher.session
+        resp = session.head(url, allow_redirects=False, timeout=self.timeout)
+        resp.close()
+        if resp.status_code in HEAD_UNSUPPORTED:
+            with session.get(url, allow_redirects=False, timeout=self.timeout, stream=True) as resp:
+                pass
+        return resp.status_code, resp.headers.get("Location")
+
+    def _follow(self, url):
+        """Follow the chain from url; returns (final url, hops) or None if it could not be resolved"""
+        current = url
+        for hops in range(MAX_HOPS + 1):
+            status, location = self._hop(current)
+            if status in REDIRECT_STATUSES and location:
+                current = urljoin(current, location)
+                continue
+            if hops == 0 or is_redirect_link(current):
+                # The redirect service answered itself (a bot challenge or an interstitial page)
+                # or the chain ended on Product Hunt, so the maker's site was never reached
+                return None
+            return current, hops
+        logger.warning(f"Too many redirects resolving {url}")
+        return None
+
+    def _stored(self, url):
+        if self._db is None:
+            return None
+        with self._lock:
+            row = self._db.execute("SELECT final_url, resolved_at FROM redirects WHERE url = ?", (url,)).fetchone()
+        if row and time.time() - row[1] <= self.ttl:
+            return row[0]
+        return None
+
+    def _store(self, url, final_url, hops):
+        if self._db is None:
+            return
+        with self._lock:
+            try:
+                self._db.execute("INSERT OR REPLACE INTO redirects VALUES (?, ?, ?, ?)", (url, final_url, hops, time.time()))
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to store redirect for {url}: {e}")
+
+    def resolve(self, url):
+        """Canonical final URL for url, or url itself (cleaned) if the chain could not be followed"""
+        if not url or not url.startswith(("http://", "https://")):
+            return url
+        with self._lock:
+            if url in self._memo:
+                self.stats["memo_hits"] += 1
+                return self._memo[url]
+        final_url = self._stored(url)
+        if final_url:
+            with self._lock:
+                self.stats["stored_hits"] += 1
+                self._memo[url] = final_url
+            return final_url
+        started = time.perf_counter()
+        try:
+            followed = self._follow(url)
+        except requests.RequestException as e:
+            logger.debug(f"Redirect resolution failed for {url}: {e}")
+            followed = None
+        with self._lock:
+            self.stats["seconds"] += time.perf_counter() - started
+        if followed is None:
+            with self._lock:
+                self.stats["failed"] += 1
+                self._memo[url] = self.clean(url)
+            return self._memo[url]
+        final_url, hops = followed
+        final_url = self.clean(urldefrag(final_url)[0])
+        self._store(url, final_url, hops)
+        with self._lock:
+            self.stats["resolved"] += 1
+            self.stats["hops"] += hops
+            self._memo[url] = final_url
+        return final_url
+
+    def log_summary(self):
+        """Log how redirects were resolved this run"""
+        s = self.stats
+        if s["resolved"] or s["memo_hits"] or s["stored_hits"] or s["failed"]:
+            logger.info(f"Redirects: {s['resolved']} resolved over HTTP ({s['hops']} hops, {s['seconds']:.1f}s), "
+                        f"{s['memo_hits']} memoized this run, {s['stored_hits']} from earlier runs, {s['failed']} unresolved")
+
+    def close(self):
+        if self._db is not None:
+            with self._lock:
+                self._db.close()
@@ -0,0 +1,126 @@
+import re
+import json
+import time
+import logging
+import threading
+from page_scripts import RESOURCE_BYTES_JS
+
+logger = logging.getLogger(__name__)
+
+
+def on_hosts(*hosts, path="/"):
+    """Block-list patterns matching URLs on the given hosts and their subdomains, anchored on the host"""
+    return [f"*://{sub}{host}{path}*" for host in hosts for sub in ("", "*.")]
+
+
+def compile_patterns(patterns):
+    """One regex matching a URL against block-list patterns the way Chrome does: only '*' is a wildcard"""
+    alternatives = (".*".join(re.escape(part) for part in pattern.split("*")) for pattern in patterns)
+    return re.compile("|".join(f"(?:{alternative})" for alternative in alternatives) or r"(?!)", re.IGNORECASE)
+
+
+# URL patterns for Network.setBlockedURLs ('*' is a wildcard), grouped so whole
+# categories can be switched on or off. Third-party patterns are anchored on the host,
+# so a maker's own URL that merely mentions a vendor (e.g. /blog/heap.io-review) loads.
+BLOCK_CATEGORIES = {
+    "images": ["*.png", "*.png?*", "*.jpg", "*.jpg?*", "*.jpeg", "*.jpeg?*", "*.gif", "*.gif?*",
+               "*.webp", "*.webp?*", "*.avif", "*.avif?*", "*.svg", "*.svg?*", "*.ico", "*.ico?*",
+               *on_hosts("ph-files.imgix.net", "ph-avatars.imgix.net")],
+    "media": ["*.mp4", "*.mp4?*", "*.webm", "*.webm?*", "*.mov", "*.m3u8", "*.mp3", "*.wav",
+              *on_hosts("youtube.com", "youtube-nocookie.com", path="/embed/"),
+              *on_hosts("player.vimeo.com", "fast.wistia.com", "fast.wistia.net")],
+    "fonts": ["*.woff", "*.woff?*", "*.woff2", "*.woff2?*", "*.ttf", "*.otf", "*.eot",
+              *on_hosts("fonts.googleapis.com", "fonts.gstatic.com", "use.typekit.net")],
+    "analytics": on_hosts("google-analytics.com", "googletagmanager.com", "segment.com", "segment.io",
+                          "mixpanel.com", "amplitude.com", "hotjar.com", "clarity.ms", "fullstory.com",
+                          "heap.io", "heapanalytics.com", "plausible.io", "posthog.com", "sentry.io",
+                          "datadoghq.com", "datadoghq.eu", "datadoghq-browser-agent.com", "newrelic.com",
+                          "nr-data.net", "connect.facebook.net"),
+    "ads": on_hosts("doubleclick.net", "googlesyndication.com", "googleadservices.com", "adservice.google.com",
+                    "ads-twitter.com", "analytics.twitter.com", "snap.licdn.com", "px.ads.linkedin.com",
+                    "bat.bing.com", "taboola.com", "outbrain.com", "criteo.com", "criteo.net"),
+    "chat": on_hosts("intercom.io", "intercomcdn.com", "js.driftt.com", "drift.com",
+                     "crisp.chat", "tawk.to", "zdassets.com", "zopim.com", "livechatinc.com",
+                     "js.hs-scripts.com", "usemessages.com", "olark.com", "tidio.co", "chatra.io"),
+}
+DEFAULT_CATEGORIES = ("images", "media", "fonts", "analytics", "ads", "chat")
+
+
+class ResourcePolicy:
+    """Block heavy and third-party resources in a driver through the DevTools protocol.
+
+    The blocked patterns are the chosen categories plus `deny`, minus any pattern listed
+    in `allow`. Blocked requests never complete, so their size cannot be read directly:
+    instead every `baseline_every`-th page (starting with the first) is loaded unblocked
+    and bytes and time saved are estimated from the difference in mean page weight and
+    load time between baseline and blocked pages.
+    """
+
+    def __init__(self, categories=DEFAULT_CATEGORIES, deny=(), allow=(), baseline_every=25):
+        allowed = set(allow)
+        patterns = [p for category in categories for p in BLOCK_CATEGORIES[category]] + list(deny)
+        self.patterns = [p for p in dict.fromkeys(patterns) if p not in allowed]
+        self._pattern_re = compile_patterns(self.patterns)
+        self.baseline_every = baseline_every
+        self._pages = 0
+        self._lock = threading.Lock()
+        self.stats = {mode: {"pages": 0, "seconds": 0.0, "bytes": 0} for mode in ("blocked", "baseline")}
+
+    def apply(self, driver):
+        """Install the block list in a driver; it stays in place for the driver's lifetime"""
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+
+    def get(self, driver, url):
+        """Load url, unblocked if it is due as a baseline sample, and record its load time and page weight"""
+        if self._pattern_re.fullmatch(url):
+            # The page itself matches the block list (e.g. an analytics vendor's own site)
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+            try:
+                driver.get(url)
+            finally:
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+            return
+        with self._lock:
+            self._pages += 1
+            baseline = bool(self.baseline_every) and self._pages % self.baseline_every == 1
+        if baseline:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+        try:
+            started = time.perf_counter()
+            driver.get(url)
+            seconds = time.perf_counter() - started
+        finally:
+            if baseline:
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+        try:
+            page = json.loads(driver.execute_script(RESOURCE_BYTES_JS))
+            page_bytes = page["network_bytes"] + page["cache_bytes"]
+        except Exception as e:
+            logger.debug(f"Could not read resource timing for {url}: {e}")
+            return
+        with self._lock:
+            entry = self.stats["baseline" if baseline else "blocked"]
+            entry["pages"] += 1
+            entry["seconds"] += seconds
+            entry["bytes"] += page_bytes
+
+    def savings(self):
+        """Estimated (bytes, seconds) saved over all blocked pages, or None without both kinds of sample"""
+        blocked, baseline = self.stats["blocked"], self.stats["baseline"]
+        if not blocked["pages"] or not baseline["pages"]:
+            return None
+        bytes_per_page = baseline["bytes"] / baseline["pages"] - blocked["bytes"] / blocked["pages"]
+        seconds_per_page = baseline["seconds"] / baseline["pages"] - blocked["seconds"] / blocked["pages"]
+        return bytes_per_page * blocked["pages"], seconds_per_page * blocked["pages"]
+
+    def log_summary(self):
+        """Log mean page weight and load time with and without blocking, and the estimated savings"""
+        for mode in ("blocked", "baseline"):
+            entry = self.stats[mode]
+            if entry["pages"]:
+                logger.info(f"Resource policy, {mode} pages: {entry['pages']}, mean {entry['bytes'] / entry['pages'] / 1e3:.0f}KB, "
+                            f"mean load {entry['seconds'] / entry['pages']:.2f}s")
+        saved = self.savings()
+        if saved:
+            logger.info(f"Resource blocking saved an estimated {saved[0] / 1e6:.1f}MB and {saved[1]:.0f}s of page loading")
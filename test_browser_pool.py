@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Tests for the warm browser pool (browser_pool.py)
+Uses a fake driver factory, no browser needed.
+"""
+
+import sys
+import threading
+from browser_pool import BrowserPool
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+
+class FakeDriver:
+    """Records what the pool does to it; `healthy` and `fail_reset` simulate a broken browser"""
+
+    title = "Orbit"
+
+    def __init__(self, number):
+        self.number = number
+        self.healthy = True
+        self.fail_reset = False
+        self.window_handles = ["main"]
+        self.current = "main"
+        self.switch_to = FakeSwitchTo(self)
+        self.loaded = []
+        self.cookies_cleared = 0
+        self.quit_called = False
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def execute_script(self, script, *args):
+        if not self.healthy:
+            raise RuntimeError("session deleted")
+        return 1
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == "Network.clearBrowserCookies":
+            self.cookies_cleared += 1
+        return {}
+
+    def get(self, url):
+        if self.fail_reset and url == "about:blank":
+            raise RuntimeError("renderer crashed")
+        self.loaded.append(url)
+
+    def close(self):
+        self.window_handles.remove(self.current)
+
+    def get_log(self, kind):
+        return []
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_pool(**kwargs):
+    launched = []
+
+    def factory(options=None, headless=True, user_data_dir=None):
+        launched.append(FakeDriver(len(launched) + 1))
+        return launched[-1]
+
+    return BrowserPool(driver_factory=factory, **kwargs), launched
+
+
+def test_drivers_are_launched_lazily_and_reused():
+    """Drivers start on first lease only, and a returned driver is reset and leased again"""
+    pool, launched = make_pool(size=2)
+    assert launched == []
+    with pool.lease() as driver:
+        driver.window_handles.append("popup")
+        pool.get(driver, "https://orbit.io/")
+    assert driver.window_handles == ["main"] and driver.loaded[-1] == "about:blank"
+    assert driver.cookies_cleared == 1
+    with pool.lease() as again:
+        assert again is driver
+    assert len(launched) == 1
+    assert pool.stats == {"launched": 1, "leases": 2, "recycled": 0, "health_failures": 0}
+
+
+def test_unhealthy_driver_is_replaced():
+    """An idle driver that fails its health check is quit and a fresh one is launched"""
+    pool, launched = make_pool(size=1)
+    with pool.lease() as driver:
+        pass
+    driver.healthy = False
+    with pool.lease() as replacement:
+        assert replacement is not driver
+    assert driver.quit_called
+    assert pool.stats["health_failures"] == 1 and pool.stats["launched"] == 2
+
+
+def test_recycling():
+    """Drivers are recycled after max_uses, when reset fails, and when a lease ends with a dead browser"""
+    pool, launched = make_pool(size=1, max_uses=2)
+    for _ in range(3):
+        with pool.lease():
+            pass
+    assert launched[0].quit_called and len(launched) == 2
+    launched[1].fail_reset = True
+    with pool.lease():
+        pass
+    assert launched[1].quit_called
+    try:
+        with pool.lease() as driver:
+            driver.healthy = False
+            raise RuntimeError("page crashed")
+    except RuntimeError:
+        pass
+    assert driver.quit_called
+    assert pool.stats["recycled"] == 3 and pool.stats["launched"] == 3
+
+
+def test_concurrent_leases():
+    """Concurrent leases never share a driver and every counter adds up"""
+    pool, launched = make_pool(size=3, max_uses=5)
+    holders = {}
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(20):
+                with pool.lease() as driver:
+                    owner = holders.setdefault(id(driver), threading.get_ident())
+                    assert owner == threading.get_ident(), "driver leased twice"
+                    del holders[id(driver)]
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors
+    assert pool.stats["leases"] == 120
+    assert pool.stats["launched"] == pool.stats["recycled"] + len(pool._idle)
+    pool.close()
+    assert all(driver.quit_called for driver in launched)
+
+
+def main():
+    """Run all tests"""
+    print("Browser Pool Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_drivers_are_launched_lazily_and_reused,
+        test_unhealthy_driver_is_replaced,
+        test_recycling,
+        test_concurrent_leases,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Tests for adaptive concurrency and memory admission (concurrency.py)
+Runs on a fake clock and fake psutil data, so nothing sleeps or reads real memory.
+"""
+
+import sys
+from contextlib import contextmanager
+import concurrency
+from concurrency import AdaptiveConcurrency, MemoryAdmission, block_signal
+from fake_clock import fake_time
+
+MB = 1024 * 1024
+
+
+class FakeProcess:
+    def __init__(self, name, rss_mb, cmdline=(), denied=False):
+        self._name = name
+        self.rss = rss_mb * MB
+        self._cmdline = list(cmdline)
+        self.denied = denied
+
+    def name(self):
+        if self.denied:
+            raise FakePsutil.AccessDenied()
+        return self._name
+
+    def memory_info(self):
+        return self
+
+    def cmdline(self):
+        return self._cmdline
+
+
+class FakePsutil:
+    """The parts of psutil MemoryAdmission uses, serving fixed process and memory data"""
+
+    class NoSuchProcess(Exception):
+        pass
+
+    class AccessDenied(Exception):
+        pass
+
+    def __init__(self, tree, available_mb):
+        self.tree = tree
+        self.available = available_mb * MB
+
+    def Process(self):
+        return self
+
+    def children(self, recursive=False):
+        return self.tree
+
+    def virtual_memory(self):
+        return self
+
+
+def browser_tree(browsers=2):
+    """Each browser at 300MB with a 100MB renderer, plus one chromedriver"""
+    tree = [FakeProcess("chromedriver", 20)]
+    for _ in range(browsers):
+        tree.append(FakeProcess("chrome", 300, ["chrome", "--headless"]))
+        tree.append(FakeProcess("chrome", 100, ["chrome", "--type=renderer"]))
+    return tree
+
+
+@contextmanager
+def fake_memory(available_mb=1500):
+    """Replace concurrency's psutil with a FakePsutil serving two browsers"""
+    memory = FakePsutil(browser_tree(), available_mb)
+    real_psutil = concurrency.psutil
+    concurrency.psutil = memory
+    try:
+        yield memory
+    finally:
+        concurrency.psutil = real_psutil
+
+
+def test_additive_increase():
+    """Clean loads grow the limit by about one per `limit` successes, up to max_limit, and shrink the delay"""
+    with fake_time(concurrency):
+        controller = AdaptiveConcurrency(initial=1, max_limit=4, base_delay=2.0)
+        controller.delay = 1.0
+        limits = []
+        for _ in range(12):
+            controller.record_success()
+            limits.append(int(controller.limit))
+    assert limits[:7] == [2, 2, 2, 3, 3, 3, 4], limits
+    assert limits[-1] == 4 and controller.limit == 4
+    assert controller.delay == 0.0
+    # One point per limit step, plus one when the delay reached zero
+    assert [point[1] for point in controller.trajectory] == [1, 2, 3, 3, 4], controller.trajectory
+
+
+def test_multiplicative_decrease_and_cooldown():
+    """A block halves the limit and doubles the delay; blocks within the cooldown count once"""
+    with fake_time(concurrency) as clock:
+        controller = AdaptiveConcurrency(initial=4, max_limit=4, base_delay=2.0, cooldown=30.0)
+        controller.record_block("HTTP 429")
+        assert controller.limit == 2 and controller.delay == 2.0
+        clock.now += 10
+        controller.record_block("HTTP 403")
+        assert controller.limit == 2 and controller.delay == 2.0
+        clock.now += 25
+        controller.record_block("timeout")
+        assert controller.limit == 1 and controller.delay == 4.0
+        clock.now += 31
+        controller.record_block("timeout")
+    assert controller.limit == 1, "never below min_limit"
+    assert controller.stats["blocks"] == 4
+    assert [point[3] for point in controller.trajectory] == ["start", "HTTP 429", "timeout", "timeout"]
+
+
+def test_slot_waits_out_the_delay():
+    """A slot is taken after the adaptive delay and counted while held"""
+    with fake_time(concurrency) as clock:
+        controller = AdaptiveConcurrency(initial=2, max_limit=2, base_delay=3.0)
+        controller.record_block("HTTP 429")
+        with controller.slot():
+            assert controller.active == 1
+    assert clock.slept == [3.0]
+    assert controller.active == 0 and controller.stats["peak_active"] == 1
+
+
+def test_block_signal():
+    """Block statuses and challenge titles are recognised"""
+    assert block_signal(status=429) == "HTTP 429"
+    assert block_signal(title="Just a moment...") == "challenge title 'Just a moment...'"
+    assert block_signal(status=200, title="Orbit") == ""
+
+
+def test_memory_admission():
+    """Workers are admitted while available memory covers the measured per-browser cost"""
+    with fake_time(concurrency) as clock, fake_memory() as memory:
+        admission = MemoryAdmission(max_workers=4, reserve_mb=300, sample_interval=2.0)
+        # 820MB of Chrome over 2 browsers is 410MB a worker; 1200MB of headroom fits 2 more
+        assert admission.allowed_workers(active=2) == 4
+        assert admission.allowed_workers(active=1) == 3
+        memory.available = 500 * MB
+        assert admission.allowed_workers(active=2) == 4, "sample is cached for sample_interval"
+        clock.now += 2.5
+        assert admission.allowed_workers(active=2) == 2
+        assert admission.allowed_workers(active=0) == 1, "never below one"
+    assert round(admission.peak_chrome_mb) == 820 and round(admission.min_available_mb) == 500
+
+
+def test_memory_admission_skips_unreadable_processes():
+    """Processes that vanish or deny access are skipped; no browsers falls back to the default cost"""
+    with fake_time(concurrency), fake_memory() as memory:
+        memory.tree = [FakeProcess("chrome", 300, denied=True), FakeProcess("chromedriver", 20)]
+        admission = MemoryAdmission(max_workers=8, reserve_mb=300, default_worker_mb=400)
+        assert admission.snapshot() == (20.0, 1500.0)
+        assert admission.allowed_workers(active=0) == 3
+
+
+def test_admission_caps_concurrency():
+    """The AIMD limit is capped by memory admission, and admission is off without psutil"""
+    with fake_time(concurrency), fake_memory(available_mb=500):
+        controller = AdaptiveConcurrency(initial=4, max_limit=4, admission=MemoryAdmission(max_workers=4))
+        assert controller._allowed() == 1
+        concurrency.psutil = None
+        assert MemoryAdmission(max_workers=4).allowed_workers(active=0) == 4
+
+
+def main():
+    """Run all tests"""
+    print("Concurrency Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_additive_increase,
+        test_multiplicative_decrease_and_cooldown,
+        test_slot_waits_out_the_delay,
+        test_block_signal,
+        test_memory_admission,
+        test_memory_admission_skips_unreadable_processes,
+        test_admission_caps_concurrency,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded contact page crawl (contact_crawl.py)
+Runs against a local stub maker site, no network needed.
+"""
+
+import sys
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from contact_crawl import ContactCrawler, contact_links
+from http_fetcher import HttpFetcher
+from link_classifier import LinkClassifier
+from rate_limiter import HostRateLimiter
+
+# path -> (delay seconds, body)
+PAGES = {
+    "/contact": (0.0, "<html><body><h1>Contact</h1><p>Write to hello [at] orbit [dot] io</p></body></html>"),
+    "/about": (0.0, "<html><body><h1>About</h1><p>We make notes.</p></body></html>"),
+    "/team": (0.0, "<html><body><p>Our team</p></body></html>"),
+    "/imprint": (0.0, "<html><body><p>Orbit GmbH, legal@orbit.io</p></body></html>"),
+    "/slow/contact": (3.0, "<html><body><p>late@orbit.io</p></body></html>"),
+    "/slow/about": (3.0, "<html><body><p>Nothing</p></body></html>"),
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves PAGES, sleeping first for the slow ones"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        delay, body = PAGES.get(self.path, (0.0, None))
+        time.sleep(delay)
+        data = (body or "<html><body>Not found</body></html>").encode("utf-8")
+        self.send_response(200 if body else 404)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def start_stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.paths = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def make_crawler(**kwargs):
+    return ContactCrawler(HttpFetcher(timeout=5), HostRateLimiter({}, default_rate=100.0, default_burst=100), LinkClassifier(), **kwargs)
+
+
+def test_discovers_and_ranks_links():
+    """Only same-site contact-like links are kept, contact and imprint first"""
+    hrefs = [
+        "https://orbit.io/pricing",
+        "https://www.orbit.io/about-us",
+        "https://orbit.io/team/",
+        "https://other.com/contact",
+        "https://orbit.io/imprint",
+        "https://orbit.io/contact#form",
+        "https://orbit.io/contact",
+        "mailto:someone@orbit.io",
+        "https://orbit.io/blog/contacts-app-launch",
+        "https://orbit.io/",
+    ]
+    assert contact_links(hrefs, "https://orbit.io/") == [
+        "https://orbit.io/contact", "https://orbit.io/imprint", "https://www.orbit.io/about-us", "https://orbit.io/team/"]
+    assert contact_links(hrefs, "https://orbit.io/", limit=2) == ["https://orbit.io/contact", "https://orbit.io/imprint"]
+    assert contact_links(["https://orbit.io/features"], "https://orbit.io/") == []
+
+
+def test_finds_email_on_contact_page():
+    """An obfuscated email on the contact page is found"""
+    server, base = start_stub()
+    try:
+        crawler = make_crawler()
+        hrefs = [f"{base}/about", f"{base}/team", f"{base}/contact"]
+        assert crawler.find_email(f"{base}/", hrefs) == "hello@orbit.io"
+        assert crawler.stats["found"] == 1 and crawler.stats["crawls"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_stops_after_first_email():
+    """With one worker the crawl stops at the first page that has an email"""
+    server, base = start_stub()
+    try:
+        crawler = make_crawler(workers=1)
+        hrefs = [f"{base}/about", f"{base}/team", f"{base}/contact", f"{base}/imprint"]
+        assert crawler.find_email(f"{base}/", hrefs) == "hello@orbit.io"
+        assert server.paths == ["/contact"]
+    finally:
+        server.shutdown()
+
+
+def test_respects_domain_budget():
+    """Slow sites are abandoned once the per-domain budget runs out"""
+    server, base = start_stub()
+    try:
+        crawler = make_crawler(domain_budget=0.5)
+        start = time.monotonic()
+        email = crawler.find_email(f"{base}/", [f"{base}/slow/contact", f"{base}/slow/about"])
+        elapsed = time.monotonic() - start
+        assert email == ""
+        assert elapsed < 1.5, elapsed
+        assert crawler.stats["budget_exhausted"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_no_candidates_is_free():
+    """A landing page without contact-like links costs no requests"""
+    server, base = start_stub()
+    try:
+        crawler = make_crawler()
+        assert crawler.find_email(f"{base}/", [f"{base}/pricing", "https://x.com/orbit"]) == ""
+        assert server.paths == [] and crawler.stats["crawls"] == 0
+    finally:
+        server.shutdown()
+
+
+def main():
+    """Run all tests"""
+    print("Contact Crawl Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_discovers_and_ranks_links,
+        test_finds_email_on_contact_page,
+        test_stops_after_first_email,
+        test_respects_domain_budget,
+        test_no_candidates_is_free,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
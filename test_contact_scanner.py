@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming contact scanner (contact_scanner.py)
+"""
+
+import sys
+from contact_scanner import ContactScanner, scan_html, find_emails, decode_cfemail
+
+
+def cfemail(address, key=0x5a):
+    """Encode an address the way Cloudflare email protection does"""
+    return (bytes([key]) + bytes(b ^ key for b in address.encode())).hex()
+
+
+def test_rejects_asset_and_token_matches():
+    """Retina asset names, Sentry DSNs and placeholders are not emails"""
+    assert find_emails("logo@2x.png hero@3x.webp bundle@1.2.3.js") == []
+    assert find_emails("0123456789abcdef0123456789abcdef@o123456.ingest.sentry.io") == []
+    assert find_emails("you@example.com") == []
+    assert find_emails("Write to hello@orbit.io today") == ["hello@orbit.io"]
+
+
+def test_decodes_obfuscations():
+    """[at]/[dot] text, HTML entities and Cloudflare protection are decoded"""
+    assert find_emails("jane [at] orbit [dot] io") == ["jane@orbit.io"]
+    assert find_emails("jane(at)orbit.io") == ["jane@orbit.io"]
+    assert scan_html("<p>jane&#64;orbit&#46;io</p>").links["email"] == "jane@orbit.io"
+    assert decode_cfemail(cfemail("team@orbit.io")) == "team@orbit.io"
+    html = f'<a href="/cdn-cgi/l/email-protection" class="__cf_email__" data-cfemail="{cfemail("team@orbit.io")}">[email protected]</a>'
+    assert scan_html(html).links["email"] == "team@orbit.io"
+    html = f'<a href="/cdn-cgi/l/email-protection#{cfemail("sales@orbit.io")}">Email us</a>'
+    assert scan_html(html).links["email"] == "sales@orbit.io"
+
+
+def test_skips_script_and_style():
+    """Addresses and links inside script and style bodies are ignored"""
+    html = ('<html><head><script>var a = "dev@internal.io"; var l = "<a href=\\"https://x.com/fake\\">";</script>'
+            '<style>.a:after { content: "css@orbit.io" }</style></head>'
+            '<body><a href="/about">About</a><a href="https://x.com/orbit">X</a><p>hi@orbit.io</p></body></html>')
+    scanner = scan_html(html, "https://orbit.io/")
+    assert scanner.links == {"x": "https://x.com/orbit", "email": "hi@orbit.io"}
+    assert scanner.hrefs == ["https://orbit.io/about", "https://x.com/orbit"]
+
+
+def test_stops_when_fields_are_filled():
+    """Scanning stops early once every target field is found, even inside a huge page"""
+    head = '<html><body><a href="https://x.com/orbit">X</a><p>Mail: hi@orbit.io</p>'
+    html = head + "<p>padding</p>" * 200000 + "</body></html>"
+    scanner = scan_html(html, fields=["x", "email"])
+    assert scanner.done
+    assert scanner.chars_fed < 50000 < len(html)
+
+
+def test_large_script_is_linear():
+    """A multi-megabyte inline bundle fed in chunks is never handed to the parser, even with a split closing tag"""
+    scanner = ContactScanner()
+    scanner.feed("<html><head><script>")
+    chunk = "var icon = 'logo@2x.png'; var l = '<a href=\"https://x.com/fake\">';" * 200
+    for _ in range(200):
+        scanner.feed(chunk)
+    assert scanner.chars_skipped > 199 * len(chunk)
+    scanner.feed("</scr")
+    scanner.feed("ipt></head><body><a href='https://x.com/orbit'>X</a><p>hi@orbit.io</p></body></html>")
+    scanner.close()
+    assert scanner.links == {"x": "https://x.com/orbit", "email": "hi@orbit.io"}
+    assert scanner.hrefs == ["https://x.com/orbit"]
+
+
+def main():
+    """Run all tests"""
+    print("Contact Scanner Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_rejects_asset_and_token_matches,
+        test_decodes_obfuscations,
+        test_skips_script_and_style,
+        test_stops_when_fields_are_filled,
+        test_large_script_is_linear,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for the cross-run domain enrichment cache (domain_cache.py)
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+from domain_cache import DomainCache, registrable_domain, cache_key, DAY
+
+FIELDS = {"site_x": "https://x.com/orbit", "site_email": "hi@orbit.io"}
+
+
+def temp_cache(**kwargs):
+    return DomainCache(os.path.join(tempfile.mkdtemp(), "domains.sqlite3"), **kwargs)
+
+
+def test_registrable_domain():
+    """Subdomains, www and multi-part suffixes collapse to the registered domain"""
+    assert registrable_domain("https://www.orbit.io/pricing") == "orbit.io"
+    assert registrable_domain("https://app.orbit.io") == "orbit.io"
+    assert registrable_domain("https://shop.orbit.co.uk/") == "orbit.co.uk"
+    assert registrable_domain("https://orbit.com.au") == "orbit.com.au"
+    assert registrable_domain("https://orbit.vercel.app/") == "orbit.vercel.app"
+    assert registrable_domain("https://docs.orbit.github.io") == "orbit.github.io"
+    assert registrable_domain("http://127.0.0.1:8000/") == "127.0.0.1"
+
+
+def test_shared_platforms_are_not_cached():
+    """App stores, GitHub and Product Hunt redirects never share one entry"""
+    assert cache_key("https://apps.apple.com/app/orbit/id123") is None
+    assert cache_key("https://github.com/orbit/orbit") is None
+    assert cache_key("https://www.producthunt.com/r/ABC123") is None
+    assert cache_key("mailto:hi@orbit.io") is None
+    cache = temp_cache()
+    cache.put("https://github.com/orbit/orbit", FIELDS, "http")
+    assert cache.get("https://github.com/other/repo") is None
+    assert cache.stats["bypassed"] == 1 and cache.stats["stored"] == 0
+
+
+def test_hit_across_subdomains_and_runs():
+    """An entry stored by one run is a hit for another URL on the domain in the next run"""
+    cache = temp_cache()
+    assert cache.get("https://orbit.io/") is None
+    cache.put("https://orbit.io/", FIELDS, "http", final_url="https://www.orbit.io/home")
+    cache.close()
+    cache = DomainCache(cache.path)
+    assert cache.get("https://app.orbit.io/launch?ref=producthunt") == ("ok", FIELDS)
+    assert cache.stats == {**cache.stats, "hits": 1, "misses": 0}
+
+
+def test_redirect_target_is_cached():
+    """A URL that redirected to another domain is cached under both domains"""
+    cache = temp_cache()
+    cache.put("https://getorbit.com/", FIELDS, "browser", final_url="https://orbit.io/")
+    assert cache.get("https://orbit.io/") == ("ok", FIELDS)
+    assert cache.get("https://getorbit.com/") == ("ok", FIELDS)
+
+
+def test_ttl_and_negative_ttl():
+    """Fresh entries hit, dead sites expire sooner, expired entries count as misses"""
+    cache = temp_cache(ttl=10 * DAY, negative_ttl=1 * DAY)
+    cache.put("https://orbit.io/", FIELDS, "http")
+    cache.put("https://gone.dev/", {}, "failed", dead=True)
+    assert cache.get("https://gone.dev/") == ("dead", {})
+    cache._db.execute("UPDATE domains SET fetched_at = ?", (time.time() - 2 * DAY,))
+    assert cache.get("https://gone.dev/") is None
+    assert cache.get("https://orbit.io/") == ("ok", FIELDS)
+    assert cache.stats["negative_hits"] == 1 and cache.stats["expired"] == 1
+    cache._db.execute("UPDATE domains SET fetched_at = ?", (time.time() - 11 * DAY,))
+    assert cache.get("https://orbit.io/") is None
+    assert cache.prune() == 2
+
+
+def test_thread_safe():
+    """Website stage workers can read and write concurrently"""
+    cache = temp_cache()
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(50):
+                cache.put(f"https://site{n}-{i}.io/", FIELDS, "http")
+                assert cache.get(f"https://site{n}-{i}.io/") == ("ok", FIELDS)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors
+    assert cache.stats["hits"] == 400
+
+
+def main():
+    """Run all tests"""
+    print("Domain Cache Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_registrable_domain,
+        test_shared_platforms_are_not_cached,
+        test_hit_across_subdomains_and_runs,
+        test_redirect_target_is_cached,
+        test_ttl_and_negative_ttl,
+        test_thread_safe,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for the HTTP fast path and its browser fallback decisions (http_fetcher.py)
+Runs against a local stub site, no network needed.
+"""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http_fetcher import HttpFetcher, browser_fallback_reason
+from contact_scanner import ContactScanner
+
+FOOTER = "".join(f'<a href="/page-{n}">Page {n}</a>' for n in range(10))
+ARTICLE = "<p>" + "Orbit keeps your notes in orbit. " * 20 + "</p>"
+
+# path -> (status, content type, body)
+PAGES = {
+    "/site": (200, "text/html; charset=utf-8", f"<html><body>{ARTICLE}{FOOTER}</body></html>"),
+    "/challenge": (503, "text/html", "<html><head><title>Just a moment...</title></head><body></body></html>"),
+    "/challenge-200": (200, "text/html", '<html><body><script src="/cdn-cgi/challenge-platform/h/b/orchestrate/jsch/v1"></script></body></html>'),
+    "/shell": (200, "text/html", '<html><head><script src="/app.js"></script></head><body><div id="root"></div></body></html>'),
+    "/shell-noscript": (200, "text/html", f'<html><body><noscript>You need to enable JavaScript to run this app.</noscript>{ARTICLE}</body></html>'),
+    "/large": (200, "text/html", f"<html><body>{ARTICLE}{FOOTER}" + "<p>padding</p>" * 20000 + "</body></html>"),
+    "/missing": (404, "text/html", "<html><body><h1>Not found</h1></body></html>"),
+    "/report.pdf": (200, "application/pdf", "%PDF-1.4"),
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        status, content_type, body = PAGES[self.path]
+        body = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def scan(base, path, max_bytes=None):
+    """Scan a stub page as the website stage does and return (page, fallback reason)"""
+    scanner = ContactScanner()
+    page = HttpFetcher().scan(base + path, scanner, max_bytes=max_bytes)
+    return page, browser_fallback_reason(page, {"hrefs": scanner.hrefs, "text_length": scanner.text_length})
+
+
+def test_static_site_is_used():
+    """A static page with text and links is served by HTTP"""
+    server, base = start_stub()
+    try:
+        page, reason = scan(base, "/site")
+        assert reason == "" and page["status"] == 200 and not page["truncated"]
+    finally:
+        server.shutdown()
+
+
+def test_challenges_go_to_browser():
+    """Bot challenges fall back to a browser, by status or by page markers"""
+    server, base = start_stub()
+    try:
+        assert scan(base, "/challenge")[1] == "HTTP 503"
+        assert scan(base, "/challenge-200")[1] == "bot challenge"
+    finally:
+        server.shutdown()
+
+
+def test_javascript_shells_go_to_browser():
+    """Pages that render their content with JavaScript fall back to a browser"""
+    server, base = start_stub()
+    try:
+        assert scan(base, "/shell")[1] == "JavaScript shell"
+        assert scan(base, "/shell-noscript")[1] == "JavaScript shell"
+    finally:
+        server.shutdown()
+
+
+def test_truncated_body_is_used():
+    """A body cut off at max_bytes is still usable when the part read has the links"""
+    server, base = start_stub()
+    try:
+        page, reason = scan(base, "/large", max_bytes=32768)
+        assert page["truncated"] and page["bytes_read"] == 32768
+        assert reason == ""
+    finally:
+        server.shutdown()
+
+
+def test_errors_and_downloads_stay_on_http():
+    """Error pages and downloads stay on HTTP; a refused connection is marked unreachable"""
+    server, base = start_stub()
+    try:
+        page, reason = scan(base, "/missing")
+        assert page["status"] == 404 and reason == ""
+        page, reason = scan(base, "/report.pdf")
+        assert page["non_html"] and reason == ""
+    finally:
+        server.shutdown()
+    meta = {}
+    assert HttpFetcher(timeout=2).scan("http://127.0.0.1:1/", ContactScanner(), meta=meta) is None
+    assert meta["unreachable"] == "refused"
+    assert browser_fallback_reason(None, {"hrefs": [], "text_length": 0}) == "request failed"
+
+
+def main():
+    """Run all tests"""
+    print("HTTP Fetcher Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_static_site_is_used,
+        test_challenges_go_to_browser,
+        test_javascript_shells_go_to_browser,
+        test_truncated_body_is_used,
+        test_errors_and_downloads_stay_on_http,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
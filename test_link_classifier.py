@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the social/email link classifier (link_classifier.py)
+"""
+
+import sys
+from link_classifier import LinkClassifier, Platform, PLATFORMS, LINK_FIELDS
+
+classifier = LinkClassifier()
+
+
+def field(href):
+    match = classifier.classify(href)
+    return match[0] if match else None
+
+
+def test_host_based_matching():
+    """Platforms are matched on the host, not on substrings of the URL"""
+    assert field("https://www.dropbox.com/s/abc/file.pdf") is None
+    assert field("https://netflix.com/title/1") is None
+    assert field("https://example.com/?ref=instagram.com") is None
+    assert field("https://x.com/orbitnotes") == "x"
+    assert field("https://mobile.twitter.com/orbitnotes") == "x"
+    assert field("https://m.youtube.com/@orbitnotes") == "youtube"
+    assert field("https://youtu.be/dQw4w9WgXcQ") == "youtube"
+    assert field("https://www.tiktok.com/@orbitnotes") == "tiktok"
+    assert field("https://github.com/orbit-notes") == "github"
+    assert field("https://discord.gg/abc123") == "discord"
+    assert field("https://discord.com/invite/abc123") == "discord"
+    assert field("https://discord.com/channels/1/2") is None
+
+
+def test_linkedin_and_skips():
+    """LinkedIn splits by path; share buttons, embeds, site pages and Product Hunt's own accounts are skipped"""
+    assert field("https://www.linkedin.com/company/orbit-notes/") == "linkedin_company"
+    assert field("https://linkedin.com/in/danali") == "linkedin_personal"
+    assert field("https://www.linkedin.com/shareArticle?url=x") is None
+    assert field("https://www.linkedin.com/company/") is None
+    assert field("https://twitter.com/intent/tweet?text=hi") is None
+    assert field("https://www.facebook.com/sharer/sharer.php?u=x") is None
+    assert field("https://x.com/producthunt") is None
+    assert field("https://www.instagram.com/producthunt/") is None
+    assert field("https://www.linkedin.com/company/producthunt") is None
+    assert field("https://www.linkedin.com/company/producthunt/posts/") is None
+    assert field("https://www.facebook.com/") is None
+    assert field("https://www.youtube.com/embed/dQw4w9WgXcQ") is None
+    assert field("https://www.youtube.com/watch?v=dQw4w9WgXcQ") is None
+    assert field("https://github.com/features/actions") is None
+    assert field("https://github.com/pricing") is None
+    assert field("https://github.com/sponsors/orbit-notes") is None
+    assert field("https://www.tiktok.com/discover/ai-tools") is None
+
+
+def test_email_and_first_links():
+    """One pass keeps the first link per field and decodes mailto targets"""
+    links = classifier.first_links([
+        None,
+        "https://www.dropbox.com/s/abc",
+        "mailto:hello%40orbit.example?subject=Hi",
+        "https://x.com/first",
+        "https://x.com/second",
+        "mailto:",
+        "javascript:void(0)",
+        "https://[broken",
+    ])
+    assert links == {"email": "hello@orbit.example", "x": "https://x.com/first"}
+    assert set(LINK_FIELDS) >= {"youtube", "tiktok", "github", "discord", "email"}
+
+
+def test_pluggable_platforms():
+    """Extra platforms can be added to the table"""
+    custom = LinkClassifier(PLATFORMS + [Platform("mastodon", ("mastodon.social",), None)])
+    assert custom.classify("https://mastodon.social/@orbit") == ("mastodon", "https://mastodon.social/@orbit")
+    assert "mastodon" in custom.fields
+
+
+def main():
+    """Run all tests"""
+    print("Link Classifier Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_host_based_matching,
+        test_linkedin_and_skips,
+        test_email_and_first_links,
+        test_pluggable_platforms,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the embedded page state extractor (page_state.py)
+Runs against saved HTML fixtures, no browser or network needed.
+"""
+
+import sys
+from pathlib import Path
+from page_state import extract_listing, extract_product_page
+
+HERE = Path(__file__).resolve().parent
+FIXTURES = HERE / "fixtures"
+
+
+def read(path):
+    return path.read_text(encoding="utf-8")
+
+
+def test_listing_from_flight_payload():
+    """Homepage posts are read from App Router flight chunks, in page order"""
+    listing = extract_listing(read(FIXTURES / "producthunt_homepage_state.html"))
+    assert [p["name"] for p in listing] == ["Orbit Notes", "Pixel Forge", "Quiet Inbox"]
+    first = listing[0]
+    assert first["post_id"] == "981234"
+    assert first["url"] == "https://www.producthunt.com/posts/orbit-notes"
+    assert first["tagline"] == "Notes that organize themselves"
+    assert first["topics"] == ["Productivity", "Artificial Intelligence"]
+    assert first["upvotes"] == "412"
+    assert first["image_url"] == "https://ph-files.imgix.net/a1b2c3d4-orbit.png"
+    assert listing[1]["image_url"] == "https://ph-files.imgix.net/pixel-forge.gif"
+    assert listing[2]["upvotes"] == "0" and listing[2]["topics"] == []
+
+
+def test_product_page_from_apollo_cache():
+    """Website and maker links are resolved through the normalized Apollo cache"""
+    state = extract_product_page(read(FIXTURES / "producthunt_post_state.html"),
+                                 "https://www.producthunt.com/posts/orbit-notes")
+    assert state["website_url"] == "https://www.producthunt.com/r/ORBITNOTES"
+    assert "https://www.linkedin.com/company/orbit-notes" in state["hrefs"]
+    assert "https://www.instagram.com/orbitnotes" in state["hrefs"]
+    assert "https://x.com/danali" in state["hrefs"]
+    assert "https://www.linkedin.com/in/danali" in state["hrefs"]
+
+
+def test_product_page_ignores_related_posts():
+    """The page's own post is picked among related posts, and a missing one is not replaced by them"""
+    html = read(FIXTURES / "producthunt_post_related.html")
+    state = extract_product_page(html, "https://www.producthunt.com/posts/quiet-inbox")
+    assert state["website_url"] == "https://www.producthunt.com/r/QUIETINBOX"
+    assert state["hrefs"] == ["https://www.linkedin.com/company/quiet-inbox"]
+    assert extract_product_page(html, "https://www.producthunt.com/posts/orbit-notes") is None
+    assert extract_product_page(read(FIXTURES / "producthunt_post_state.html"),
+                                "https://www.producthunt.com/posts/quiet-inbox") is None
+
+
+def test_page_without_posts():
+    """The saved 404 capture has flight data but no posts, so callers fall back to the DOM"""
+    html = read(HERE / "producthunt_page_source.html")
+    assert extract_listing(html) == []
+    assert extract_product_page(html) is None
+
+
+def test_garbage_input():
+    """Malformed state never raises"""
+    html = '<script>self.__next_f.push([1,"0:{not json\\n1:T5,{]}"])</script><script id="__NEXT_DATA__">{</script>'
+    assert extract_listing(html) == []
+    assert extract_product_page(html) is None
+
+
+def main():
+    """Run all tests"""
+    print("Page State Extractor Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_listing_from_flight_payload,
+        test_product_page_from_apollo_cache,
+        test_product_page_ignores_related_posts,
+        test_page_without_posts,
+        test_garbage_input,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the staged enrichment pipeline (pipeline.py)
+"""
+
+import sys
+import threading
+from pipeline import Pipeline, Stage
+
+
+def run_with_timeout(pipeline, source, timeout=10):
+    """Run the pipeline in a thread and fail instead of hanging if a stage is never drained"""
+    outcome = {}
+
+    def run():
+        try:
+            outcome["results"] = pipeline.run(source)
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "pipeline did not drain"
+    return outcome
+
+
+def test_items_flow_through_every_stage():
+    """Every item passes each stage in order and comes out of the last one"""
+    pipeline = Pipeline([
+        Stage("double", lambda n: n * 2, workers=3),
+        Stage("label", lambda n: f"item-{n}", workers=2, queue_size=2),
+    ])
+    results = run_with_timeout(pipeline, range(50))["results"]
+    assert sorted(results) == sorted(f"item-{n * 2}" for n in range(50))
+    assert pipeline.stages[0].stats["processed"] == 50 and pipeline.stages[1].stats["processed"] == 50
+    assert pipeline.stages[1].stats["max_queued"] <= 2
+
+
+def test_dropped_items_stop_early():
+    """A stage returning None drops the item, and later stages never see it"""
+    seen = []
+    pipeline = Pipeline([
+        Stage("evens", lambda n: n if n % 2 == 0 else None, workers=2),
+        Stage("record", lambda n: seen.append(n) or n),
+    ])
+    results = run_with_timeout(pipeline, range(10))["results"]
+    assert sorted(results) == [0, 2, 4, 6, 8] and sorted(seen) == [0, 2, 4, 6, 8]
+    assert pipeline.stages[0].stats["dropped"] == 5 and pipeline.stages[1].stats["dropped"] == 0
+
+
+def test_worker_exceptions_are_counted():
+    """An exception drops that one item; the worker keeps going and the run still drains"""
+    def fragile(n):
+        if n == 3:
+            raise ValueError("bad item")
+        return n
+
+    pipeline = Pipeline([Stage("fragile", fragile), Stage("pass", lambda n: n, workers=2)])
+    results = run_with_timeout(pipeline, range(6))["results"]
+    assert sorted(results) == [0, 1, 2, 4, 5]
+    stats = pipeline.stages[0].stats
+    assert (stats["processed"], stats["dropped"], stats["errors"]) == (5, 1, 1), stats
+
+
+def test_every_worker_gets_a_sentinel():
+    """Stages with more workers than items, and a source that fails midway, still shut every worker down"""
+    pipeline = Pipeline([Stage("first", lambda n: n, workers=4), Stage("second", lambda n: n, workers=5)])
+    assert run_with_timeout(pipeline, [1])["results"] == [1]
+
+    def failing_source():
+        yield 1
+        raise RuntimeError("listing broke")
+
+    pipeline = Pipeline([Stage("first", lambda n: n, workers=3), Stage("second", lambda n: n, workers=2)])
+    outcome = run_with_timeout(pipeline, failing_source())
+    assert isinstance(outcome.get("error"), RuntimeError)
+    assert pipeline.results == [1]
+    assert not [t for t in threading.enumerate() if t.name.startswith(("first-", "second-"))]
+
+
+def main():
+    """Run all tests"""
+    print("Pipeline Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_items_flow_through_every_stage,
+        test_dropped_items_stop_early,
+        test_worker_exceptions_are_counted,
+        test_every_worker_gets_a_sentinel,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite product store (product_store.py)
+"""
+
+import os
+import csv
+import sys
+import tempfile
+import threading
+from product_store import ProductStore, DONE, FAILED
+
+
+def record(n, **extra):
+    return {"name": f"Product {n}", "url": f"https://www.producthunt.com/posts/product-{n}", "post_id": str(900000 + n),
+            "topics": ["AI"], **extra}
+
+
+def temp_store():
+    return ProductStore(os.path.join(tempfile.mkdtemp(), "products.sqlite3"))
+
+
+def test_new_and_resumed_products():
+    """A new product has no row; after its PH page stage it resumes with the stored data"""
+    store = temp_store()
+    assert store.created
+    assert store.seen(record(1), "2026-10-17") is None
+    store.mark(record(1, website_url="https://orbit.io", ph_x="https://x.com/orbit"), "ph_page", DONE)
+    row = store.seen(record(1), "2026-10-17")
+    assert row["ph_page_status"] == DONE and row["website_status"] is None and row["delivery_status"] is None
+    assert row["data"]["ph_x"] == "https://x.com/orbit" and row["ph_page_at"] > 0
+    assert store.stats == {"new": 1, "resumed": 1, "skipped": 0}
+    assert store._db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_delivered_skipped_across_midnight():
+    """A product delivered yesterday is skipped today, and appears in today's export"""
+    store = temp_store()
+    store.seen(record(2), "2026-10-17")
+    for stage in ("ph_page", "website"):
+        store.mark(record(2, site_email="hi@orbit.io"), stage, DONE)
+    store.mark(record(2, site_email="hi@orbit.io", email="hi@orbit.io"), "delivery", DONE)
+    store.close()
+    store = ProductStore(store.path)
+    assert not store.created
+    row = store.seen(record(2), "2026-10-18")
+    assert row["delivery_status"] == DONE
+    assert store.stats["skipped"] == 1
+    assert [p["email"] for p in store.products("2026-10-18")] == ["hi@orbit.io"]
+    assert store.products("2026-10-17") == []
+
+
+def test_failed_delivery_is_retried():
+    """A failed webhook leaves the product resumable rather than skipped"""
+    store = temp_store()
+    store.seen(record(3), "2026-10-18")
+    store.mark(record(3), "delivery", FAILED)
+    assert store.seen(record(3), "2026-10-18")["delivery_status"] == FAILED
+    assert store.stats["resumed"] == 1
+
+
+def test_failed_stage_is_not_done():
+    """A delivered product whose website fetch failed is resumed, not skipped"""
+    store = temp_store()
+    store.seen(record(6), "2026-10-17")
+    store.mark(record(6), "ph_page", DONE)
+    store.mark(record(6), "website", FAILED)
+    store.mark(record(6), "delivery", DONE)
+    row = store.seen(record(6), "2026-10-18")
+    assert not ProductStore.complete(row) and row["ph_page_status"] == DONE
+    store.mark(record(6), "website", DONE)
+    assert ProductStore.complete(store.seen(record(6), "2026-10-18"))
+    assert store.stats == {"new": 1, "resumed": 1, "skipped": 1}
+
+
+def test_matches_by_post_id():
+    """A product whose URL changed is still found by post id"""
+    store = temp_store()
+    store.seen(record(4), "2026-10-18")
+    moved = record(4, url="https://www.producthunt.com/products/orbit")
+    store.mark(moved, "ph_page", DONE)
+    row = store.get(moved["url"], moved["post_id"])
+    assert row["ph_page_status"] == DONE and row["url"] == record(4)["url"]
+    plan = " ".join(str(step[-1]) for step in store._db.execute("EXPLAIN QUERY PLAN SELECT * FROM products WHERE post_id = ?", ("1",)))
+    assert "products_post_id" in plan, plan
+
+
+def test_imports_legacy_csv():
+    """Rows of a pre-store daily CSV are imported once as delivered"""
+    path = os.path.join(tempfile.mkdtemp(), "producthunt_products_20261018.csv")
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["name", "url", "email"])
+        writer.writeheader()
+        writer.writerow({"name": "Product 5", "url": record(5)["url"], "email": "a@orbit.io"})
+        writer.writerow({"name": "No URL", "url": "", "email": ""})
+    store = temp_store()
+    assert store.import_csv(path, "2026-10-18") == 1
+    assert store.import_csv(path, "2026-10-18") == 0
+    assert store.seen(record(5), "2026-10-18")["delivery_status"] == DONE
+
+
+def test_concurrent_writers():
+    """Pipeline workers can record stages concurrently"""
+    store = temp_store()
+    errors = []
+
+    def worker(offset):
+        try:
+            for n in range(offset, offset + 50):
+                store.seen(record(n), "2026-10-18")
+                store.mark(record(n), "ph_page", DONE)
+                store.mark(record(n), "website", DONE)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i * 100,)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors
+    assert len(store.products("2026-10-18")) == 300
+
+
+def main():
+    """Run all tests"""
+    print("Product Store Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_new_and_resumed_products,
+        test_delivered_skipped_across_midnight,
+        test_failed_delivery_is_retried,
+        test_failed_stage_is_not_done,
+        test_matches_by_post_id,
+        test_imports_legacy_csv,
+        test_concurrent_writers,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Tests for the Product Hunt GraphQL API client (producthunt_api.py)
+Runs against a local stub server that paginates like the real API, no token or network needed.
+"""
+
+import sys
+import json
+import time
+import threading
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from producthunt_api import ProductHuntAPI
+
+TOKEN = "test-token"
+TOTAL_POSTS = 45
+
+
+def make_node(n):
+    return {
+        "id": str(900000 + n),
+        "name": f"Product {n}",
+        "slug": f"product-{n}",
+        "tagline": f"Tagline {n}",
+        "votesCount": 100 - n,
+        "thumbnail": {"url": f"https://ph-files.imgix.net/{n}.png"},
+        "topics": {"edges": [{"node": {"name": "Productivity"}}]},
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves POSTS_QUERY pages with opaque cursors; the first request of a run can be a 429"""
+
+    server_version = "StubGraphQL/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.server.requests.append(self.headers.get("Authorization"))
+        if self.headers.get("Authorization") != f"Bearer {TOKEN}":
+            return self._send(401, {"error": "invalid_token"})
+        if self.server.rate_limit_once:
+            self.server.rate_limit_once = False
+            return self._send(429, {"errors": [{"message": "rate limited"}]}, {"X-Rate-Limit-Reset": "0"})
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        variables = body["variables"]
+        self.server.variables.append(variables)
+        start = int(variables["after"] or 0)
+        end = min(start + variables["first"], TOTAL_POSTS)
+        self._send(200, {"data": {"posts": {
+            "pageInfo": {"hasNextPage": end < TOTAL_POSTS, "endCursor": str(end)},
+            "edges": [{"node": make_node(n)} for n in range(start, end)],
+        }}})
+
+    def _send(self, status, payload, headers=None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def start_stub(rate_limit_once=False):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.requests = []
+    server.variables = []
+    server.rate_limit_once = rate_limit_once
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v2/api/graphql"
+
+
+def test_cursor_pagination():
+    """All pages are followed and records match the homepage listing schema"""
+    server, url = start_stub()
+    try:
+        client = ProductHuntAPI(token=TOKEN, api_url=url, page_size=20)
+        records = list(client.iter_posts(date(2026, 3, 2)))
+        assert len(records) == TOTAL_POSTS
+        assert len(server.requests) == 3
+        assert [v["after"] for v in server.variables] == [None, "20", "40"]
+        assert server.variables[0]["postedAfter"] == "2026-03-02T00:00:00-08:00"
+        assert server.variables[0]["postedBefore"] == "2026-03-03T00:00:00-08:00"
+        first = records[0]
+        assert set(first) == {"name", "tagline", "url", "post_id", "image_url", "topics", "upvotes"}
+        assert first["url"] == "https://www.producthunt.com/posts/product-0"
+        assert first["post_id"] == "900000"
+        assert first["upvotes"] == "100"
+        assert first["topics"] == ["Productivity"]
+        assert client.stats == {**client.stats, "requests": 3, "posts": TOTAL_POSTS}
+        client.close()
+    finally:
+        server.shutdown()
+
+
+def test_rate_limit_retry():
+    """A 429 is waited out and the same page is requested again"""
+    server, url = start_stub(rate_limit_once=True)
+    try:
+        client = ProductHuntAPI(token=TOKEN, api_url=url, page_size=50)
+        records = list(client.iter_posts(date(2026, 7, 1)))
+        assert len(records) == TOTAL_POSTS
+        assert client.stats["requests"] == 2
+        # Daylight saving time: Product Hunt days start at midnight PDT in summer
+        assert server.variables[0]["postedAfter"] == "2026-07-01T00:00:00-07:00"
+        client.close()
+    finally:
+        server.shutdown()
+
+
+def test_token_required():
+    """The client refuses to start without a token"""
+    try:
+        ProductHuntAPI(token="", api_url="http://127.0.0.1:9/")
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError without a token")
+
+
+def report_throughput():
+    """Print requests/sec and posts/sec against the stub (measures client overhead only)"""
+    server, url = start_stub()
+    try:
+        client = ProductHuntAPI(token=TOKEN, api_url=url, page_size=20)
+        started = time.perf_counter()
+        for _ in range(20):
+            list(client.iter_posts(date(2026, 3, 2)))
+        elapsed = time.perf_counter() - started
+        print(f"  {client.stats['requests'] / elapsed:.0f} requests/sec, {client.stats['posts'] / elapsed:.0f} posts/sec")
+        client.close()
+    finally:
+        server.shutdown()
+
+
+def main():
+    """Run all tests"""
+    print("Product Hunt API Client Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_cursor_pagination,
+        test_rate_limit_retry,
+        test_token_required,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    print("Stub server throughput:")
+    report_throughput()
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent Chrome profile pool (profile_pool.py)
+Uses a temporary directory, no browser needed.
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+from profile_pool import ProfilePool, FirstPageStats
+
+
+def test_profiles_are_exclusive():
+    """A locked profile is never handed out twice, and all-locked raises"""
+    with tempfile.TemporaryDirectory() as root:
+        first = ProfilePool(root, size=2)
+        # A second pool on the same root stands in for another scraper process
+        second = ProfilePool(root, size=2)
+        a, _ = first.acquire()
+        b, _ = second.acquire()
+        assert a != b
+        try:
+            first.acquire()
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("expected RuntimeError with every profile locked")
+        first.release(a)
+        c, _ = second.acquire()
+        assert c == a
+
+
+def test_rotation_and_reuse_flag():
+    """Profiles rotate, and a profile Chrome has used before is reported as reused"""
+    with tempfile.TemporaryDirectory() as root:
+        pool = ProfilePool(root, size=2)
+        a, reused = pool.acquire()
+        assert not reused
+        os.makedirs(os.path.join(a, "Default"))  # What Chrome leaves behind
+        pool.release(a)
+        b, _ = pool.acquire()
+        assert b != a
+        pool.release(b)
+        again, reused = pool.acquire()
+        assert again == a and reused
+
+
+def test_stale_lock_is_taken_over():
+    """Locks left by a dead process or older than stale_after are removed"""
+    with tempfile.TemporaryDirectory() as root:
+        pool = ProfilePool(root, size=1, stale_after=60)
+        path = os.path.join(root, "profile-1")
+        with open(f"{path}.lock", "w", encoding="utf-8") as f:
+            f.write("12345 some-other-host")
+        old = time.time() - 120
+        os.utime(f"{path}.lock", (old, old))
+        acquired, _ = pool.acquire()
+        assert acquired == path
+        with open(f"{path}.lock", encoding="utf-8") as f:
+            assert f.read().split()[0] == str(os.getpid())
+
+
+def test_stale_lock_taken_over_once():
+    """Pools racing for the same stale lock end with exactly one owner"""
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, "profile-1")
+        with open(f"{path}.lock", "w", encoding="utf-8") as f:
+            f.write("12345 some-other-host")
+        old = time.time() - 120
+        os.utime(f"{path}.lock", (old, old))
+        pools = [ProfilePool(root, size=1, stale_after=60) for _ in range(8)]
+        start = threading.Barrier(len(pools))
+        owners = []
+
+        def race(pool):
+            start.wait()
+            try:
+                owners.append(pool.acquire()[0])
+            except RuntimeError:
+                pass
+
+        threads = [threading.Thread(target=race, args=(pool,)) for pool in pools]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert owners == [path], owners
+        assert os.path.exists(f"{path}.lock")
+        assert sorted(os.listdir(root)) == ["profile-1", "profile-1.lock"]
+
+
+def test_held_lock_is_refreshed():
+    """A lock held longer than stale_after is touched and not taken over"""
+    with tempfile.TemporaryDirectory() as root:
+        holder = ProfilePool(root, size=1, stale_after=4)
+        path, _ = holder.acquire()
+        old = time.time() - 60
+        os.utime(f"{path}.lock", (old, old))
+        time.sleep(1.5)
+        assert os.path.getmtime(f"{path}.lock") > old + 30
+        try:
+            ProfilePool(root, size=1, stale_after=4).acquire()
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("a held lock was taken over")
+        holder.release(path)
+
+
+def test_first_page_stats():
+    """First page loads are split by profile reuse"""
+    stats = FirstPageStats()
+    stats.record(True, 1.0, "")
+    stats.record(False, 3.0, "challenge title 'Just a moment...'")
+    stats.record(False, 2.0, "")
+    assert stats.data[True] == {"drivers": 1, "challenged": 0, "seconds": 1.0}
+    assert stats.data[False] == {"drivers": 2, "challenged": 1, "seconds": 5.0}
+
+
+def main():
+    """Run all tests"""
+    print("Profile Pool Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_profiles_are_exclusive,
+        test_rotation_and_reuse_flag,
+        test_stale_lock_is_taken_over,
+        test_stale_lock_taken_over_once,
+        test_held_lock_is_refreshed,
+        test_first_page_stats,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
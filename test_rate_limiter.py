@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-host token-bucket rate limiter (rate_limiter.py)
+Runs on a fake clock, so nothing actually sleeps.
+"""
+
+import sys
+import rate_limiter
+from rate_limiter import HostRateLimiter, host_key
+from fake_clock import fake_time
+
+
+def test_burst_then_steady_rate():
+    """A full bucket allows `burst` requests at once, then one per 1/rate seconds"""
+    with fake_time(rate_limiter) as clock:
+        limiter = HostRateLimiter({"orbit.io": (2.0, 3)})
+        waits = [limiter.acquire("https://orbit.io/") for _ in range(5)]
+        assert waits == [0.0, 0.0, 0.0, 0.5, 0.5], waits
+        assert clock.slept == [0.5, 0.5]
+        assert limiter.stats == {"acquired": 5, "delayed": 2, "wait_seconds": 1.0}
+
+
+def test_refill_is_capped_at_burst():
+    """Idle time refills the bucket, but never beyond the burst size"""
+    with fake_time(rate_limiter) as clock:
+        limiter = HostRateLimiter({"orbit.io": (1.0, 2)})
+        for _ in range(2):
+            limiter.acquire("https://orbit.io/")
+        clock.now += 1.5
+        assert limiter.acquire("https://orbit.io/") == 0.0
+        assert limiter.acquire("https://orbit.io/") == 0.5
+        clock.now += 60
+        waits = [limiter.acquire("https://orbit.io/") for _ in range(3)]
+        assert waits == [0.0, 0.0, 1.0], waits
+
+
+def test_hosts_have_separate_buckets():
+    """Subdomains share their configured parent's bucket; other hosts get the default limits"""
+    with fake_time(rate_limiter):
+        limiter = HostRateLimiter({"producthunt.com": (0.5, 1)}, default_rate=1.0, default_burst=1)
+        assert limiter.acquire("https://www.producthunt.com/posts/a") == 0.0
+        assert limiter.acquire("https://api.producthunt.com/v2") == 2.0
+        assert limiter.acquire("https://orbit.io/") == 0.0
+        assert limiter.acquire("https://www.orbit.io/about") == 1.0
+        assert host_key("https://WWW.Orbit.io./x") == "orbit.io"
+        assert host_key("orbit.io") == "orbit.io"
+
+
+def main():
+    """Run all tests"""
+    print("Rate Limiter Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_burst_then_steady_rate,
+        test_refill_is_capped_at_burst,
+        test_hosts_have_separate_buckets,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Tests for the HTTP redirect resolver (redirect_resolver.py)
+Runs against a local stub redirect service, no network needed.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from redirect_resolver import RedirectResolver, is_redirect_link
+from http_fetcher import HttpFetcher
+from rate_limiter import HostRateLimiter
+from producthunt_scraper import ProductHuntScraper
+
+# path -> (status, Location)
+ROUTES = {
+    "/r/abc": (302, "/hop?ref=producthunt"),
+    "/hop?ref=producthunt": (301, "/home?ref=producthunt#top"),
+    "/home?ref=producthunt": (200, None),
+    "/r/nohead": (302, "/nohead-site"),
+    "/nohead-site": (200, None),
+    "/r/challenge": (403, None),
+    "/r/interstitial": (200, None),
+    "/r/loop": (302, "/r/loop"),
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Redirects per ROUTES; /nohead-site answers HEAD with 405 like some servers"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _route(self, method):
+        self.server.requests.append((method, self.path))
+        if method == "HEAD" and self.path == "/nohead-site":
+            status, location = 405, None
+        else:
+            status, location = ROUTES.get(self.path, (404, None))
+        body = b"" if method == "HEAD" else b"<html><body>" + b"x" * 100000 + b"</body></html>"
+        self.send_response(status)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self._route("HEAD")
+
+    def do_GET(self):
+        self._route("GET")
+
+
+def start_stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.requests = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def make_resolver(path=None):
+    clean = lambda url: ProductHuntScraper.clean_url(None, url)
+    return RedirectResolver(HttpFetcher(), HostRateLimiter({}, default_rate=100.0, default_burst=100), clean=clean, path=path)
+
+
+def test_only_product_hunt_links_are_redirects():
+    """Only Product Hunt's own links are sent through the resolver"""
+    assert is_redirect_link("https://www.producthunt.com/r/abc123")
+    assert is_redirect_link("https://producthunt.com/r/abc123")
+    assert not is_redirect_link("https://orbit.io/?ref=producthunt")
+    assert not is_redirect_link("https://notproducthunt.com/r/abc")
+    assert not is_redirect_link("")
+    assert not is_redirect_link(None)
+
+
+def test_follows_chain_and_cleans():
+    """A two-hop chain resolves to the final URL without tracking params or fragment, using HEAD only"""
+    server, base = start_stub()
+    try:
+        resolver = make_resolver()
+        assert resolver.resolve(f"{base}/r/abc") == f"{base}/home"
+        assert [method for method, _ in server.requests] == ["HEAD", "HEAD", "HEAD"]
+        assert resolver.stats["hops"] == 2
+    finally:
+        server.shutdown()
+
+
+def test_falls_back_to_get():
+    """A server that rejects HEAD is retried with a GET"""
+    server, base = start_stub()
+    try:
+        assert make_resolver().resolve(f"{base}/r/nohead") == f"{base}/nohead-site"
+        assert ("GET", "/nohead-site") in server.requests
+    finally:
+        server.shutdown()
+
+
+def test_memoized_within_and_across_runs():
+    """Repeat lookups cost no requests, in the same run and in a later one"""
+    server, base = start_stub()
+    path = os.path.join(tempfile.mkdtemp(), "cache.sqlite3")
+    try:
+        resolver = make_resolver(path)
+        resolver.resolve(f"{base}/r/abc")
+        count = len(server.requests)
+        assert resolver.resolve(f"{base}/r/abc") == f"{base}/home"
+        resolver.close()
+        resolver = make_resolver(path)
+        assert resolver.resolve(f"{base}/r/abc") == f"{base}/home"
+        assert len(server.requests) == count
+        assert resolver.stats["stored_hits"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_unresolvable_returns_original():
+    """A refused redirect or a loop hands back the original link for the website stage to handle"""
+    server, base = start_stub()
+    try:
+        resolver = make_resolver()
+        assert resolver.resolve(f"{base}/r/challenge") == f"{base}/r/challenge"
+        assert resolver.resolve(f"{base}/r/loop") == f"{base}/r/loop"
+        assert resolver.resolve("") == ""
+        assert resolver.stats["failed"] == 2
+    finally:
+        server.shutdown()
+
+
+def test_product_hunt_pages_are_not_resolutions():
+    """A link answered without a redirect, or redirected back to Product Hunt, is neither resolved nor stored"""
+    server, base = start_stub()
+    path = os.path.join(tempfile.mkdtemp(), "redirects.sqlite3")
+    try:
+        resolver = make_resolver(path)
+        assert resolver.resolve(f"{base}/r/interstitial") == f"{base}/r/interstitial"
+        link = "https://www.producthunt.com/r/abc123"
+        resolver._hop = lambda url: (302, "https://www.producthunt.com/posts/orbit") if url == link else (200, None)
+        assert resolver.resolve(link) == link
+        assert resolver.stats["failed"] == 2 and resolver.stats["resolved"] == 0
+        resolver.close()
+        assert make_resolver(path)._stored(f"{base}/r/interstitial") is None
+    finally:
+        server.shutdown()
+
+
+def main():
+    """Run all tests"""
+    print("Redirect Resolver Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_only_product_hunt_links_are_redirects,
+        test_follows_chain_and_cleans,
+        test_falls_back_to_get,
+        test_memoized_within_and_across_runs,
+        test_unresolvable_returns_original,
+        test_product_hunt_pages_are_not_resolutions,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
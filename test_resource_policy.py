@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for DevTools resource blocking (resource_policy.py)
+Uses a fake driver that records CDP commands, no browser needed.
+"""
+
+import sys
+import json
+from resource_policy import ResourcePolicy, BLOCK_CATEGORIES, compile_patterns
+
+
+class FakeDriver:
+    """Records setBlockedURLs calls and serves a page weight that depends on whether blocking is on"""
+
+    def __init__(self):
+        self.blocked = None
+        self.loads = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == "Network.setBlockedURLs":
+            self.blocked = list(params["urls"])
+        return {}
+
+    def get(self, url):
+        self.loads.append((url, bool(self.blocked)))
+        self.page_bytes = 200_000 if self.blocked else 1_000_000
+
+    def execute_script(self, script):
+        return json.dumps({"network": 1, "network_bytes": self.page_bytes, "cache": 0, "cache_bytes": 0, "opaque": 0})
+
+
+def test_allow_and_deny_lists():
+    """Categories, deny patterns and allow patterns combine into one block list"""
+    policy = ResourcePolicy(categories=("fonts", "chat"), deny=["*example-tracker.com*"], allow=["*.woff2"])
+    assert "*.woff2" not in policy.patterns
+    assert "*.woff" in policy.patterns
+    assert "*://*.intercom.io/*" in policy.patterns
+    assert "*example-tracker.com*" in policy.patterns
+    assert not any(p in policy.patterns for p in BLOCK_CATEGORIES["images"])
+
+
+def test_patterns_anchored_on_host():
+    """Vendor patterns match the vendor's hosts, not URLs that merely mention them"""
+    blocked = compile_patterns(ResourcePolicy().patterns).fullmatch
+
+    assert blocked("https://cdn.heap.io/heap.js")
+    assert blocked("https://heap.io/")
+    assert blocked("https://www.youtube.com/embed/abc")
+    assert not blocked("https://orbit.example/blog/heap.io-review")
+    assert not blocked("https://orbit.example/?utm_source=segment.com")
+    assert not blocked("https://notheap.io/")
+    assert not blocked("https://www.youtube.com/@orbit")
+
+
+def test_question_mark_is_literal():
+    """As in Chrome, only '*' is a wildcard; a '?' in a pattern matches a literal query string"""
+    blocked = compile_patterns(["*://orbit.example/track?id=*", "*.png?*"]).fullmatch
+    assert blocked("https://orbit.example/track?id=7")
+    assert not blocked("https://orbit.example/trackXid=7")
+    assert blocked("https://cdn.orbit.example/logo.PNG?v=2")
+    assert not blocked("https://orbit.example/logo.pngs/index")
+    assert not compile_patterns([]).fullmatch("https://orbit.example/")
+
+
+def test_baseline_sampling_and_savings():
+    """Every Nth page loads unblocked, and savings are estimated from the difference"""
+    policy = ResourcePolicy(baseline_every=3)
+    driver = FakeDriver()
+    policy.apply(driver)
+    for n in range(6):
+        policy.get(driver, f"https://maker{n}.example/")
+    assert [blocked for _, blocked in driver.loads] == [False, True, True, False, True, True]
+    assert driver.blocked == policy.patterns  # Blocking restored after each baseline page
+    assert policy.stats["baseline"]["pages"] == 2 and policy.stats["blocked"]["pages"] == 4
+    saved_bytes, _ = policy.savings()
+    assert saved_bytes == 4 * 800_000
+
+
+def test_blocked_page_itself_is_loaded():
+    """A page whose own URL matches the block list is loaded with blocking lifted"""
+    policy = ResourcePolicy()
+    driver = FakeDriver()
+    policy.apply(driver)
+    policy.get(driver, "https://www.hotjar.com/")
+    assert driver.loads == [("https://www.hotjar.com/", False)]
+    assert driver.blocked == policy.patterns
+    assert policy.savings() is None
+
+
+def main():
+    """Run all tests"""
+    print("Resource Policy Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_allow_and_deny_lists,
+        test_patterns_anchored_on_host,
+        test_question_mark_is_literal,
+        test_baseline_sampling_and_savings,
+        test_blocked_page_itself_is_loaded,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Tests for the scraper's HTTP fast paths, using fake drivers instead of Chrome
+"""
+
+import os
+import sys
+import socket
+import logging
+import tempfile
+import threading
+import requests
+from contextlib import contextmanager
+from producthunt_scraper import ProductHuntScraper
+from http_fetcher import HttpFetcher, unreachable_reason
+from domain_cache import DomainCache
+from link_classifier import LinkClassifier
+from profile_pool import FirstPageStats
+from rate_limiter import HostRateLimiter
+
+CLEARANCE = {"name": "cf_clearance", "value": "ok", "domain": ".producthunt.com", "path": "/"}
+
+
+class FakeDriver:
+    """Homepage driver that has passed the bot check"""
+
+    title = "Product Hunt"
+    page_source = "<html></html>"
+
+    def get(self, url):
+        pass
+
+    def get_cookies(self):
+        return [CLEARANCE]
+
+    def execute_script(self, script, *args):
+        return "FakeChrome/1.0"
+
+
+class FakeWaits:
+    def wait_until_ready(self, driver, selector=None, timeout=None):
+        return True
+
+    def find_optional(self, driver, by, selector):
+        return None
+
+    def find_required(self, driver, by, selector, timeout=None):
+        raise TimeoutError(selector)
+
+    def wait_for_dom_quiet(self, driver, timeout=None):
+        return True
+
+
+def make_scraper():
+    scraper = object.__new__(ProductHuntScraper)
+    scraper.logger = logging.getLogger("test")
+    scraper.driver = FakeDriver()
+    scraper.today_url = "https://www.producthunt.com"
+    scraper.rate_limiter = HostRateLimiter({}, default_rate=100.0, default_burst=100)
+    scraper.first_page_stats = FirstPageStats()
+    scraper.homepage_profile_reused = False
+    scraper.waits = FakeWaits()
+    scraper.ph_http = HttpFetcher()
+    scraper.link_classifier = LinkClassifier()
+    return scraper
+
+
+def test_session_shared_before_first_product():
+    """Product page workers get the homepage's clearance cookies before the first product is emitted"""
+    scraper = make_scraper()
+    seen = []
+
+    def emit():
+        seen.append(dict(scraper.ph_http.session.cookies))
+        yield {"url": "https://www.producthunt.com/posts/orbit"}
+
+    scraper._scroll_and_emit_products = emit
+    listing = scraper._browser_listing()
+    assert scraper.ph_http.session.cookies.get("cf_clearance") == "ok"
+    assert scraper.ph_http.session.headers["User-Agent"] == "FakeChrome/1.0"
+    next(listing)
+    assert seen == [{"cf_clearance": "ok"}]
+
+
+class FakeConcurrency:
+    def __init__(self):
+        self.blocks = []
+
+    def record_block(self, reason):
+        self.blocks.append(reason)
+
+
+class FakeFetcher:
+    def __init__(self, page):
+        self.page = page
+
+    def fetch(self, url):
+        return self.page
+
+
+def test_product_page_blocks_shrink_concurrency():
+    """403, 503 and bot challenges on the HTTP product page path count as blocks; a 404 does not"""
+    scraper = make_scraper()
+    scraper.concurrency = FakeConcurrency()
+    pages = [
+        ({"status": 403, "html": ""}, "HTTP 403"),
+        ({"status": 503, "html": ""}, "HTTP 503"),
+        ({"status": 200, "html": "<title>Just a moment...</title>"}, "bot challenge"),
+        ({"status": 404, "html": ""}, "HTTP 404"),
+    ]
+    for page, reason in pages:
+        scraper.ph_http = FakeFetcher(page)
+        assert scraper._fetch_product_page_http("https://www.producthunt.com/posts/orbit")[2] == reason
+    assert scraper.concurrency.blocks == ["HTTP 403 on product page", "HTTP 503 on product page", "bot challenge on product page"]
+
+
+def test_rate_limit_waits_outside_lease():
+    """A browser product page fetch waits for the host's token before leasing a driver"""
+    scraper = make_scraper()
+    scraper.concurrency = FakeConcurrency()
+    calls = []
+
+    class Limiter:
+        def acquire(self, url):
+            calls.append("acquire")
+
+    class Pool:
+        @contextmanager
+        def lease(self):
+            calls.append("lease")
+            yield FakeDriver()
+
+        def get(self, driver, url):
+            pass
+
+    scraper.rate_limiter = Limiter()
+    scraper.browser_pool = Pool()
+    scraper._harvest_links = lambda driver: {"hrefs": [], "text": ""}
+    scraper._get_product_page_in_browser("https://www.producthunt.com/posts/orbit", {})
+    assert calls == ["acquire", "lease"], calls
+
+
+def test_unreachable_reason():
+    """Only unknown hosts and refused connections count as definitely unreachable"""
+    try:
+        requests.get("http://127.0.0.1:1/", timeout=2)
+    except requests.RequestException as e:
+        assert unreachable_reason(e) == "refused"
+    nxdomain = requests.ConnectionError(socket.gaierror(socket.EAI_NONAME, "Name or service not known"))
+    assert unreachable_reason(nxdomain) == "dns"
+    assert unreachable_reason(requests.ConnectionError(socket.gaierror(socket.EAI_AGAIN, "Temporary failure"))) == ""
+    assert unreachable_reason(requests.ConnectTimeout("timed out")) == ""
+    assert unreachable_reason(requests.exceptions.SSLError("bad certificate")) == ""
+
+
+def test_domain_cache_only_stores_definite_results():
+    """Sites are cached as dead only when unreachable; temporary failures are not cached at all"""
+    scraper = make_scraper()
+    scraper.domain_cache = DomainCache(os.path.join(tempfile.mkdtemp(), "domains.sqlite3"))
+    outcomes = {
+        "https://gone.io/": {"path": "unreachable", "http_status": None, "unreachable": "dns", "hrefs": 0},
+        "https://slow.io/": {"path": "browser", "http_status": None, "unreachable": "", "hrefs": 0},
+        "https://crashed.io/": {"path": "failed", "http_status": 503, "hrefs": 0},
+        "https://missing.io/": {"path": "http", "http_status": 404, "hrefs": 3},
+        "https://orbit.io/": {"path": "http", "http_status": 200, "hrefs": 12},
+    }
+
+    def fetch(url, meta):
+        meta.update(outcomes[url], final_url=url)
+        return {"site_x": "https://x.com/orbit" if url == "https://orbit.io/" else ""}
+
+    scraper._get_links_from_external_website = fetch
+    for url in outcomes:
+        scraper._get_website_links(url)
+    cache = scraper.domain_cache
+    assert cache.get("https://gone.io/")[0] == "dead"
+    assert cache.get("https://orbit.io/")[0] == "ok"
+    for url in ("https://slow.io/", "https://crashed.io/", "https://missing.io/"):
+        assert cache.get(url) is None, url
+
+
+class UnreachableFetcher:
+    """HTTP fetcher whose scans fail the way a host with no DNS record does"""
+
+    def scan(self, url, parser, meta=None):
+        meta["unreachable"] = "dns"
+        return None
+
+
+def test_unreachable_site_skips_browser():
+    """A host with no DNS record is cached as dead without leasing a browser"""
+    scraper = make_scraper()
+    scraper.http_fetcher = UnreachableFetcher()
+    scraper.concurrency = FakeConcurrency()
+    scraper.website_fetch_stats = {"http": 0, "browser": 0, "failed": 0}
+    scraper.stats_lock = threading.Lock()
+    scraper.contact_crawler = None
+    scraper.domain_cache = DomainCache(os.path.join(tempfile.mkdtemp(), "domains.sqlite3"))
+
+    class NoBrowsers:
+        def lease(self):
+            raise AssertionError("leased a browser for an unreachable site")
+
+    scraper.browser_pool = NoBrowsers()
+    meta = {}
+    assert not any(scraper._get_website_links("https://gone.io/", meta).values())
+    assert meta["path"] == "unreachable"
+    assert scraper.domain_cache.get("https://gone.io/")[0] == "dead"
+    assert scraper.website_fetch_stats["failed"] == 1
+    meta = {}
+    scraper._get_website_links("https://gone.io/", meta)
+    assert meta["path"] == "cache"
+
+
+def main():
+    """Run all tests"""
+    print("Scraper Fast Path Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_session_shared_before_first_product,
+        test_product_page_blocks_shrink_concurrency,
+        test_rate_limit_waits_outside_lease,
+        test_unreachable_reason,
+        test_domain_cache_only_stores_definite_results,
+        test_unreachable_site_skips_browser,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
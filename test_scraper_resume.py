@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the scraper's enrichment pipeline and resume from the product store,
+using the API listing with fake page fetches and a fake webhook, no browser needed.
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime
+import producthunt_scraper
+from producthunt_scraper import ProductHuntScraper
+from wait_policy import PolitenessPolicy
+
+
+class FakeWebhook:
+    """Stands in for the requests module in producthunt_scraper, recording webhook posts"""
+
+    def __init__(self):
+        self.posted = []
+
+    def post(self, url, json=None, timeout=None):
+        self.posted.append(json)
+        return self
+
+    status_code = 200
+
+
+def make_scraper(store_path, listing, website=None):
+    scraper = ProductHuntScraper(source="api", resource_policy=False, store_path=store_path)
+    scraper.politeness = PolitenessPolicy(0, 0)
+    scraper._api_listing = lambda: iter(scraper._new_product_records(listing, set(), datetime.now()))
+
+    def product_page(url, meta):
+        meta["path"] = "http"
+        return {"website_url": "https://orbit.io/?ref=producthunt", "ph_x": "https://x.com/orbit"}
+
+    def website_links(url, meta):
+        meta.update(website or {"path": "http"})
+        return {"site_email": "hi@orbit.io"} if meta["path"] != "failed" else {}
+
+    scraper._get_links_from_product_page_separate_driver = product_page
+    scraper._get_website_links = website_links
+    return scraper
+
+
+def run(scraper):
+    webhook = FakeWebhook()
+    producthunt_scraper.requests = webhook
+    try:
+        scraper.get_todays_products()
+    finally:
+        producthunt_scraper.requests = sys.modules["requests"]
+        scraper.close()
+    return webhook.posted
+
+
+LISTING = [{"name": "Orbit", "url": "https://www.producthunt.com/posts/orbit", "post_id": "901", "topics": ["AI"]}]
+
+
+def test_listing_records_are_enriched_and_delivered():
+    """Read-only listing records pass every stage and are stored and delivered"""
+    store_path = os.path.join(tempfile.mkdtemp(), "products.sqlite3")
+    scraper = make_scraper(store_path, LISTING)
+    posted = run(scraper)
+    assert [p["url"] for p in posted] == ["https://www.producthunt.com/posts/orbit"]
+    assert posted[0]["email"] == "hi@orbit.io" and posted[0]["x"] == "https://x.com/orbit"
+    assert [p["name"] for p in scraper.products] == ["Orbit"]
+    assert scraper.products[0]["topics"] == ["AI"]
+
+
+def test_failed_stage_retried_without_redelivery():
+    """A delivered product with a failed website stage is retried, but only re-sent when something new is found"""
+    store_path = os.path.join(tempfile.mkdtemp(), "products.sqlite3")
+    failed = {"path": "failed"}
+    assert len(run(make_scraper(store_path, LISTING, website=failed))) == 1
+    assert run(make_scraper(store_path, LISTING, website=failed)) == []
+    posted = run(make_scraper(store_path, LISTING))
+    assert [p["email"] for p in posted] == ["hi@orbit.io"]
+    assert run(make_scraper(store_path, LISTING)) == []
+
+
+def test_politeness_pause_holds_no_slot():
+    """The politeness pause before a product page happens before its concurrency slot is taken"""
+    store_path = os.path.join(tempfile.mkdtemp(), "products.sqlite3")
+    scraper = make_scraper(store_path, LISTING)
+    active_during_pause = []
+
+    class Politeness(PolitenessPolicy):
+        def pause(self):
+            active_during_pause.append(scraper.concurrency.active)
+            return 0
+
+    scraper.politeness = Politeness(0, 0)
+    run(scraper)
+    assert active_during_pause == [0]
+
+
+def test_store_opened_on_first_run():
+    """Constructing the scraper does not create the product store file"""
+    store_path = os.path.join(tempfile.mkdtemp(), "products.sqlite3")
+    scraper = make_scraper(store_path, LISTING)
+    assert not os.path.exists(store_path)
+    run(scraper)
+    assert os.path.exists(store_path)
+
+
+def main():
+    """Run all tests"""
+    print("Scraper Resume Test Suite")
+    print("=" * 40)
+
+    tests = [
+        test_listing_records_are_enriched_and_delivered,
+        test_failed_stage_retried_without_redelivery,
+        test_politeness_pause_holds_no_slot,
+        test_store_opened_on_first_run,
+    ]
+
+    passed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__doc__}")
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__doc__}: {e!r}")
+
+    print("=" * 40)
+    print(f"Tests passed: {passed}/{len(tests)}")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
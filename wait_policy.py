@@ -0,0 +1,193 @@
+import time
+import json
+import random
+import logging
+import threading
+from selenium.webdriver.support.wait import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
+
+logger = logging.getLogger(__name__)
+
+# Resolves once the DOM has gone quiet_ms without a mutation, or false when timeout_ms passes first
+DOM_QUIET_JS = r"""
+const [quietMs, timeoutMs, done] = arguments;
+const start = performance.now();
+let last = start;
+const observer = new MutationObserver(() => { last = performance.now(); });
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+(function check() {
+    const now = performance.now();
+    if (now - last >= quietMs || now - start >= timeoutMs) {
+        observer.disconnect();
+        done(now - last >= quietMs);
+    } else {
+        setTimeout(check, 50);
+    }
+})();
+"""
+
+
+class WaitPolicy:
+    """Explicit element lookups with per-selector wait accounting.
+
+    Drivers run with implicitly_wait(0), so optional lookups return immediately when
+    the element is absent instead of blocking for the implicit timeout. Only required
+    elements get a bounded explicit wait. Page readiness is detected from concrete
+    signals (selector present, network idle, DOM quiescence) rather than fixed sleeps.
+    """
+
+    def __init__(self, required_timeout=10, poll_frequency=0.25):
+        self.required_timeout = required_timeout
+        self.poll_frequency = poll_frequency
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def _record(self, selector, elapsed, found):
+        """Add one lookup to the per-selector counters"""
+        with self._lock:
+            entry = self.stats.setdefault(selector, {"lookups": 0, "misses": 0, "seconds": 0.0})
+            entry["lookups"] += 1
+            entry["seconds"] += elapsed
+            if not found:
+                entry["misses"] += 1
+
+    def find_optional(self, context, by, selector):
+        """Return the first matching element under context, or None without waiting"""
+        start = time.perf_counter()
+        elements = context.find_elements(by, selector)
+        self._record(selector, time.perf_counter() - start, bool(elements))
+        return elements[0] if elements else None
+
+    def find_all(self, context, by, selector):
+        """Return all matching elements under context without waiting"""
+        start = time.perf_counter()
+        elements = context.find_elements(by, selector)
+        self._record(selector, time.perf_counter() - start, bool(elements))
+        return elements
+
+    def find_required(self, context, by, selector, timeout=None):
+        """Wait up to timeout seconds for a required element; raises TimeoutException if absent"""
+        start = time.perf_counter()
+        try:
+            element = WebDriverWait(context, timeout or self.required_timeout, poll_frequency=self.poll_frequency).until(
+                EC.presence_of_element_located((by, selector))
+            )
+        except TimeoutException:
+            self._record(selector, time.perf_counter() - start, False)
+            raise
+        self._record(selector, time.perf_counter() - start, True)
+        return element
+
+    def wait_for_dom_quiet(self, driver, quiet_time=0.5, timeout=10):
+        """Wait until the DOM has had no mutations for quiet_time seconds, up to timeout"""
+        start = time.perf_counter()
+        quiet = False
+        try:
+            driver.set_script_timeout(timeout + 5)
+            quiet = bool(driver.execute_async_script(DOM_QUIET_JS, int(quiet_time * 1000), int(timeout * 1000)))
+        except Exception as e:
+            logger.debug(f"DOM quiescence wait failed: {e}")
+        self._record("dom quiet", time.perf_counter() - start, quiet)
+        return quiet
+
+    def wait_for_network_idle(self, driver, idle_time=0.5, timeout=10, max_inflight=2, on_event=None):
+        """Wait until at most max_inflight requests are pending for idle_time seconds, up to timeout.
+
+        Request lifecycles come from the CDP performance log (goog:loggingPrefs). Every
+        Network.* event read is also passed to on_event(method, params) if given. Drivers
+        without the performance log fall back to watching Resource Timing entries.
+        """
+        start = time.perf_counter()
+        last_activity = start
+        in_flight = set()
+        idle = False
+        try:
+            while True:
+                now = time.perf_counter()
+                for entry in driver.get_log("performance"):
+                    message = json.loads(entry["message"])["message"]
+                    method = message.get("method", "")
+                    params = message.get("params", {})
+                    if method == "Network.requestWillBeSent":
+                        in_flight.add(params.get("requestId"))
+                        last_activity = now
+                    elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                        in_flight.discard(params.get("requestId"))
+                        last_activity = now
+                    if on_event and method.startswith("Network."):
+                        on_event(method, params)
+                if len(in_flight) <= max_inflight and now - last_activity >= idle_time:
+                    idle = True
+                    break
+                if now - start >= timeout:
+                    break
+                time.sleep(0.1)
+        except Exception as e:
+            logger.debug(f"Performance log unavailable, using resource timing: {e}")
+            idle = self._wait_for_resource_quiet(driver, idle_time, timeout - (time.perf_counter() - start))
+        self._record("network idle", time.perf_counter() - start, idle)
+        return idle
+
+    def _wait_for_resource_quiet(self, driver, idle_time, timeout):
+        """Fallback network idle: wait until no new Resource Timing entries appear for idle_time seconds"""
+        start = time.perf_counter()
+        last_count = -1
+        last_change = start
+        while time.perf_counter() - start < timeout:
+            try:
+                count = driver.execute_script("return document.readyState === 'complete' ? performance.getEntriesByType('resource').length : -1")
+            except Exception:
+                return False
+            now = time.perf_counter()
+            if count != last_count or count < 0:
+                last_count = count
+                last_change = now
+            elif now - last_change >= idle_time:
+                return True
+            time.sleep(0.1)
+        return False
+
+    def wait_until_ready(self, driver, selector=None, timeout=10, by=By.CSS_SELECTOR):
+        """Wait for a target selector (if given), then network idle and DOM quiescence, all within one timeout ceiling"""
+        deadline = time.perf_counter() + timeout
+        if selector:
+            try:
+                self.find_required(driver, by, selector, timeout=timeout)
+            except TimeoutException:
+                return False
+        remaining = max(0.1, deadline - time.perf_counter())
+        network_idle = self.wait_for_network_idle(driver, timeout=remaining)
+        remaining = max(0.1, deadline - time.perf_counter())
+        return self.wait_for_dom_quiet(driver, timeout=remaining) and network_idle
+
+    def log_report(self, top=10):
+        """Log the selectors that consumed the most wall-clock time"""
+        with self._lock:
+            entries = sorted(self.stats.items(), key=lambda item: item[1]["seconds"], reverse=True)[:top]
+        for selector, entry in entries:
+            logger.info(f"Wait time {entry['seconds']:.1f}s over {entry['lookups']} lookups ({entry['misses']} misses): {selector}")
+
+
+class PolitenessPolicy:
+    """Deliberate random delay between page visits.
+
+    Kept separate from readiness waits: pages are considered loaded as soon as they are
+    ready, and this jitter exists only to keep request timing polite and less robotic.
+    """
+
+    def __init__(self, min_delay=1.0, max_delay=3.0):
+        self.min_delay = min_delay
+        self.max_delay = max(min_delay, max_delay)
+        self.total_delay = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self):
+        """Sleep for a random delay within the configured range and return it"""
+        delay = random.uniform(self.min_delay, self.max_delay) if self.max_delay > 0 else 0
+        if delay:
+            time.sleep(delay)
+            with self._lock:
+                self.total_delay += delay
+        return delay